@@ -0,0 +1,202 @@
+"""Minimal in-process MQTT 3.1.1 broker for the end-to-end benchmarks."""
+
+import asyncio
+import struct
+import time
+from asyncio import StreamReader
+from asyncio import StreamWriter
+from typing import Callable
+from typing import Dict
+from typing import Final
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+CONNECT: Final[int] = 1
+CONNACK: Final[int] = 2
+PUBLISH: Final[int] = 3
+PUBACK: Final[int] = 4
+SUBSCRIBE: Final[int] = 8
+SUBACK: Final[int] = 9
+UNSUBSCRIBE: Final[int] = 10
+UNSUBACK: Final[int] = 11
+PINGREQ: Final[int] = 12
+PINGRESP: Final[int] = 13
+DISCONNECT: Final[int] = 14
+
+
+def encode_packet(packet_type: int, flags: int, body: bytes) -> bytes:
+    """Encode an MQTT packet with fixed header and remaining length."""
+    remaining_length: bytearray = bytearray()
+    length: int = len(body)
+
+    while True:
+        length, digit = divmod(length, 128)
+        remaining_length.append(digit | 0x80 if length else digit)
+
+        if not length:
+            break
+
+    return bytes([packet_type << 4 | flags]) + remaining_length + body
+
+
+def encode_string(value: str) -> bytes:
+    """Encode a length-prefixed UTF-8 string."""
+    encoded: bytes = value.encode()
+    return struct.pack(">H", len(encoded)) + encoded
+
+
+def decode_string(data: bytes, offset: int) -> Tuple[str, int]:
+    """Decode a length-prefixed UTF-8 string and return it with the next offset."""
+    length: int = struct.unpack_from(">H", data, offset)[0]
+    return data[offset + 2 : offset + 2 + length].decode(), offset + 2 + length
+
+
+def topic_matches(topic_filter: str, topic: str) -> bool:
+    """Match a topic against a topic filter with ``+`` and ``#`` wildcards."""
+    filter_levels: List[str] = topic_filter.split("/")
+    topic_levels: List[str] = topic.split("/")
+
+    for index, filter_level in enumerate(filter_levels):
+        if filter_level == "#":
+            return True
+
+        if index >= len(topic_levels) or filter_level not in {"+", topic_levels[index]}:
+            return False
+
+    return len(filter_levels) == len(topic_levels)
+
+
+class MqttBroker:
+    """Forward published messages to all subscribers with QoS 0.
+
+    Attributes
+    ----------
+    on_publish: Callable, optional
+        Called with the receive time, topic and payload for every message published by a client.
+    published: int
+        The number of messages published by clients.
+    """
+
+    def __init__(self, on_publish: Optional[Callable[[float, str, bytes], None]] = None) -> None:
+        self.on_publish: Optional[Callable[[float, str, bytes], None]] = on_publish
+        self.published: int = 0
+
+        self._subscriptions: Dict[StreamWriter, Set[str]] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = "127.0.0.1") -> int:
+        """Start the broker on a free port and return the port."""
+        self._server = await asyncio.start_server(self._handle_client, host, 0)
+        port: int = self._server.sockets[0].getsockname()[1]
+        return port
+
+    async def stop(self) -> None:
+        """Close all client connections and stop the broker."""
+        for writer in list(self._subscriptions):
+            writer.close()
+
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def is_subscribed(self, topic: str) -> bool:
+        """Return whether any client subscribed to the topic."""
+        return any(
+            topic_matches(topic_filter, topic)
+            for topic_filters in self._subscriptions.values()
+            for topic_filter in topic_filters
+        )
+
+    def publish(self, topic: str, payload: bytes) -> None:
+        """Publish a message to all subscribers of the topic."""
+        packet: bytes = encode_packet(PUBLISH, 0, encode_string(topic) + payload)
+
+        for writer, topic_filters in self._subscriptions.items():
+            if any(topic_matches(topic_filter, topic) for topic_filter in topic_filters):
+                writer.write(packet)
+
+    async def _handle_client(self, reader: StreamReader, writer: StreamWriter) -> None:
+        self._subscriptions[writer] = set()
+
+        try:
+            while packet := await self._read_packet(reader):
+                if not self._handle_packet(writer, *packet):
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            ...
+        finally:
+            del self._subscriptions[writer]
+            writer.close()
+
+    @staticmethod
+    async def _read_packet(reader: StreamReader) -> Optional[Tuple[int, int, bytes]]:
+        header: bytes = await reader.read(1)
+
+        if not header:
+            return None
+
+        length: int = 0
+        multiplier: int = 1
+
+        while True:
+            digit: int = (await reader.readexactly(1))[0]
+            length += (digit & 0x7F) * multiplier
+            multiplier *= 128
+
+            if not digit & 0x80:
+                break
+
+        return header[0] >> 4, header[0] & 0x0F, await reader.readexactly(length)
+
+    def _handle_packet(self, writer: StreamWriter, packet_type: int, flags: int, body: bytes) -> bool:
+        if packet_type == CONNECT:
+            writer.write(encode_packet(CONNACK, 0, b"\x00\x00"))
+        elif packet_type == PUBLISH:
+            self._handle_publish(writer, flags, body)
+        elif packet_type == SUBSCRIBE:
+            self._handle_subscribe(writer, body)
+        elif packet_type == UNSUBSCRIBE:
+            self._handle_unsubscribe(writer, body)
+        elif packet_type == PINGREQ:
+            writer.write(encode_packet(PINGRESP, 0, b""))
+
+        return packet_type != DISCONNECT
+
+    def _handle_publish(self, writer: StreamWriter, flags: int, body: bytes) -> None:
+        received: float = time.perf_counter()
+        topic, offset = decode_string(body, 0)
+
+        # Clients only publish with QoS 0 or 1.
+        if flags >> 1 & 0x03:
+            writer.write(encode_packet(PUBACK, 0, body[offset : offset + 2]))
+            offset += 2
+
+        self.published += 1
+
+        if self.on_publish:
+            self.on_publish(received, topic, body[offset:])
+
+        self.publish(topic, body[offset:])
+
+    def _handle_subscribe(self, writer: StreamWriter, body: bytes) -> None:
+        offset: int = 2
+        granted: bytearray = bytearray()
+
+        while offset < len(body):
+            topic_filter, offset = decode_string(body, offset)
+            self._subscriptions[writer].add(topic_filter)
+            granted.append(0)
+            offset += 1
+
+        writer.write(encode_packet(SUBACK, 0, body[:2] + granted))
+
+    def _handle_unsubscribe(self, writer: StreamWriter, body: bytes) -> None:
+        offset: int = 2
+
+        while offset < len(body):
+            topic_filter, offset = decode_string(body, offset)
+            self._subscriptions[writer].discard(topic_filter)
+
+        writer.write(encode_packet(UNSUBACK, 0, body[:2]))
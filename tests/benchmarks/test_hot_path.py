@@ -0,0 +1,297 @@
+"""Micro-benchmarks for the code that runs on every scan or on every MQTT message.
+
+Every benchmark is parametrized by the installation size from one board up to three boards with 30 meters and
+40 covers. All sizes use the L203 hardware definition and scale the number of boards that answer the Modbus reads.
+"""
+
+import json
+import time
+from asyncio import AbstractEventLoop
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Set
+from typing import Union
+from unittest.mock import MagicMock
+
+import pytest
+from _pytest.fixtures import SubRequest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from unipi_control.config import Config
+from unipi_control.config import HardwareType
+from unipi_control.events import EventBus
+from unipi_control.features.extensions import EastronMeter
+from unipi_control.features.extensions import MeterDecoder
+from unipi_control.features.neuron import DigitalInput
+from unipi_control.features.neuron import DigitalOutput
+from unipi_control.features.neuron import Led
+from unipi_control.features.neuron import NeuronFeature
+from unipi_control.features.neuron import Relay
+from unipi_control.helpers.typing import ModbusClient
+from unipi_control.integrations.covers import Cover
+from unipi_control.integrations.covers import CoverSettings
+from unipi_control.integrations.covers import CoverState
+from unipi_control.mqtt.discovery.binary_sensors import HassBinarySensorsDiscovery
+from unipi_control.mqtt.discovery.covers import HassCoversDiscovery
+from unipi_control.mqtt.discovery.sensors import HassSensorsDiscovery
+from unipi_control.mqtt.discovery.switches import HassSwitchesDiscoveryMixin
+from unipi_control.neuron import Neuron
+from unipi_control.tools.simulator import write_eeprom
+
+HARDWARE_DIR: Path = Path(__file__).parents[2] / "data/opkg/data/usr/local/etc/unipi/hardware"
+MODEL: str = "L203"
+
+
+class InstallationSize(NamedTuple):
+    boards: int
+    meters: int
+    covers: int
+
+
+class Installation(NamedTuple):
+    neuron: Neuron
+    covers: List[Cover]
+
+
+INSTALLATION_SIZES: Dict[str, InstallationSize] = {
+    "small": InstallationSize(boards=1, meters=1, covers=1),
+    "medium": InstallationSize(boards=2, meters=10, covers=16),
+    "large": InstallationSize(boards=3, meters=30, covers=40),
+}
+
+
+class FakeModbusResponse:
+    def __init__(self, registers: List[int], error: bool = False) -> None:
+        self.registers: List[int] = registers
+        self.error: bool = error
+
+    def isError(self) -> bool:  # noqa: N802
+        """Return whether the response is an exception response."""
+        return self.error
+
+
+class FakeModbusClient:
+    """Answer the reads of the given slaves with registers that change on every read."""
+
+    def __init__(self, slaves: Iterable[int]) -> None:
+        self.slaves: Set[int] = set(slaves)
+        self.reads: int = 0
+
+    async def read_input_registers(self, address: int, count: int, slave: int) -> FakeModbusResponse:  # noqa: ARG002
+        """Read input registers."""
+        self.reads += 1
+        return FakeModbusResponse([self.reads & 0xFFFF] * count, error=slave not in self.slaves)
+
+    async def read_holding_registers(self, address: int, count: int, slave: int) -> FakeModbusResponse:
+        """Read holding registers."""
+        return await self.read_input_registers(address, count, slave)
+
+
+def create_config(config_dir: Path, installation_size: InstallationSize) -> Config:
+    """Write a configuration with Eastron SDM120M meters on the units 1 to n."""
+    (config_dir / "hardware").symlink_to(HARDWARE_DIR)
+    write_eeprom(config_dir / "sys_bus", MODEL)
+
+    unipi_tmp_dir: Path = config_dir / "unipi"
+    unipi_tmp_dir.mkdir()
+
+    # JSON is valid YAML.
+    (config_dir / "control.yaml").write_text(
+        json.dumps(
+            {
+                "device_info": {"name": "Benchmark"},
+                "modbus_serial": {
+                    "baud_rate": 115200,
+                    "scan_budget": 10,
+                    "units": [
+                        {"unit": unit, "device_name": f"Meter {unit}", "identifier": "Eastron_SDM120M"}
+                        for unit in range(1, installation_size.meters + 1)
+                    ],
+                },
+                "sys_bus_dir": (config_dir / "sys_bus").as_posix(),
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    return Config(config_base_dir=config_dir, unipi_tmp_dir=unipi_tmp_dir)
+
+
+def create_covers(config: Config, neuron: Neuron, count: int) -> List[Cover]:
+    """Create covers for the outputs of the Unipi Neuron.
+
+    The covers share the outputs if there are more covers than output pairs. The benchmarks never switch them.
+    """
+    outputs: List[Union[DigitalInput, DigitalOutput, Led, Relay, EastronMeter]] = list(
+        neuron.features.by_feature_types(["DO", "RO"])
+    )
+    covers: List[Cover] = []
+    events: EventBus = EventBus()
+
+    for index in range(count):
+        cover_up: Union[DigitalInput, DigitalOutput, Led, Relay, EastronMeter] = outputs[2 * index % len(outputs)]
+        cover_down: Union[DigitalInput, DigitalOutput, Led, Relay, EastronMeter] = outputs[
+            (2 * index + 1) % len(outputs)
+        ]
+
+        assert isinstance(cover_up, (DigitalOutput, Relay))
+        assert isinstance(cover_down, (DigitalOutput, Relay))
+
+        covers.append(
+            Cover(
+                config=config,
+                settings=CoverSettings(
+                    object_id=f"cover_{index + 1}",
+                    friendly_name=f"Cover {index + 1}",
+                    suggested_area="",
+                    device_class="blind" if index % 2 else "shutter",
+                    cover_run_time=30.0,
+                    tilt_change_time=1.5,
+                    position_update_interval=1.0,
+                    cover_up=cover_up.feature_id,
+                    cover_down=cover_down.feature_id,
+                    cover_up_feature=cover_up,
+                    cover_down_feature=cover_down,
+                ),
+                events=events,
+            )
+        )
+
+    return covers
+
+
+@pytest.fixture(name="installation", params=list(INSTALLATION_SIZES))
+def create_installation(request: SubRequest, event_loop: AbstractEventLoop, tmp_path: Path) -> Installation:
+    """Initialize an Unipi Neuron with meters and covers and a fake modbus client."""
+    installation_size: InstallationSize = INSTALLATION_SIZES[request.param]
+    config: Config = create_config(tmp_path, installation_size)
+    neuron: Neuron = Neuron(
+        config=config,
+        modbus_client=ModbusClient(
+            tcp=FakeModbusClient(slaves=range(installation_size.boards + 1)),  # type: ignore[arg-type]
+            serial=FakeModbusClient(slaves=range(1, installation_size.meters + 1)),  # type: ignore[arg-type]
+        ),
+    )
+    event_loop.run_until_complete(neuron.init())
+
+    return Installation(neuron=neuron, covers=create_covers(config, neuron, installation_size.covers))
+
+
+def neuron_features(installation: Installation) -> List[NeuronFeature]:
+    """Return all digital inputs, digital outputs, relays and LEDs."""
+    return list(installation.neuron.features.by_feature_types(["DI", "DO", "RO", "LED"]))  # type: ignore[arg-type]
+
+
+def meters(installation: Installation) -> List[EastronMeter]:
+    """Return all meter features."""
+    return list(installation.neuron.features.by_feature_types(["METER"]))  # type: ignore[arg-type]
+
+
+class TestBenchmarkModbusCacheData:
+    def test_get_register(self, benchmark: BenchmarkFixture, installation: Installation) -> None:
+        """Benchmark reading the value registers of all features from the cache."""
+        addresses: List[Any] = [(feature.modbus.val_reg, 0) for feature in neuron_features(installation)] + [
+            (feature.modbus.val_reg, feature.hardware.definition.unit) for feature in meters(installation)
+        ]
+
+        def get_registers() -> None:
+            for address, unit in addresses:
+                installation.neuron.modbus_cache_data.get_register(address=address, index=1, unit=unit)
+
+        benchmark(get_registers)
+
+    def test_scan(self, benchmark: BenchmarkFixture, event_loop: AbstractEventLoop, installation: Installation) -> None:
+        """Benchmark a Modbus TCP scan where every register changes."""
+
+        def scan() -> int:
+            return len(
+                event_loop.run_until_complete(
+                    installation.neuron.modbus_cache_data.scan("tcp", hardware_types=[HardwareType.NEURON])
+                )
+            )
+
+        assert benchmark(scan) > 0
+
+
+class TestBenchmarkFeatures:
+    def test_changed(self, benchmark: BenchmarkFixture, installation: Installation) -> None:
+        """Benchmark the change detection of all Unipi Neuron features."""
+        features: List[NeuronFeature] = neuron_features(installation)
+
+        benchmark(lambda: [feature.changed for feature in features])
+
+    def test_payload(self, benchmark: BenchmarkFixture, installation: Installation) -> None:
+        """Benchmark the MQTT payload of all Unipi Neuron features."""
+        features: List[NeuronFeature] = neuron_features(installation)
+
+        benchmark(lambda: [feature.payload for feature in features])
+
+    def test_meter_value(self, benchmark: BenchmarkFixture, installation: Installation) -> None:
+        """Benchmark decoding the values of all meters."""
+        features: List[EastronMeter] = meters(installation)
+
+        assert all(value is not None for value in benchmark(lambda: [feature.value for feature in features]))
+
+    def test_meter_decode(self, benchmark: BenchmarkFixture, installation: Installation) -> None:
+        """Benchmark decoding the registers of all meters after a scan changed them."""
+        decoders: List[MeterDecoder] = list({feature.modbus.decoder: None for feature in meters(installation)})
+
+        benchmark(lambda: [decoder._decode() for decoder in decoders])  # noqa: SLF001
+
+
+class TestBenchmarkFeatureMap:
+    def test_by_feature_types(self, benchmark: BenchmarkFixture, installation: Installation) -> None:
+        """Benchmark filtering the published features of a scan by feature type."""
+        benchmark(lambda: list(installation.neuron.features.by_feature_types(["DI", "DO", "RO", "METER"])))
+
+    def test_by_feature_id(self, benchmark: BenchmarkFixture, installation: Installation) -> None:
+        """Benchmark looking up every feature by its feature id."""
+        feature_ids: List[str] = [
+            feature.feature_id for feature in installation.neuron.features.by_feature_types(["DI", "DO", "RO", "METER"])
+        ]
+
+        benchmark(lambda: [installation.neuron.features.by_feature_id(feature_id) for feature_id in feature_ids])
+
+
+@pytest.mark.parametrize("discovery_type", ["binary_sensors", "sensors", "switches", "covers"])
+class TestBenchmarkDiscovery:
+    def test_get_discovery(self, benchmark: BenchmarkFixture, installation: Installation, discovery_type: str) -> None:
+        """Benchmark the Home Assistant discovery payloads of all features and covers."""
+        neuron: Neuron = installation.neuron
+        get_discovery: Callable[[Any], Any]
+        items: List[Any]
+
+        if discovery_type == "covers":
+            get_discovery = HassCoversDiscovery(MagicMock(), neuron, MagicMock()).get_discovery
+            items = installation.covers
+        else:
+            discovery: Union[HassBinarySensorsDiscovery, HassSensorsDiscovery, HassSwitchesDiscoveryMixin] = {
+                "binary_sensors": HassBinarySensorsDiscovery,
+                "sensors": HassSensorsDiscovery,
+                "switches": HassSwitchesDiscoveryMixin,
+            }[discovery_type](neuron, MagicMock())
+            get_discovery = discovery.get_discovery
+            items = list(neuron.features.by_feature_types(discovery.publish_feature_types))
+
+        benchmark.group = f"discovery {discovery_type}"
+        benchmark(lambda: [get_discovery(item) for item in items])
+
+
+class TestBenchmarkCovers:
+    def test_update_position(self, benchmark: BenchmarkFixture, installation: Installation) -> None:
+        """Benchmark the position update of all running covers."""
+        for index, cover in enumerate(installation.covers):
+            cover.status.position = 50
+            cover.status.state = CoverState.CLOSING if index % 2 else CoverState.OPENING
+            cover.timer.start = time.monotonic()
+
+        def update_position() -> None:
+            for cover in installation.covers:
+                cover._update_position()  # noqa: SLF001
+
+        benchmark(update_position)
@@ -0,0 +1,300 @@
+"""End-to-end latency benchmarks from input edge to MQTT publish and from MQTT command to coil write.
+
+Unipi Control runs against the hardware simulator and an in-process MQTT broker. The results are written
+as JSON to ``reports/benchmarks`` to compare them between releases. The benchmark starts a TCP server and a
+pseudo terminal, so it only runs with ``UNIPI_BENCHMARK_LATENCY=1``. Set ``UNIPI_BENCHMARK_DURATION`` to change
+the measuring time per case in seconds.
+"""
+
+import asyncio
+import json
+import os
+import signal
+import socket
+import time
+from asyncio import AbstractEventLoop
+from itertools import cycle
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Final
+from typing import Hashable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import pytest
+from pymodbus.client.serial import AsyncModbusSerialClient
+from pymodbus.client.tcp import AsyncModbusTcpClient
+
+from tests.benchmarks.mqtt_broker import MqttBroker
+from unipi_control.config import Config
+from unipi_control.features.utils import FeatureState
+from unipi_control.features.utils import FeatureType
+from unipi_control.helpers.text import slugify
+from unipi_control.helpers.typing import ModbusClient
+from unipi_control.tools.simulator import UnipiSimulator
+from unipi_control.tools.simulator import write_eeprom
+from unipi_control.unipi_control import UnipiControl
+from unipi_control.version import __version__
+
+HARDWARE_DIR: Final[Path] = Path(__file__).parents[2] / "data/opkg/data/usr/local/etc/unipi/hardware"
+RESULTS_DIR: Final[Path] = Path(__file__).parents[2] / "reports/benchmarks"
+
+DEVICE_NAME: Final[str] = "Benchmark"
+MODEL: Final[str] = "L203"
+BAUD_RATE: Final[int] = 115200
+STARTUP_TIMEOUT: Final[float] = 10.0
+SETTLE_TIME: Final[float] = 0.5
+DURATION: Final[float] = float(os.environ.get("UNIPI_BENCHMARK_DURATION", "2"))
+
+pytestmark = pytest.mark.skipif(
+    os.environ.get("UNIPI_BENCHMARK_LATENCY") != "1", reason="Set UNIPI_BENCHMARK_LATENCY=1 to run the benchmark."
+)
+
+
+class LatencyRecorder:
+    """Match stimuli with their observed effect and collect the latencies in milliseconds."""
+
+    def __init__(self) -> None:
+        self.pending: Dict[Hashable, Tuple[float, Hashable]] = {}
+        self.latencies: List[float] = []
+        self.missed: int = 0
+
+    def stimulus(self, key: Hashable, expected: Hashable) -> None:
+        """Record the start time of a stimulus. A not yet observed stimulus for the same key counts as missed."""
+        if key in self.pending:
+            self.missed += 1
+
+        self.pending[key] = (time.perf_counter(), expected)
+
+    def observe(self, observed: float, key: Hashable, value: Hashable) -> None:
+        """Record the latency if the value is the expected effect of a pending stimulus."""
+        if (pending := self.pending.get(key)) and pending[1] == value:
+            del self.pending[key]
+            self.latencies.append((observed - pending[0]) * 1e3)
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the number of samples and the latency percentiles in milliseconds."""
+        latencies: List[float] = sorted(self.latencies)
+
+        def percentile(value: float) -> float:
+            return round(latencies[min(int(len(latencies) * value), len(latencies) - 1)], 3) if latencies else 0.0
+
+        return {
+            "samples": len(latencies),
+            "missed": self.missed + len(self.pending),
+            "p50_ms": percentile(0.5),
+            "p99_ms": percentile(0.99),
+            "max_ms": percentile(1.0),
+        }
+
+
+def get_free_port() -> int:
+    """Return a free TCP port on localhost."""
+    with socket.socket() as _socket:
+        _socket.bind(("127.0.0.1", 0))
+        port: int = _socket.getsockname()[1]
+
+    return port
+
+
+def write_config(config_dir: Path, mqtt_port: int, modbus_port: int, serial_link: Path) -> Config:
+    """Write a configuration that connects Unipi Control to the simulator and the broker."""
+    (config_dir / "hardware").symlink_to(HARDWARE_DIR)
+    write_eeprom(config_dir / "sys_bus", MODEL)
+
+    unipi_tmp_dir: Path = config_dir / "unipi"
+    unipi_tmp_dir.mkdir()
+
+    # JSON is valid YAML.
+    (config_dir / "control.yaml").write_text(
+        json.dumps(
+            {
+                "device_info": {"name": DEVICE_NAME},
+                "mqtt": {"host": "127.0.0.1", "port": mqtt_port, "reconnect_interval": 0},
+                "modbus_tcp": {"host": "127.0.0.1", "port": modbus_port},
+                "modbus_serial": {"port": serial_link.as_posix(), "baud_rate": BAUD_RATE},
+                "homeassistant": {"enabled": False},
+                "sys_bus_dir": (config_dir / "sys_bus").as_posix(),
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    return Config(config_base_dir=config_dir, unipi_tmp_dir=unipi_tmp_dir)
+
+
+async def wait_until(condition: Callable[[], bool]) -> None:
+    """Wait until the condition is true."""
+    deadline: float = time.perf_counter() + STARTUP_TIMEOUT
+
+    while not condition():
+        if time.perf_counter() > deadline:
+            pytest.fail("Unipi Control did not start in time!")
+
+        await asyncio.sleep(10e-3)
+
+
+class Stimulator:
+    """Toggle digital inputs in the simulator and send relay commands to the broker round-robin.
+
+    Attributes
+    ----------
+    inputs: LatencyRecorder
+        Latencies from the input edge to the MQTT publish.
+    commands: LatencyRecorder
+        Latencies from the MQTT command to the coil write.
+    relay_topics: list
+        The command topics of the relays.
+    """
+
+    def __init__(self, simulator: UnipiSimulator, broker: MqttBroker, features: int) -> None:
+        self.simulator: UnipiSimulator = simulator
+        self.broker: MqttBroker = broker
+        self.inputs: LatencyRecorder = LatencyRecorder()
+        self.commands: LatencyRecorder = LatencyRecorder()
+
+        device_topic: str = slugify(DEVICE_NAME)
+        input_ids: List[str] = [feature_id for feature_id in simulator.neuron.bits if feature_id.startswith("di_")]
+        relay_ids: List[str] = [feature_id for feature_id in simulator.neuron.bits if feature_id.startswith("ro_")]
+        coils: Dict[Tuple[int, int], int] = {bit: coil for coil, bit in simulator.neuron.coils.coil_bits.items()}
+
+        self.relay_topics: List[str] = [
+            f"{device_topic}/{FeatureType.RO.topic_name}/{relay_id}/set" for relay_id in relay_ids[:features]
+        ]
+        self._stimuli: Iterator[Tuple[str, str, str, int]] = cycle(
+            [
+                (
+                    input_ids[index],
+                    f"{device_topic}/{FeatureType.DI.topic_name}/{input_ids[index]}/get",
+                    self.relay_topics[index],
+                    coils[simulator.neuron.bits[relay_ids[index]]],
+                )
+                for index in range(features)
+            ]
+        )
+        self._coil_states: Dict[int, bool] = {}
+
+        broker.on_publish = lambda received, topic, payload: self.inputs.observe(received, topic, payload.decode())
+        simulator.neuron.coils.on_write = lambda coil, value: self.commands.observe(time.perf_counter(), coil, value)
+
+    def stimulate(self) -> None:
+        """Toggle the next digital input and switch the next relay."""
+        input_id, input_topic, relay_topic, coil = next(self._stimuli)
+
+        self.simulator.toggle(input_id)
+        register, bit = self.simulator.neuron.bits[input_id]
+        value: int = self.simulator.neuron.registers.getValues(register, 1)[0] >> bit & 1
+        self.inputs.stimulus(input_topic, FeatureState.ON if value else FeatureState.OFF)
+
+        self._coil_states[coil] = not self._coil_states.get(coil, False)
+        self.commands.stimulus(coil, self._coil_states[coil])
+        self.broker.publish(relay_topic, (FeatureState.ON if self._coil_states[coil] else FeatureState.OFF).encode())
+
+
+async def run_benchmark(config_dir: Path, features: int, rate: float) -> Dict[str, Any]:
+    """Run Unipi Control against the simulator and the broker while toggling inputs and switching relays.
+
+    Parameters
+    ----------
+    config_dir: Path
+        Temporary configuration directory.
+    features: int
+        The number of digital inputs and the number of relays.
+    rate: float
+        Toggles per second and feature.
+
+    Returns
+    -------
+    dict
+        Latencies, CPU time per second and MQTT messages per second.
+    """
+    broker: MqttBroker = MqttBroker()
+    mqtt_port: int = await broker.start()
+    modbus_port: int = get_free_port()
+    serial_link: Path = config_dir / "rtu"
+
+    simulator: UnipiSimulator = UnipiSimulator.from_hardware_dir(HARDWARE_DIR, model=MODEL, extensions=[])
+    stimulator: Stimulator = Stimulator(simulator, broker, features)
+
+    unipi_control: UnipiControl = UnipiControl(
+        config=write_config(config_dir, mqtt_port, modbus_port, serial_link),
+        modbus_client=ModbusClient(
+            tcp=AsyncModbusTcpClient(host="127.0.0.1", port=modbus_port, timeout=0.5, retries=3),
+            serial=AsyncModbusSerialClient(port=serial_link.as_posix(), baudrate=BAUD_RATE, timeout=1, retries=3),
+        ),
+    )
+    server_tasks: List[asyncio.Task] = [
+        asyncio.create_task(simulator.serve_tcp("127.0.0.1", modbus_port)),
+        asyncio.create_task(simulator.serve_rtu(serial_link, BAUD_RATE)),
+    ]
+    unipi_control_task: Optional[asyncio.Task] = None
+
+    try:
+        await wait_until(serial_link.exists)
+        unipi_control_task = asyncio.create_task(unipi_control.run())
+
+        await wait_until(lambda: all(broker.is_subscribed(topic) for topic in stimulator.relay_topics))
+        # Skip the initial publish of all features.
+        await asyncio.sleep(SETTLE_TIME)
+
+        broker.published = 0
+        started: float = time.perf_counter()
+        cpu_started: float = time.process_time()
+        next_stimulus: float = started
+
+        while next_stimulus < started + DURATION:
+            stimulator.stimulate()
+            next_stimulus += 1 / (features * rate)
+            await asyncio.sleep(max(next_stimulus - time.perf_counter(), 0))
+
+        # Give the last stimuli time to arrive.
+        await asyncio.sleep(SETTLE_TIME)
+
+        elapsed: float = time.perf_counter() - started
+        cpu_time: float = time.process_time() - cpu_started
+    finally:
+        # Close the clients before the servers. Otherwise, the clients try to reconnect.
+        if unipi_control_task:
+            unipi_control_task.cancel()
+            await asyncio.gather(unipi_control_task, return_exceptions=True)
+            asyncio.get_running_loop().remove_signal_handler(signal.SIGUSR1)
+
+        unipi_control.modbus_client.tcp.close()
+        unipi_control.modbus_client.serial.close()
+
+        for task in server_tasks:
+            task.cancel()
+
+        await asyncio.gather(*server_tasks, return_exceptions=True)
+        await broker.stop()
+
+    return {
+        "input_to_publish": stimulator.inputs.summary(),
+        "command_to_coil_write": stimulator.commands.summary(),
+        # Includes the simulator and the broker because they run in the same process.
+        "cpu_seconds_per_second": round(cpu_time / elapsed, 4),
+        "mqtt_messages_per_second": round(broker.published / elapsed, 1),
+    }
+
+
+@pytest.mark.parametrize(("features", "rate"), [(4, 5.0), (16, 10.0)])
+def test_end_to_end_latency(event_loop: AbstractEventLoop, tmp_path: Path, features: int, rate: float) -> None:
+    """Benchmark the latency from a DI edge to the MQTT publish and from an MQTT command to the coil write."""
+    results: Dict[str, Any] = {
+        "version": __version__,
+        "model": MODEL,
+        "features": features,
+        "rate": rate,
+        "duration": DURATION,
+        **event_loop.run_until_complete(run_benchmark(tmp_path, features, rate)),
+    }
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    (RESULTS_DIR / f"latency-{features}x{rate:g}.json").write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    assert results["input_to_publish"]["samples"] > 0
+    assert results["command_to_coil_write"]["samples"] > 0
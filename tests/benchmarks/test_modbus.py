@@ -0,0 +1,120 @@
+"""Micro-benchmarks for the modbus register cache."""
+
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from unipi_control.helpers.typing import ModbusFeature
+from unipi_control.helpers.typing import ModbusRegisterBlock
+from unipi_control.helpers.yaml import yaml_loader_safe
+from unipi_control.modbus import ModbusRegisterStore
+from unipi_control.modbus import plan_register_blocks
+
+NEURON_HARDWARE_DIR: Path = Path(__file__).parents[2] / "data/opkg/data/usr/local/etc/unipi/hardware/neuron"
+
+
+class DictRegisterStore:
+    """Reference implementation of the former dict based register cache."""
+
+    def __init__(self) -> None:
+        self.data: Dict[int, Dict[int, int]] = {}
+
+    def store_block(self, unit: int, start: int, words: List[int]) -> None:
+        """Store registers one by one."""
+        if not self.data.get(unit):
+            self.data[unit] = {}
+
+        for index in range(len(words)):
+            self.data[unit][start + index] = words[index]
+
+    def get_register(self, address: int, index: int, unit: int) -> List[int]:
+        """Get registers as a new list."""
+        ret: List[int] = []
+
+        for _address in range(address, address + index):
+            if _address in self.data[unit] and self.data[unit][_address] is not None:
+                ret += [self.data[unit][_address]]
+
+        return ret
+
+
+def load_definition(model: str) -> Dict[str, Any]:
+    """Load a Unipi Neuron hardware definition from the package data."""
+    definition: Dict[str, Any] = yaml_loader_safe(NEURON_HARDWARE_DIR / f"{model}.yaml")
+    return definition
+
+
+def create_store(
+    store_type: str, scan_plan: List[ModbusRegisterBlock]
+) -> Union[DictRegisterStore, ModbusRegisterStore]:
+    """Create a register store with allocated segments."""
+    if store_type == "dict":
+        return DictRegisterStore()
+
+    register_store: ModbusRegisterStore = ModbusRegisterStore()
+
+    for register_block in scan_plan:
+        register_store.allocate(0, register_block["start_reg"], register_block["count"])
+
+    return register_store
+
+
+@pytest.mark.parametrize("model", ["M527", "L533"])
+@pytest.mark.parametrize("store_type", ["dict", "array"])
+class TestBenchmarkRegisterStore:
+    def test_store_full_scan(self, benchmark: BenchmarkFixture, model: str, store_type: str) -> None:
+        """Benchmark storing all register blocks of a full scan."""
+        scan_plan: List[ModbusRegisterBlock] = plan_register_blocks(
+            load_definition(model)["modbus_register_blocks"], unit=0
+        )
+        responses: List[Tuple[int, List[int]]] = [
+            (register_block["start_reg"], list(range(register_block["count"]))) for register_block in scan_plan
+        ]
+        register_store: Union[DictRegisterStore, ModbusRegisterStore] = create_store(store_type, scan_plan)
+
+        def full_scan() -> None:
+            for start_reg, response in responses:
+                register_store.store_block(0, start_reg, response)
+
+        benchmark.group = f"full scan {model}"
+        benchmark(full_scan)
+
+    def test_read_features(self, benchmark: BenchmarkFixture, model: str, store_type: str) -> None:
+        """Benchmark reading the register value of every digital feature."""
+        definition: Dict[str, Any] = load_definition(model)
+        scan_plan: List[ModbusRegisterBlock] = plan_register_blocks(definition["modbus_register_blocks"], unit=0)
+        register_store: Union[DictRegisterStore, ModbusRegisterStore] = create_store(store_type, scan_plan)
+
+        for register_block in scan_plan:
+            register_store.store_block(0, register_block["start_reg"], [0xFFFF] * register_block["count"])
+
+        features: List[ModbusFeature] = [
+            modbus_feature
+            for modbus_feature in definition["modbus_features"]
+            for _ in range(modbus_feature["count"])
+            if modbus_feature["feature_type"] in {"DI", "DO", "RO"}
+        ]
+
+        if isinstance(register_store, ModbusRegisterStore):
+
+            def read_features() -> int:
+                return sum(
+                    register_store.view(0, modbus_feature["val_reg"], 1)[0] & 0x1  # type: ignore[index]
+                    for modbus_feature in features
+                )
+
+        else:
+
+            def read_features() -> int:
+                return sum(
+                    register_store.get_register(modbus_feature["val_reg"], 1, 0)[0] & 0x1 for modbus_feature in features
+                )
+
+        benchmark.group = f"read features {model}"
+        assert benchmark(read_features) == len(features)
@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 from typing import AsyncGenerator
+from typing import Callable
 from typing import Dict
 from typing import Generator
 from typing import List
@@ -19,12 +20,15 @@ from unittest.mock import PropertyMock
 import pytest
 import pytest_asyncio
 from _pytest.fixtures import SubRequest
+from paho.mqtt.client import topic_matches_sub
 from pymodbus.pdu import ModbusResponse
 from pytest_mock import MockerFixture
 
 from tests.conftest_data import EXTENSION_EASTRON_SDM120M_MODBUS_REGISTER
 from tests.conftest_data import NEURON_L203_MODBUS_REGISTER
 from unipi_control.config import Config
+from unipi_control.config import DEVICE_CLASSES
+from unipi_control.events import EventBus
 from unipi_control.extensions.eastron import EastronSDM120M
 from unipi_control.helpers.typing import ModbusClient
 from unipi_control.integrations.covers import CoverMap
@@ -246,24 +250,47 @@ async def create_cover_map(config_loader: ConfigLoader, neuron: Neuron) -> Async
     """
     config: Config = config_loader.get_config()
     config.logging.init()
-    covers: CoverMap = CoverMap(config=config, features=neuron.features)
+    covers: CoverMap = CoverMap(config=config, features=neuron.features, events=EventBus())
 
     yield covers
 
+    # Cancel the timers and position tasks of covers that were not stopped in the test.
+    for cover in covers.by_device_classes(DEVICE_CLASSES):
+        cover._stop_timer()  # noqa: SLF001
+
 
 class MockMQTTMessage(NamedTuple):
     payload: bytes
+    topic: str = ""
 
 
 class MockMQTTMessages:
-    def __init__(self, message: List[bytes]) -> None:
-        self.message: List[bytes] = message
+    def __init__(self, message: List[bytes], topic: str = "") -> None:
+        self.message: List[MockMQTTMessage] = [MockMQTTMessage(payload, topic) for payload in message]
 
     def __aiter__(self) -> "MockMQTTMessages":
         return self
 
     async def __anext__(self) -> MockMQTTMessage:
         if self.message:
-            return MockMQTTMessage(self.message.pop())
+            return self.message.pop()
 
         raise StopAsyncIteration
+
+
+def mock_filtered_messages(messages: Dict[str, List[bytes]]) -> Callable[[str], AsyncMock]:
+    """Mock ``Client.filtered_messages`` with the messages of all topics that match the topic filter."""
+
+    def filtered_messages(topic_filter: str) -> AsyncMock:
+        mqtt_messages: MockMQTTMessages = MockMQTTMessages([])
+
+        for topic, payloads in messages.items():
+            if topic_matches_sub(topic_filter, topic):
+                mqtt_messages.message.extend(MockMQTTMessage(payload, topic) for payload in payloads)
+
+        mock_mqtt_messages: AsyncMock = AsyncMock()
+        mock_mqtt_messages.__aenter__.return_value = mqtt_messages
+
+        return mock_mqtt_messages
+
+    return filtered_messages
@@ -95,6 +95,30 @@ logging:
   level: debug
 """
 
+CONFIG_CONTENT_SERIAL_UNITS: Final[
+    str
+] = """device_info:
+  name: MOCKED UNIPI
+modbus_serial:
+  port: /dev/MOCKED
+  baud_rate: 115200
+  parity: N
+  scan_budget: 10
+  units:
+    - unit: 1
+      device_name: MOCKED Eastron SDM120M 1
+      identifier: MOCKED_EASTRON
+      priority: 2
+    - unit: 2
+      device_name: MOCKED Eastron SDM120M 2
+      identifier: MOCKED_EASTRON
+    - unit: 3
+      device_name: MOCKED Eastron SDM120M 3
+      identifier: MOCKED_EASTRON
+logging:
+  level: debug
+"""
+
 CONFIG_CONTENT_WITHOUT_PERSISTENT_TMP_DIR: Final[
     str
 ] = """device_info:
@@ -155,6 +179,58 @@ modbus_features:
     val_coil: 200
 """
 
+HARDWARE_DATA_POLLING_CONTENT: Final[
+    str
+] = """modbus_register_blocks:
+    # DI 1.x / DO 1.x
+  - start_reg: 0
+    count: 2
+    # LED 1.x
+  - start_reg: 20
+    count: 1
+    poll: normal
+    # DI 2.x / RO 2.x
+  - start_reg: 100
+    count: 2
+    # DI 3.x / RO 3.x
+  - start_reg: 200
+    count: 2
+    poll: once
+modbus_features:
+  - feature_type: DI
+    count: 4
+    major_group: 1
+    val_reg: 0
+  - feature_type: DO
+    count: 4
+    major_group: 1
+    val_reg: 1
+    val_coil: 0
+  - feature_type: LED
+    major_group: 1
+    count: 4
+    val_coil: 8
+    val_reg: 20
+  - feature_type: DI
+    count: 16
+    major_group: 2
+    val_reg: 100
+  - feature_type: RO
+    major_group: 2
+    count: 14
+    val_reg: 101
+    val_coil: 100
+  - feature_type: DI
+    count: 16
+    major_group: 3
+    val_reg: 200
+  - feature_type: RO
+    major_group: 3
+    count: 14
+    val_reg: 201
+    val_coil: 200
+"""
+
 EXTENSION_HARDWARE_DATA_CONTENT: Final[
     str
 ] = """manufacturer: Eastron
@@ -390,10 +466,12 @@ EXTENSION_EASTRON_SDM120M_MODBUS_REGISTER: Final[List[MagicMock]] = [
     # Frequency, Import active energy, Export active energy, Imported reactive energy, Exported reactive energy
     MagicMock(spec=ModbusResponse, registers=[16968, 10486, 16525, 20447, 0, 0, 16023, 36176, 16431, 11010]),
     # Total system power demand, Maximum total system power demand,
-    # Import system power demand, Maximum import system power demand
-    MagicMock(spec=ModbusResponse, registers=[16917, 5097, 17058, 5854, 16917, 5097, 17058, 5854]),
+    # Import system power demand, Maximum import system power demand,
     # Export system power demand, Maximum export system power demand
-    MagicMock(spec=ModbusResponse, registers=[0, 0, 15609, 56093]),
+    MagicMock(
+        spec=ModbusResponse,
+        registers=[16917, 5097, 17058, 5854, 16917, 5097, 17058, 5854, 0, 0, 15609, 56093],
+    ),
     # Current demand
     MagicMock(spec=ModbusResponse, registers=[16020, 2247]),
     # Maximum current demand
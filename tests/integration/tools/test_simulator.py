@@ -0,0 +1,139 @@
+"""Integration tests for unipi-control-sim cli command."""
+import argparse
+from pathlib import Path
+from typing import List
+
+import pytest
+from _pytest.logging import LogCaptureFixture
+
+from tests.conftest import ConfigLoader
+from tests.conftest_data import CONFIG_CONTENT
+from tests.conftest_data import EXTENSION_HARDWARE_DATA_CONTENT
+from tests.conftest_data import HARDWARE_DATA_CONTENT
+from unipi_control.config import HardwareInfo
+from unipi_control.helpers.exception import UnexpectedError
+from unipi_control.tools.simulator import UnipiSimulator
+from unipi_control.tools.simulator import main
+from unipi_control.tools.simulator import parse_extension
+from unipi_control.tools.simulator import read_script
+from unipi_control.tools.simulator import write_eeprom
+
+
+class TestHappyPathUnipiSimulator:
+    @pytest.mark.parametrize(
+        "config_loader",
+        [
+            (CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
+        ],
+        indirect=["config_loader"],
+    )
+    def test_coil_write(self, config_loader: ConfigLoader) -> None:
+        """Test that coil writes switch the status bit in the value register."""
+        simulator: UnipiSimulator = UnipiSimulator.from_hardware_dir(
+            hardware_dir=config_loader.tmp_dir / "hardware", model="MOCKED_MODEL", extensions=[]
+        )
+
+        simulator.neuron.context.setValues(5, 100, [True, False, True])
+
+        assert simulator.neuron.context.getValues(3, 101, 1) == [0b101]
+        assert simulator.neuron.context.getValues(4, 101, 1) == [0b101]
+
+        simulator.neuron.context.setValues(5, 100, [False])
+
+        assert simulator.neuron.context.getValues(3, 101, 1) == [0b100]
+
+    @pytest.mark.parametrize(
+        "config_loader",
+        [
+            (CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
+        ],
+        indirect=["config_loader"],
+    )
+    def test_toggle(self, config_loader: ConfigLoader) -> None:
+        """Test toggle features of the neuron and the extensions."""
+        simulator: UnipiSimulator = UnipiSimulator.from_hardware_dir(
+            hardware_dir=config_loader.tmp_dir / "hardware",
+            model="MOCKED_MODEL",
+            extensions=[("MOCKED_EASTRON", 1)],
+        )
+
+        simulator.toggle("di_2_02")
+        assert simulator.neuron.context.getValues(4, 100, 1) == [0b10]
+
+        simulator.toggle("di_2_02")
+        assert simulator.neuron.context.getValues(4, 100, 1) == [0]
+
+        simulator.toggle("voltage_1")
+        assert simulator.extensions[0].context.getValues(4, 0, 2) != [0, 0]
+
+    def test_write_eeprom(self, tmp_path: Path) -> None:
+        """Test that the hardware info detects the simulated model."""
+        write_eeprom(tmp_path, "L203")
+
+        hardware_info: HardwareInfo = HardwareInfo(sys_bus_dir=tmp_path)
+
+        assert hardware_info.name == "Unipi Neuron"
+        assert hardware_info.model == "L203"
+
+    def test_read_script(self, tmp_path: Path) -> None:
+        """Test read the feature ids of a toggle script."""
+        script_file: Path = tmp_path / "script.yaml"
+        script_file.write_text("- di_1_01\n- ro_2_01\n", encoding="utf-8")
+
+        assert read_script(script_file) == ["di_1_01", "ro_2_01"]
+
+
+class TestUnhappyPathUnipiSimulator:
+    @pytest.mark.parametrize(
+        "config_loader",
+        [
+            (CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
+        ],
+        indirect=["config_loader"],
+    )
+    def test_hardware_definition_not_found(self, config_loader: ConfigLoader, caplog: LogCaptureFixture) -> None:
+        """Test for missing hardware definition."""
+        with pytest.raises(SystemExit) as error:
+            main(["L203", "-c", config_loader.tmp_dir.as_posix()])
+
+        logs: List[str] = [record.getMessage() for record in caplog.records]
+
+        assert error.value.code == 1
+        assert logs == [f"Hardware definition not found: {config_loader.tmp_dir / 'hardware/neuron/L203.yaml'}"]
+
+    @pytest.mark.parametrize(
+        "config_loader",
+        [
+            (CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
+        ],
+        indirect=["config_loader"],
+    )
+    def test_feature_not_found(self, config_loader: ConfigLoader, caplog: LogCaptureFixture) -> None:
+        """Test toggle an unknown feature."""
+        simulator: UnipiSimulator = UnipiSimulator.from_hardware_dir(
+            hardware_dir=config_loader.tmp_dir / "hardware", model="MOCKED_MODEL", extensions=[]
+        )
+
+        simulator.toggle("di_9_01")
+
+        logs: List[str] = [record.getMessage() for record in caplog.records]
+
+        assert logs == ["Feature 'di_9_01' not found!"]
+
+    def test_invalid_script(self, tmp_path: Path) -> None:
+        """Test for a toggle script that is not a YAML list."""
+        script_file: Path = tmp_path / "script.yaml"
+        script_file.write_text("di_1_01: true\n", encoding="utf-8")
+
+        with pytest.raises(UnexpectedError) as error:
+            read_script(script_file)
+
+        assert str(error.value) == "SCRIPT is not a YAML list of feature ids!"
+
+    @pytest.mark.parametrize("value", ["Eastron_SDM120M", "Eastron_SDM120M:one"])
+    def test_invalid_extension(self, value: str) -> None:
+        """Test for extension arguments without a unit."""
+        with pytest.raises(argparse.ArgumentTypeError) as error:
+            parse_extension(value)
+
+        assert str(error.value) == f"Invalid extension '{value}'. Use IDENTIFIER:UNIT e.g. Eastron_SDM120M:1."
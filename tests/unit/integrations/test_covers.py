@@ -15,6 +15,10 @@ from tests.conftest import MockModbusClient
 from tests.conftest_data import CONFIG_CONTENT
 from tests.conftest_data import EXTENSION_HARDWARE_DATA_CONTENT
 from tests.conftest_data import HARDWARE_DATA_CONTENT
+from unipi_control.events import CoverPositionChanged
+from unipi_control.events import CoverStateChanged
+from unipi_control.events import CoverTiltChanged
+from unipi_control.events import EventSubscription
 from unipi_control.integrations.covers import Cover
 from unipi_control.integrations.covers import CoverMap
 from unipi_control.integrations.covers import CoverState
@@ -179,6 +183,9 @@ class TestHappyPathCovers(TestCovers):
 
         mock_monotonic = mocker.patch("unipi_control.integrations.covers.time.monotonic", new_callable=MagicMock)
         mock_monotonic.return_value = 0
+        subscription: EventSubscription = covers.events.subscribe(
+            CoverStateChanged, CoverPositionChanged, CoverTiltChanged
+        )
         cover_run_time = await cover.open_cover(position=options.position if options.position else 100)
 
         if cover_run_time is not None:
@@ -188,13 +195,14 @@ class TestHappyPathCovers(TestCovers):
 
         await cover.stop_cover()
         cover.read_position()
+        topics: List[str] = [event.topic for event in await subscription.wait()]
 
         assert cover_run_time == expected.cover_run_time
         assert cover.status.position == expected.position
         assert cover.status.tilt == expected.tilt
         assert cover.state == expected.stop_cover_state
-        assert cover.state_changed == expected.state_changed
-        assert cover.position_changed == expected.position_changed
+        assert (f"{cover.topic}/state" in topics) == expected.state_changed
+        assert (f"{cover.topic}/position" in topics) == expected.position_changed
 
     @pytest.mark.asyncio()
     @pytest.mark.parametrize(
@@ -291,6 +299,9 @@ class TestHappyPathCovers(TestCovers):
         mock_monotonic = mocker.patch("unipi_control.integrations.covers.time.monotonic", new_callable=MagicMock)
 
         mock_monotonic.return_value = 0
+        subscription: EventSubscription = covers.events.subscribe(
+            CoverStateChanged, CoverPositionChanged, CoverTiltChanged
+        )
         cover_run_time: Optional[float] = await cover.close_cover(position=options.position if options.position else 0)
 
         assert cover.state == expected.close_cover_state
@@ -300,13 +311,14 @@ class TestHappyPathCovers(TestCovers):
 
         await cover.stop_cover()
         cover.read_position()
+        topics: List[str] = [event.topic for event in await subscription.wait()]
 
         assert cover_run_time == expected.cover_run_time
         assert cover.status.position == expected.position
         assert cover.status.tilt == expected.tilt
         assert cover.state == expected.stop_cover_state
-        assert cover.state_changed == expected.state_changed
-        assert cover.position_changed == expected.position_changed
+        assert (f"{cover.topic}/state" in topics) == expected.state_changed
+        assert (f"{cover.topic}/position" in topics) == expected.position_changed
 
     @pytest.mark.asyncio()
     @pytest.mark.parametrize(
@@ -406,6 +418,9 @@ class TestHappyPathCovers(TestCovers):
 
         assert isinstance(options.tilt, int)
 
+        subscription: EventSubscription = covers.events.subscribe(
+            CoverStateChanged, CoverPositionChanged, CoverTiltChanged
+        )
         cover_run_time: Optional[float] = await cover.set_tilt(options.tilt)
 
         assert cover.state == expected.tilt_cover_state
@@ -415,11 +430,12 @@ class TestHappyPathCovers(TestCovers):
 
         await cover.stop_cover()
         cover.read_position()
+        topics: List[str] = [event.topic for event in await subscription.wait()]
 
         assert cover.status.tilt == expected.tilt
         assert cover.state == expected.stop_cover_state
-        assert cover.state_changed == expected.state_changed
-        assert cover.tilt_changed == expected.tilt_changed
+        assert (f"{cover.topic}/state" in topics) == expected.state_changed
+        assert (f"{cover.topic}/tilt" in topics) == expected.tilt_changed
 
     @pytest.mark.asyncio()
     @pytest.mark.parametrize(
@@ -483,6 +499,9 @@ class TestHappyPathCovers(TestCovers):
 
         assert isinstance(options.position, int)
 
+        subscription: EventSubscription = covers.events.subscribe(
+            CoverStateChanged, CoverPositionChanged, CoverTiltChanged
+        )
         cover_run_time: Optional[float] = await cover.set_position(options.position)
 
         assert cover.state == expected.position_cover_state
@@ -492,11 +511,62 @@ class TestHappyPathCovers(TestCovers):
 
         await cover.stop_cover()
         cover.read_position()
+        topics: List[str] = [event.topic for event in await subscription.wait()]
 
         assert cover.status.position == expected.position
         assert cover.state == expected.stop_cover_state
-        assert cover.state_changed == expected.state_changed
-        assert cover.position_changed == expected.position_changed
+        assert (f"{cover.topic}/state" in topics) == expected.state_changed
+        assert (f"{cover.topic}/position" in topics) == expected.position_changed
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        "config_loader", [(CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT)], indirect=True
+    )
+    async def test_notify_moving_position(self, covers: CoverMap) -> None:
+        """Test the interpolated position is published while the cover moves."""
+        covers.init()
+        cover: Cover = next(covers.by_device_classes(["blind"]))
+        cover.calibration.mode = False
+        cover.settings = cover.settings._replace(position_update_interval=1e-3)
+
+        subscription: EventSubscription = covers.events.subscribe(CoverPositionChanged)
+        await cover.open_cover()
+
+        assert cover.timer.timer is not None
+        assert cover.timer.position_task is not None
+        assert cover.timer.start is not None
+
+        # Pretend the cover is moving for half of the cover run time.
+        cover.timer.start -= cover.settings.cover_run_time / 2
+
+        assert await subscription.wait() == [
+            CoverPositionChanged(topic=f"{cover.topic}/position", payload=50, cover=cover),
+        ]
+
+        await cover.stop_cover()
+
+        assert cover.timer.position_task is None
+        assert cover.status.position == 50
+        # The stopped position was already published while the cover moved.
+        assert covers.events.events_after(subscription.sequence) == [
+            CoverTiltChanged(topic=f"{cover.topic}/tilt", payload=100, cover=cover),
+            CoverStateChanged(topic=f"{cover.topic}/state", payload="stopped", cover=cover),
+        ]
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        "config_loader", [(CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT)], indirect=True
+    )
+    async def test_tilt_without_moving_position(self, covers: CoverMap) -> None:
+        """Test tilt changes do not publish an interpolated position."""
+        covers.init()
+        cover: Cover = next(covers.by_device_classes(["blind"]))
+        cover.calibration.mode = False
+
+        await cover.set_tilt(50)
+
+        assert cover.timer.timer is not None
+        assert cover.timer.position_task is None
 
     @pytest.mark.parametrize(
         "config_loader", [(CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT)], indirect=True
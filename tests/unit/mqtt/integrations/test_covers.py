@@ -2,7 +2,11 @@
 import asyncio
 from asyncio import Task
 from contextlib import AsyncExitStack
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
 from typing import List
+from typing import Optional
 from typing import Set
 from unittest.mock import AsyncMock
 from unittest.mock import PropertyMock
@@ -12,34 +16,59 @@ from _pytest.logging import LogCaptureFixture
 from aiomqtt import Client
 from pytest_mock import MockerFixture
 
-from tests.conftest import MockMQTTMessages
+from tests.conftest import mock_filtered_messages
 from tests.conftest_data import EXTENSION_HARDWARE_DATA_CONTENT
 from tests.conftest_data import HARDWARE_DATA_CONTENT
 from tests.unit.mqtt.integrations.test_covers_data import CONFIG_CONTENT
+from unipi_control.config import DEVICE_CLASSES
 from unipi_control.integrations.covers import Cover
 from unipi_control.integrations.covers import CoverMap
 from unipi_control.integrations.covers import CoverState
 from unipi_control.mqtt.integrations.covers import CoversMqttPlugin
+from unipi_control.mqtt.router import MqttTopicRouter
 
 
-async def init_tasks(covers: CoverMap, mqtt_messages: List[MockMQTTMessages], subscribe_running: List[bool]) -> None:
+def change_state(
+    covers: CoverMap, state: str, cover_run_time: Optional[float] = None
+) -> Callable[..., Awaitable[Optional[float]]]:
+    """Return a side effect for a mocked cover command that changes the state of all covers.
+
+    Parameters
+    ----------
+    covers: CoverMap
+        A dictionary of grouped cover lists.
+    state: str
+        The new cover state.
+    cover_run_time: float, optional
+        The cover run time returned by the mocked command.
+    """
+
+    async def command(*args: int) -> Optional[float]:  # noqa: ARG001
+        for cover in covers.by_device_classes(DEVICE_CLASSES):
+            cover.status.state = state
+            cover._notify()  # noqa: SLF001
+
+        return cover_run_time
+
+    return command
+
+
+async def init_tasks(covers: CoverMap, mqtt_messages: Dict[str, List[bytes]], subscribe_running: List[bool]) -> None:
     """Initialize Home Assistant covers.
 
     Parameters
     ----------
     covers: CoverMap
         A dictionary of grouped cover lists.
-    mqtt_messages: list
-        A list of mocked MQTT topic messages.
+    mqtt_messages: dict
+        The mocked MQTT messages by topic.
     subscribe_running: List[bool]
         List of running subscribe loops for mocked side effects.
     """
     covers.init()
-    mock_mqtt_messages: AsyncMock = AsyncMock()
-    mock_mqtt_messages.__aenter__.side_effect = mqtt_messages
 
     mock_mqtt_client: AsyncMock = AsyncMock(spec=Client)
-    mock_mqtt_client.filtered_messages.return_value = mock_mqtt_messages
+    mock_mqtt_client.filtered_messages.side_effect = mock_filtered_messages(mqtt_messages)
 
     CoversMqttPlugin.PUBLISH_RUNNING = PropertyMock(side_effect=[True, False])
     CoversMqttPlugin.SUBSCRIBE_RUNNING = PropertyMock(side_effect=subscribe_running)
@@ -50,7 +79,10 @@ async def init_tasks(covers: CoverMap, mqtt_messages: List[MockMQTTMessages], su
         tasks: Set[Task] = set()
 
         await stack.enter_async_context(mock_mqtt_client)
-        await plugin.init_tasks(stack, tasks)
+
+        router: MqttTopicRouter = MqttTopicRouter(mock_mqtt_client)
+        await plugin.init_tasks(router, tasks)
+        await router.init_tasks(stack, tasks)
         await asyncio.gather(*tasks)
 
         for task in tasks:
@@ -64,11 +96,10 @@ class TestHappyPathCoversMqttPlugin:
         [
             (
                 (CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
-                [
-                    MockMQTTMessages([b"50"]),  # position
-                    MockMQTTMessages([]),  # tilt
-                    MockMQTTMessages([b"""OPEN"""]),  # command
-                ],
+                {
+                    "mocked_unipi/mocked_blind_topic_name/cover/blind/position/set": [b"50"],
+                    "mocked_unipi/mocked_blind_topic_name/cover/blind/set": [b"""OPEN"""],
+                },
             )
         ],
         indirect=["config_loader"],
@@ -76,20 +107,18 @@ class TestHappyPathCoversMqttPlugin:
     async def test_open_cover_with_cancel_other_task(
         self,
         covers: CoverMap,
-        mqtt_messages: List[MockMQTTMessages],
+        mqtt_messages: Dict[str, List[bytes]],
         caplog: LogCaptureFixture,
         mocker: MockerFixture,
     ) -> None:
         """Test mqtt output after set cover command."""
         mock_open_cover = mocker.patch.object(Cover, "open_cover", new_callable=AsyncMock)
+        mock_open_cover.side_effect = change_state(covers, CoverState.OPENING)
         mock_calibrate = mocker.patch.object(Cover, "calibrate", new_callable=AsyncMock)
 
         mock_set_position = mocker.patch.object(Cover, "set_position", new_callable=AsyncMock)
         mock_set_position.return_value = 10
 
-        mocker.patch.object(Cover, "state_changed", new_callable=PropertyMock(return_value=True))
-        mocker.patch.object(Cover, "state", new_callable=PropertyMock(return_value=CoverState.OPENING))
-
         # Disable endless waiting loop
         mocker.patch.object(Cover, "is_closing", new_callable=PropertyMock(return_value=False))
 
@@ -97,9 +126,8 @@ class TestHappyPathCoversMqttPlugin:
         logs: List[str] = [record.getMessage() for record in caplog.records]
 
         assert "[CONFIG] 1 covers initialized." in logs
-        assert "[MQTT] Subscribe topic mocked_unipi/mocked_blind_topic_name/cover/blind/position/set" in logs
-        assert "[MQTT] Subscribe topic mocked_unipi/mocked_blind_topic_name/cover/blind/tilt/set" in logs
-        assert "[MQTT] Subscribe topic mocked_unipi/mocked_blind_topic_name/cover/blind/set" in logs
+        assert "[MQTT] Subscribe topic mocked_unipi/+/+/+/+/set" in logs
+        assert "[MQTT] Subscribe topic mocked_unipi/+/+/+/set" in logs
         assert "[COVER] [mocked_unipi/mocked_blind_topic_name/cover/blind] [Worker] 1 task(s) canceled." in logs
         assert "[MQTT] [mocked_unipi/mocked_blind_topic_name/cover/blind/set] Subscribe message: OPEN" in logs
         assert "[MQTT] [mocked_unipi/mocked_blind_topic_name/cover/blind/position] Publishing message: 0" in logs
@@ -115,11 +143,9 @@ class TestHappyPathCoversMqttPlugin:
         [
             (
                 (CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
-                [
-                    MockMQTTMessages([]),  # position
-                    MockMQTTMessages([]),  # tilt
-                    MockMQTTMessages([b"""CLOSE"""]),  # command
-                ],
+                {
+                    "mocked_unipi/mocked_blind_topic_name/cover/blind/set": [b"""CLOSE"""],
+                },
             )
         ],
         indirect=["config_loader"],
@@ -127,7 +153,7 @@ class TestHappyPathCoversMqttPlugin:
     async def test_close_cover(
         self,
         covers: CoverMap,
-        mqtt_messages: List[MockMQTTMessages],
+        mqtt_messages: Dict[str, List[bytes]],
         caplog: LogCaptureFixture,
         mocker: MockerFixture,
     ) -> None:
@@ -135,18 +161,14 @@ class TestHappyPathCoversMqttPlugin:
         mock_calibrate = mocker.patch.object(Cover, "calibrate", new_callable=AsyncMock)
 
         mock_close_cover = mocker.patch.object(Cover, "close_cover", new_callable=AsyncMock)
-        mock_close_cover.return_value = 10
-
-        mocker.patch.object(Cover, "state_changed", new_callable=PropertyMock(return_value=True))
-        mocker.patch.object(Cover, "state", new_callable=PropertyMock(return_value=CoverState.CLOSING))
+        mock_close_cover.side_effect = change_state(covers, CoverState.CLOSING, cover_run_time=10)
 
         await init_tasks(covers=covers, mqtt_messages=mqtt_messages, subscribe_running=[False])
         logs: List[str] = [record.getMessage() for record in caplog.records]
 
         assert "[CONFIG] 1 covers initialized." in logs
-        assert "[MQTT] Subscribe topic mocked_unipi/mocked_blind_topic_name/cover/blind/position/set" in logs
-        assert "[MQTT] Subscribe topic mocked_unipi/mocked_blind_topic_name/cover/blind/tilt/set" in logs
-        assert "[MQTT] Subscribe topic mocked_unipi/mocked_blind_topic_name/cover/blind/set" in logs
+        assert "[MQTT] Subscribe topic mocked_unipi/+/+/+/+/set" in logs
+        assert "[MQTT] Subscribe topic mocked_unipi/+/+/+/set" in logs
         assert "[MQTT] [mocked_unipi/mocked_blind_topic_name/cover/blind/set] Subscribe message: CLOSE" in logs
         assert "[MQTT] [mocked_unipi/mocked_blind_topic_name/cover/blind/position] Publishing message: 0" in logs
         assert "[MQTT] [mocked_unipi/mocked_blind_topic_name/cover/blind/tilt] Publishing message: 0" in logs
@@ -161,11 +183,9 @@ class TestHappyPathCoversMqttPlugin:
         [
             (
                 (CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
-                [
-                    MockMQTTMessages([]),  # position
-                    MockMQTTMessages([]),  # tilt
-                    MockMQTTMessages([b"""STOP"""]),  # command
-                ],
+                {
+                    "mocked_unipi/mocked_blind_topic_name/cover/blind/set": [b"""STOP"""],
+                },
             )
         ],
         indirect=["config_loader"],
@@ -173,24 +193,21 @@ class TestHappyPathCoversMqttPlugin:
     async def test_stop_cover(
         self,
         covers: CoverMap,
-        mqtt_messages: List[MockMQTTMessages],
+        mqtt_messages: Dict[str, List[bytes]],
         caplog: LogCaptureFixture,
         mocker: MockerFixture,
     ) -> None:
         """Test mqtt output after set cover command."""
         mock_stop_cover = mocker.patch.object(Cover, "stop_cover", new_callable=AsyncMock)
+        mock_stop_cover.side_effect = change_state(covers, CoverState.STOPPED)
         mock_calibrate = mocker.patch.object(Cover, "calibrate", new_callable=AsyncMock)
 
-        mocker.patch.object(Cover, "state_changed", new_callable=PropertyMock(return_value=True))
-        mocker.patch.object(Cover, "state", new_callable=PropertyMock(return_value=CoverState.STOPPED))
-
         await init_tasks(covers=covers, mqtt_messages=mqtt_messages, subscribe_running=[False])
         logs: List[str] = [record.getMessage() for record in caplog.records]
 
         assert "[CONFIG] 1 covers initialized." in logs
-        assert "[MQTT] Subscribe topic mocked_unipi/mocked_blind_topic_name/cover/blind/position/set" in logs
-        assert "[MQTT] Subscribe topic mocked_unipi/mocked_blind_topic_name/cover/blind/tilt/set" in logs
-        assert "[MQTT] Subscribe topic mocked_unipi/mocked_blind_topic_name/cover/blind/set" in logs
+        assert "[MQTT] Subscribe topic mocked_unipi/+/+/+/+/set" in logs
+        assert "[MQTT] Subscribe topic mocked_unipi/+/+/+/set" in logs
         assert "[MQTT] [mocked_unipi/mocked_blind_topic_name/cover/blind/set] Subscribe message: STOP" in logs
         assert "[MQTT] [mocked_unipi/mocked_blind_topic_name/cover/blind/position] Publishing message: 0" in logs
         assert "[MQTT] [mocked_unipi/mocked_blind_topic_name/cover/blind/tilt] Publishing message: 0" in logs
@@ -205,11 +222,9 @@ class TestHappyPathCoversMqttPlugin:
         [
             (
                 (CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
-                [
-                    MockMQTTMessages([b"""50"""]),  # position
-                    MockMQTTMessages([]),  # tilt
-                    MockMQTTMessages([]),  # command
-                ],
+                {
+                    "mocked_unipi/mocked_blind_topic_name/cover/blind/position/set": [b"""50"""],
+                },
             )
         ],
         indirect=["config_loader"],
@@ -217,16 +232,13 @@ class TestHappyPathCoversMqttPlugin:
     async def test_set_position(
         self,
         covers: CoverMap,
-        mqtt_messages: List[MockMQTTMessages],
+        mqtt_messages: Dict[str, List[bytes]],
         caplog: LogCaptureFixture,
         mocker: MockerFixture,
     ) -> None:
         """Test mqtt output after set cover position."""
         mock_set_position = mocker.patch.object(Cover, "set_position", new_callable=AsyncMock)
-        mock_set_position.return_value = 10
-
-        mocker.patch.object(Cover, "state_changed", new_callable=PropertyMock(return_value=True))
-        mocker.patch.object(Cover, "state", new_callable=PropertyMock(return_value=CoverState.CLOSING))
+        mock_set_position.side_effect = change_state(covers, CoverState.CLOSING, cover_run_time=10)
 
         # Disable endless waiting loop
         mocker.patch.object(Cover, "is_closing", new_callable=PropertyMock(return_value=False))
@@ -237,13 +249,11 @@ class TestHappyPathCoversMqttPlugin:
         mock_set_position.assert_called_once_with(50)
 
         assert "[CONFIG] 1 covers initialized." in logs
-        assert "[MQTT] Subscribe topic mocked_unipi/mocked_blind_topic_name/cover/blind/position/set" in logs
-        assert "[MQTT] Subscribe topic mocked_unipi/mocked_blind_topic_name/cover/blind/tilt/set" in logs
-        assert "[MQTT] Subscribe topic mocked_unipi/mocked_blind_topic_name/cover/blind/set" in logs
+        assert "[MQTT] Subscribe topic mocked_unipi/+/+/+/+/set" in logs
+        assert "[MQTT] Subscribe topic mocked_unipi/+/+/+/set" in logs
         assert "[MQTT] [mocked_unipi/mocked_blind_topic_name/cover/blind/position] Publishing message: 0" in logs
         assert "[MQTT] [mocked_unipi/mocked_blind_topic_name/cover/blind/tilt] Publishing message: 0" in logs
         assert "[MQTT] [mocked_unipi/mocked_blind_topic_name/cover/blind/state] Publishing message: closing" in logs
-        assert "[COVER] [mocked_unipi/mocked_blind_topic_name/cover/blind] [Worker] 1 task(s) in queue." in logs
         assert "[MQTT] [mocked_unipi/mocked_blind_topic_name/cover/blind/position/set] Subscribe message: 50" in logs
         assert "[COVER] [mocked_unipi/mocked_blind_topic_name/cover/blind] [Worker] Cover runtime: 10 seconds." in logs
 
@@ -253,11 +263,9 @@ class TestHappyPathCoversMqttPlugin:
         [
             (
                 (CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
-                [
-                    MockMQTTMessages([]),  # position
-                    MockMQTTMessages([b"""50"""]),  # tilt
-                    MockMQTTMessages([]),  # command
-                ],
+                {
+                    "mocked_unipi/mocked_blind_topic_name/cover/blind/tilt/set": [b"""50"""],
+                },
             )
         ],
         indirect=["config_loader"],
@@ -265,16 +273,13 @@ class TestHappyPathCoversMqttPlugin:
     async def test_set_tilt(
         self,
         covers: CoverMap,
-        mqtt_messages: List[MockMQTTMessages],
+        mqtt_messages: Dict[str, List[bytes]],
         caplog: LogCaptureFixture,
         mocker: MockerFixture,
     ) -> None:
         """Test mqtt output after set cover tilt."""
         mock_set_tilt = mocker.patch.object(Cover, "set_tilt", new_callable=AsyncMock)
-        mock_set_tilt.return_value = 0.25
-
-        mocker.patch.object(Cover, "state_changed", new_callable=PropertyMock(return_value=True))
-        mocker.patch.object(Cover, "state", new_callable=PropertyMock(return_value=CoverState.OPENING))
+        mock_set_tilt.side_effect = change_state(covers, CoverState.OPENING, cover_run_time=0.25)
 
         # Disable endless waiting loop
         mocker.patch.object(Cover, "is_opening", new_callable=PropertyMock(return_value=False))
@@ -285,13 +290,11 @@ class TestHappyPathCoversMqttPlugin:
         mock_set_tilt.assert_called_once_with(50)
 
         assert "[CONFIG] 1 covers initialized." in logs
-        assert "[MQTT] Subscribe topic mocked_unipi/mocked_blind_topic_name/cover/blind/position/set" in logs
-        assert "[MQTT] Subscribe topic mocked_unipi/mocked_blind_topic_name/cover/blind/tilt/set" in logs
-        assert "[MQTT] Subscribe topic mocked_unipi/mocked_blind_topic_name/cover/blind/set" in logs
+        assert "[MQTT] Subscribe topic mocked_unipi/+/+/+/+/set" in logs
+        assert "[MQTT] Subscribe topic mocked_unipi/+/+/+/set" in logs
         assert "[MQTT] [mocked_unipi/mocked_blind_topic_name/cover/blind/position] Publishing message: 0" in logs
         assert "[MQTT] [mocked_unipi/mocked_blind_topic_name/cover/blind/tilt] Publishing message: 0" in logs
         assert "[MQTT] [mocked_unipi/mocked_blind_topic_name/cover/blind/state] Publishing message: opening" in logs
-        assert "[COVER] [mocked_unipi/mocked_blind_topic_name/cover/blind] [Worker] 1 task(s) in queue." in logs
         assert "[MQTT] [mocked_unipi/mocked_blind_topic_name/cover/blind/tilt/set] Subscribe message: 50" in logs
         assert (
             "[COVER] [mocked_unipi/mocked_blind_topic_name/cover/blind] [Worker] Cover runtime: 0.25 seconds." in logs
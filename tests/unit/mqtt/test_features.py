@@ -5,6 +5,8 @@ from asyncio import Task
 from contextlib import AsyncExitStack
 from typing import List
 from typing import Set
+from typing import TYPE_CHECKING
+from typing import Union
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import PropertyMock
@@ -13,15 +15,28 @@ from unittest.mock import call
 import pytest
 from _pytest.logging import LogCaptureFixture
 from aiomqtt import Client
+from pymodbus.pdu import ModbusResponse
 from pytest_mock import MockerFixture
 
-from tests.conftest import MockMQTTMessages
+from tests.conftest import MockModbusClient
+from tests.conftest import mock_filtered_messages
 from tests.conftest_data import CONFIG_CONTENT
 from tests.conftest_data import EXTENSION_HARDWARE_DATA_CONTENT
 from tests.conftest_data import HARDWARE_DATA_CONTENT
+from unipi_control.events import EventBus
+from unipi_control.events import MeterValueChanged
+from unipi_control.features.extensions import EastronMeter
 from unipi_control.mqtt.features import MeterFeaturesMqttPlugin
 from unipi_control.mqtt.features import NeuronFeaturesMqttPlugin
+from unipi_control.mqtt.router import MqttTopicRouter
 from unipi_control.neuron import Neuron
+from unipi_control.poller import ModbusPoller
+
+if TYPE_CHECKING:
+    from unipi_control.features.neuron import DigitalInput
+    from unipi_control.features.neuron import DigitalOutput
+    from unipi_control.features.neuron import Led
+    from unipi_control.features.neuron import Relay
 
 
 class TestHappyPathNeuronFeaturesMqttPlugin:
@@ -31,22 +46,28 @@ class TestHappyPathNeuronFeaturesMqttPlugin:
     )
     async def test_init_tasks(self, mocker: MockerFixture, neuron: Neuron, caplog: LogCaptureFixture) -> None:
         """Test MQTT output after initialize neuron features."""
-        mock_mqtt_messages: AsyncMock = AsyncMock()
-        mock_mqtt_messages.__aenter__.return_value = MockMQTTMessages([b"""ON""", b"""OFF"""])
-
         mock_mqtt_client: AsyncMock = AsyncMock(spec=Client)
-        mock_mqtt_client.filtered_messages.return_value = mock_mqtt_messages
+        mock_mqtt_client.filtered_messages.side_effect = mock_filtered_messages(
+            {"mocked_unipi/relay/do_1_01/set": [b"""ON""", b"""OFF"""]}
+        )
 
-        mock_modbus_cache_data_scan: MagicMock = mocker.patch("unipi_control.modbus.ModbusCacheData.scan")
+        mocker.patch("unipi_control.modbus.ModbusCacheData.scan", return_value={})
 
-        NeuronFeaturesMqttPlugin.PUBLISH_RUNNING = PropertyMock(side_effect=[True, True, False])
-        NeuronFeaturesMqttPlugin.scan_interval = 25e-3
+        ModbusPoller.POLL_RUNNING = PropertyMock(side_effect=[True, False])
+        NeuronFeaturesMqttPlugin.PUBLISH_RUNNING = PropertyMock(side_effect=[False])
+
+        events: EventBus = EventBus()
+        poller: ModbusPoller = ModbusPoller(neuron, events)
+        await poller.poll("tcp", sleep=25e-3)
 
         async with AsyncExitStack() as stack:
             tasks: Set[Task] = set()
 
             await stack.enter_async_context(mock_mqtt_client)
-            await NeuronFeaturesMqttPlugin(neuron, mock_mqtt_client).init_tasks(stack, tasks)
+
+            router: MqttTopicRouter = MqttTopicRouter(mock_mqtt_client)
+            await NeuronFeaturesMqttPlugin(neuron, mock_mqtt_client, events).init_tasks(router, tasks)
+            await router.init_tasks(stack, tasks)
             await asyncio.gather(*tasks)
 
             for task in tasks:
@@ -54,25 +75,79 @@ class TestHappyPathNeuronFeaturesMqttPlugin:
 
         logs: List[str] = [record.getMessage() for record in caplog.records]
 
-        assert mock_modbus_cache_data_scan.mock_calls == [
-            # In the first run features changed.
-            call("tcp", ["Neuron"]),
-            # In the second run features not changed.
-            call("tcp", ["Neuron"]),
+        assert mock_mqtt_client.subscribe.call_args_list == [
+            call([("mocked_unipi/+/+/set", 0), ("mocked_unipi/+/set", 0)]),
         ]
-
-        for feature_do in range(1, 4):
-            assert f"[MQTT] Subscribe topic mocked_unipi/relay/do_1_{feature_do:02d}/set" in logs
-
-        for bord in range(2, 3):
-            for feature_ro in range(1, 4):
-                assert f"[MQTT] Subscribe topic mocked_unipi/relay/ro_{bord}_{feature_ro:02d}/set" in logs
+        assert "[MQTT] Subscribe topic mocked_unipi/+/+/set" in logs
+        assert "[MQTT] Subscribe topic mocked_unipi/relay/do_1_01/set" not in logs
 
         assert "[MQTT] [mocked_unipi/relay/do_1_01/set] Subscribe message: OFF" in logs
         assert "[MQTT] [mocked_unipi/relay/do_1_01/set] Subscribe message: ON" in logs
         assert "[MQTT] [mocked_unipi/relay/ro_2_01/get] Publishing message: OFF" in logs
         assert "[MQTT] [mocked_unipi/relay/ro_2_13/get] Publishing message: OFF" in logs
 
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        "config_loader", [(CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT)], indirect=True
+    )
+    async def test_bulk_command(
+        self, mocker: MockerFixture, modbus_client: MockModbusClient, neuron: Neuron, caplog: LogCaptureFixture
+    ) -> None:
+        """Test bulk commands are coalesced into one multiple coil write per contiguous coil range."""
+        mock_response: MagicMock = MagicMock(spec=ModbusResponse)
+        mock_response.isError.return_value = False
+
+        modbus_client.tcp.write_coils.return_value = mock_response
+
+        mock_mqtt_client: AsyncMock = AsyncMock(spec=Client)
+        mock_mqtt_client.filtered_messages.side_effect = mock_filtered_messages(
+            {
+                "mocked_unipi/relay/set": [
+                    b"""INVALID""",
+                    b"""{"ro_2_01": "ON", "ro_2_02": "ON", "ro_2_04": "OFF", "di_1_01": "ON", "invalid": "ON"}""",
+                ],
+                "mocked_unipi/relay/do_1_01/set": [b"""ON"""],
+            }
+        )
+
+        mocker.patch("unipi_control.modbus.ModbusCacheData.scan", return_value={})
+
+        ModbusPoller.POLL_RUNNING = PropertyMock(side_effect=[True, False])
+        NeuronFeaturesMqttPlugin.PUBLISH_RUNNING = PropertyMock(side_effect=[False, False])
+
+        events: EventBus = EventBus()
+        poller: ModbusPoller = ModbusPoller(neuron, events)
+
+        async with AsyncExitStack() as stack:
+            tasks: Set[Task] = set()
+
+            await stack.enter_async_context(mock_mqtt_client)
+
+            router: MqttTopicRouter = MqttTopicRouter(mock_mqtt_client)
+            await NeuronFeaturesMqttPlugin(neuron, mock_mqtt_client, events).init_tasks(router, tasks)
+            await router.init_tasks(stack, tasks)
+            await asyncio.gather(*tasks)
+
+        # The commands are written while the poller scans. Reconnect to publish the latest state.
+        await poller.poll("tcp", sleep=25e-3)
+        await NeuronFeaturesMqttPlugin(neuron, mock_mqtt_client, events)._publish()  # noqa: SLF001
+
+        logs: List[str] = [record.getMessage() for record in caplog.records]
+
+        assert modbus_client.tcp.write_coils.call_args_list == [
+            call(address=0, values=[True], slave=0),
+            call(address=100, values=[True, True], slave=0),
+            call(address=103, values=[False], slave=0),
+        ]
+        assert modbus_client.tcp.write_coil.call_args_list == []
+
+        assert "[MQTT] Subscribe topic mocked_unipi/+/set" in logs
+        assert "[MQTT] [mocked_unipi/relay/set] Feature 'di_1_01' not found!" in logs
+        assert "[MQTT] [mocked_unipi/relay/set] Feature 'invalid' not found!" in logs
+        assert "[MQTT] [mocked_unipi/relay/set] Invalid bulk command: INVALID" in logs
+        assert "[MQTT] [mocked_unipi/relay/do_1_01/get] Publishing message: ON" in logs
+        assert "[MQTT] [mocked_unipi/relay/ro_2_01/get] Publishing message: ON" in logs
+
 
 class TestHappyPathMeterFeaturesMqttPlugin:
     @pytest.mark.asyncio()
@@ -82,14 +157,20 @@ class TestHappyPathMeterFeaturesMqttPlugin:
     async def test_init_tasks(self, mocker: MockerFixture, neuron: Neuron, caplog: LogCaptureFixture) -> None:
         """Test MQTT output after initialize meter features."""
         mock_mqtt_client: AsyncMock = AsyncMock(spec=Client)
-        mock_modbus_cache_data_scan: MagicMock = mocker.patch("unipi_control.modbus.ModbusCacheData.scan")
+        mock_modbus_cache_data_scan: MagicMock = mocker.patch(
+            "unipi_control.modbus.ModbusCacheData.scan", return_value={}
+        )
 
-        MeterFeaturesMqttPlugin.PUBLISH_RUNNING = PropertyMock(side_effect=[True, False])
-        MeterFeaturesMqttPlugin.scan_interval = 25e-3
+        ModbusPoller.POLL_RUNNING = PropertyMock(side_effect=[True, False])
+        MeterFeaturesMqttPlugin.PUBLISH_RUNNING = PropertyMock(side_effect=[False])
+
+        events: EventBus = EventBus()
+        poller: ModbusPoller = ModbusPoller(neuron, events)
+        await poller.poll("serial", sleep=25e-3)
 
         tasks: Set[Task] = set()
 
-        await MeterFeaturesMqttPlugin(neuron, mock_mqtt_client).init_tasks(tasks)
+        await MeterFeaturesMqttPlugin(neuron, mock_mqtt_client, events).init_tasks(tasks)
         await asyncio.gather(*tasks)
 
         for task in tasks:
@@ -121,3 +202,68 @@ class TestHappyPathMeterFeaturesMqttPlugin:
         assert "[MQTT] [mocked_unipi/meter/maximum_current_demand_1/get] Publishing message: 0.71" in logs
         assert "[MQTT] [mocked_unipi/meter/total_active_energy_1/get] Publishing message: 4.42" in logs
         assert "[MQTT] [mocked_unipi/meter/total_reactive_energy_1/get] Publishing message: 3.03" in logs
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        "config_loader", [(CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT)], indirect=True
+    )
+    async def test_replay_latest_state(self, neuron: Neuron) -> None:
+        """Test only the latest state per topic is published after (re)connect and newer changes follow."""
+        mock_mqtt_client: AsyncMock = AsyncMock(spec=Client)
+        meter: Union[DigitalInput, DigitalOutput, Led, Relay, EastronMeter] = neuron.features.by_feature_id("voltage_1")
+
+        assert isinstance(meter, EastronMeter)
+
+        events: EventBus = EventBus()
+
+        # Changes while the broker was not connected
+        for payload in (235.2, 235.7, 236.5):
+            events.publish(MeterValueChanged(topic="mocked_unipi/meter/voltage_1/get", payload=payload, feature=meter))
+
+        MeterFeaturesMqttPlugin.PUBLISH_RUNNING = PropertyMock(side_effect=[True, False])
+
+        plugin: MeterFeaturesMqttPlugin = MeterFeaturesMqttPlugin(neuron, mock_mqtt_client, events)
+        publish_task: Task = asyncio.create_task(plugin._publish())  # noqa: SLF001
+        await asyncio.sleep(0)
+
+        events.publish(MeterValueChanged(topic="mocked_unipi/meter/voltage_1/get", payload=237.1, feature=meter))
+        await publish_task
+
+        assert mock_mqtt_client.publish.mock_calls == [
+            call(topic="mocked_unipi/meter/voltage_1/get", payload=236.5, qos=1, retain=True),
+            call(topic="mocked_unipi/meter/voltage_1/get", payload=237.1, qos=1, retain=True),
+        ]
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        "config_loader", [(CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT)], indirect=True
+    )
+    async def test_cancel_publish(self, neuron: Neuron) -> None:
+        """Test the messages in flight are cancelled with the publish task on disconnect."""
+
+        async def publish(topic: str, payload: float, qos: int, retain: bool) -> None:  # noqa: ARG001
+            await asyncio.Event().wait()
+
+        mock_mqtt_client: AsyncMock = AsyncMock(spec=Client)
+        mock_mqtt_client.publish.side_effect = publish
+        meter: Union[DigitalInput, DigitalOutput, Led, Relay, EastronMeter] = neuron.features.by_feature_id("voltage_1")
+
+        assert isinstance(meter, EastronMeter)
+
+        events: EventBus = EventBus()
+        events.publish(MeterValueChanged(topic="mocked_unipi/meter/voltage_1/get", payload=235.2, feature=meter))
+
+        MeterFeaturesMqttPlugin.PUBLISH_RUNNING = PropertyMock(return_value=True)
+
+        plugin: MeterFeaturesMqttPlugin = MeterFeaturesMqttPlugin(neuron, mock_mqtt_client, events)
+        publish_task: Task = asyncio.create_task(plugin._publish())  # noqa: SLF001
+        await asyncio.sleep(0)
+
+        assert len(plugin.publisher._in_flight) == 1  # noqa: SLF001
+
+        publish_task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await publish_task
+
+        assert plugin.publisher._in_flight == set()  # noqa: SLF001
@@ -0,0 +1,103 @@
+"""Unit tests for the windowed MQTT publisher."""
+
+import asyncio
+from asyncio import Event
+from typing import List
+from typing import Tuple
+from unittest.mock import AsyncMock
+
+import pytest
+from _pytest.logging import LogCaptureFixture
+from aiomqtt import Client
+from aiomqtt import MqttError
+
+from unipi_control.mqtt.publisher import MqttPublisher
+from unipi_control.mqtt.publisher import PUBLISH_STATS
+
+
+class TestHappyPathMqttPublisher:
+    @pytest.mark.asyncio()
+    async def test_window(self, caplog: LogCaptureFixture) -> None:
+        """Test publishes only wait if the window is full and messages with the same topic keep their order."""
+        acknowledge: Event = Event()
+        sent: List[Tuple[str, str]] = []
+
+        async def publish(topic: str, payload: str, qos: int, retain: bool) -> None:  # noqa: ARG001
+            sent.append((topic, payload))
+            await acknowledge.wait()
+
+        mock_mqtt_client: AsyncMock = AsyncMock(spec=Client)
+        mock_mqtt_client.publish.side_effect = publish
+
+        PUBLISH_STATS.reset()
+        publisher: MqttPublisher = MqttPublisher(mock_mqtt_client, window=3)
+
+        await publisher.publish("unipi/input/di_1_01/get", "ON")
+        await publisher.publish("unipi/input/di_1_02/get", "ON")
+        await publisher.publish("unipi/input/di_1_01/get", "OFF")
+        await asyncio.sleep(0)
+
+        # The second message of di_1_01 waits for the acknowledgement of the first message.
+        assert sent == [("unipi/input/di_1_01/get", "ON"), ("unipi/input/di_1_02/get", "ON")]
+
+        window_full: asyncio.Task = asyncio.create_task(publisher.publish("unipi/input/di_1_03/get", "ON"))
+        await asyncio.sleep(0)
+
+        assert window_full.done() is False
+
+        acknowledge.set()
+        await window_full
+        await publisher.flush()
+
+        assert sent == [
+            ("unipi/input/di_1_01/get", "ON"),
+            ("unipi/input/di_1_02/get", "ON"),
+            ("unipi/input/di_1_01/get", "OFF"),
+            ("unipi/input/di_1_03/get", "ON"),
+        ]
+        assert PUBLISH_STATS.published == 4
+        assert PUBLISH_STATS.max_in_flight == 3
+        assert PUBLISH_STATS.window_full == 1
+
+        PUBLISH_STATS.log()
+        logs: List[str] = [record.getMessage() for record in caplog.records]
+
+        assert any(log.startswith("[MQTT] 4 message(s) published, ") for log in logs)
+        assert any(log.endswith("max. 3 in flight, window full 1 time(s).") for log in logs)
+
+    @pytest.mark.asyncio()
+    async def test_cancel(self) -> None:
+        """Test messages in flight are cancelled and free the window."""
+
+        async def publish(topic: str, payload: str, qos: int, retain: bool) -> None:  # noqa: ARG001
+            await asyncio.Event().wait()
+
+        mock_mqtt_client: AsyncMock = AsyncMock(spec=Client)
+        mock_mqtt_client.publish.side_effect = publish
+
+        publisher: MqttPublisher = MqttPublisher(mock_mqtt_client, window=2)
+
+        await publisher.publish("unipi/input/di_1_01/get", "ON")
+        await publisher.publish("unipi/input/di_1_02/get", "ON")
+        await asyncio.sleep(0)
+        await publisher.cancel()
+
+        assert publisher._in_flight == set()  # noqa: SLF001
+        assert publisher._last_by_topic == {}  # noqa: SLF001
+        assert publisher._semaphore.locked() is False  # noqa: SLF001
+
+
+class TestUnhappyPathMqttPublisher:
+    @pytest.mark.asyncio()
+    async def test_publish_error(self) -> None:
+        """Test a failed publish is raised on the next flush."""
+        mock_mqtt_client: AsyncMock = AsyncMock(spec=Client)
+        mock_mqtt_client.publish.side_effect = MqttError("Disconnected during message iteration")
+
+        publisher: MqttPublisher = MqttPublisher(mock_mqtt_client, window=16)
+        await publisher.publish("unipi/input/di_1_01/get", "ON")
+
+        with pytest.raises(MqttError) as error:
+            await publisher.flush()
+
+        assert str(error.value) == "Disconnected during message iteration"
@@ -0,0 +1,124 @@
+"""Unit tests for the MQTT topic router."""
+
+import asyncio
+from asyncio import Task
+from contextlib import AsyncExitStack
+from typing import List
+from typing import Set
+from typing import Tuple
+from unittest.mock import AsyncMock
+from unittest.mock import call
+
+import pytest
+from _pytest.logging import LogCaptureFixture
+from aiomqtt import Client
+
+from tests.conftest import mock_filtered_messages
+from unipi_control.mqtt.router import MqttTopicRouter
+
+
+class TestHappyPathMqttTopicRouter:
+    @pytest.mark.parametrize(
+        ("topic", "expected"),
+        [
+            ("unipi/relay/set", "unipi/+/set"),
+            ("unipi/relay/ro_2_01/set", "unipi/+/+/set"),
+            ("unipi/blind/cover/blind/position/set", "unipi/+/+/+/+/set"),
+            ("unipi/set", "unipi/set"),
+        ],
+    )
+    def test_get_topic_filter(self, topic: str, expected: str) -> None:
+        """Test the wildcard topic filter keeps the first and the last topic level."""
+        assert MqttTopicRouter.get_topic_filter(topic) == expected
+
+    @pytest.mark.asyncio()
+    async def test_dispatch(self, caplog: LogCaptureFixture) -> None:
+        """Test messages are dispatched to the handler of the topic and unknown topics are ignored."""
+        received: List[Tuple[str, str]] = []
+
+        async def handler(topic: str, value: str) -> None:
+            received.append((topic, value))
+
+        mock_mqtt_client: AsyncMock = AsyncMock(spec=Client)
+        mock_mqtt_client.filtered_messages.side_effect = mock_filtered_messages(
+            {
+                "unipi/relay/ro_2_01/set": [b"OFF", b"ON"],
+                "unipi/relay/ro_2_02/set": [b"ON"],
+                "unipi/relay/unknown/set": [b"ON"],
+                "unipi/relay/set": [b"{}"],
+            }
+        )
+
+        router: MqttTopicRouter = MqttTopicRouter(mock_mqtt_client)
+        router.add_handler("unipi/relay/ro_2_01/set", handler)
+        router.add_handler("unipi/relay/ro_2_02/set", handler)
+        router.add_handler("unipi/relay/set", handler)
+
+        async with AsyncExitStack() as stack:
+            tasks: Set[Task] = set()
+
+            await router.init_tasks(stack, tasks)
+            await asyncio.gather(*tasks)
+
+        logs: List[str] = [record.getMessage() for record in caplog.records]
+
+        assert mock_mqtt_client.subscribe.call_args_list == [
+            call([("unipi/+/+/set", 0), ("unipi/+/set", 0)]),
+        ]
+        assert sorted(received) == [
+            ("unipi/relay/ro_2_01/set", "OFF"),
+            ("unipi/relay/ro_2_01/set", "ON"),
+            ("unipi/relay/ro_2_02/set", "ON"),
+            ("unipi/relay/set", "{}"),
+        ]
+        assert "[MQTT] Subscribe topic unipi/+/+/set" in logs
+        assert "[MQTT] Subscribe topic unipi/+/set" in logs
+
+    @pytest.mark.asyncio()
+    async def test_dispatch_slow_handler(self) -> None:
+        """Test a slow handler delays only the messages of its own topic and is cancelled on disconnect."""
+        received: List[Tuple[str, str]] = []
+
+        async def slow_handler(topic: str, value: str) -> None:
+            await asyncio.Event().wait()
+            received.append((topic, value))
+
+        async def handler(topic: str, value: str) -> None:
+            received.append((topic, value))
+
+        mock_mqtt_client: AsyncMock = AsyncMock(spec=Client)
+        mock_mqtt_client.filtered_messages.side_effect = mock_filtered_messages(
+            {
+                "unipi/cover/blind/set": [b"OPEN", b"STOP"],
+                "unipi/relay/ro_2_01/set": [b"ON"],
+            }
+        )
+
+        router: MqttTopicRouter = MqttTopicRouter(mock_mqtt_client)
+        router.add_handler("unipi/cover/blind/set", slow_handler)
+        router.add_handler("unipi/relay/ro_2_01/set", handler)
+
+        async with AsyncExitStack() as stack:
+            tasks: Set[Task] = set()
+
+            await router.init_tasks(stack, tasks)
+            await asyncio.gather(*tasks)
+            await asyncio.sleep(0)
+
+            assert received == [("unipi/relay/ro_2_01/set", "ON")]
+
+        assert router._handler_tasks == {}  # noqa: SLF001
+        assert received == [("unipi/relay/ro_2_01/set", "ON")]
+
+    @pytest.mark.asyncio()
+    async def test_init_tasks_without_handlers(self) -> None:
+        """Test nothing is subscribed without handlers."""
+        mock_mqtt_client: AsyncMock = AsyncMock(spec=Client)
+
+        async with AsyncExitStack() as stack:
+            tasks: Set[Task] = set()
+
+            await MqttTopicRouter(mock_mqtt_client).init_tasks(stack, tasks)
+
+        assert not tasks
+        mock_mqtt_client.subscribe.assert_not_called()
@@ -26,16 +26,24 @@ from tests.unit.test_config_data import CONFIG_DUPLICATE_MODBUS_UNIT
 from tests.unit.test_config_data import CONFIG_DUPLICATE_OBJECT_ID
 from tests.unit.test_config_data import CONFIG_INVALID
 from tests.unit.test_config_data import CONFIG_INVALID_COVER_ID
+from tests.unit.test_config_data import CONFIG_INVALID_COVER_POSITION_UPDATE_INTERVAL
 from tests.unit.test_config_data import CONFIG_INVALID_COVER_TYPE
 from tests.unit.test_config_data import CONFIG_INVALID_DEVICE_CLASS
 from tests.unit.test_config_data import CONFIG_INVALID_DEVICE_NAME
+from tests.unit.test_config_data import CONFIG_INVALID_FEATURE_DEADBAND
 from tests.unit.test_config_data import CONFIG_INVALID_FEATURE_ID
+from tests.unit.test_config_data import CONFIG_INVALID_FEATURE_PRECISION
 from tests.unit.test_config_data import CONFIG_INVALID_FEATURE_TYPE
 from tests.unit.test_config_data import CONFIG_INVALID_HOMEASSISTANT_DISCOVERY_PREFIX
 from tests.unit.test_config_data import CONFIG_INVALID_LOG_LEVEL
 from tests.unit.test_config_data import CONFIG_INVALID_MODBUS_BAUD_RATE
+from tests.unit.test_config_data import CONFIG_INVALID_MODBUS_MAX_REGISTER_GAP
 from tests.unit.test_config_data import CONFIG_INVALID_MODBUS_PARITY
+from tests.unit.test_config_data import CONFIG_INVALID_MODBUS_POLLING_INTERVAL
+from tests.unit.test_config_data import CONFIG_INVALID_MODBUS_SCAN_BUDGET
+from tests.unit.test_config_data import CONFIG_INVALID_MODBUS_UNIT_PRIORITY
 from tests.unit.test_config_data import CONFIG_INVALID_MQTT_PORT_TYPE
+from tests.unit.test_config_data import CONFIG_INVALID_MQTT_PUBLISH_WINDOW
 from tests.unit.test_config_data import CONFIG_INVALID_PERSISTENT_TMP_DIR
 from tests.unit.test_config_data import CONFIG_LOGGING_LEVEL_ERROR
 from tests.unit.test_config_data import CONFIG_LOGGING_LEVEL_INFO
@@ -283,8 +291,8 @@ class TestUnhappyPathConfig:
                 (CONFIG_MISSING_COVER_KEY, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
                 "[COVER] Required key 'object_id' is missing! "
                 "CoverConfig(object_id='', friendly_name='MOCKED_FRIENDLY_NAME - BLIND', suggested_area='', "
-                "device_class='blind', cover_run_time=35.5, tilt_change_time=1.5, cover_up='ro_3_01', "
-                "cover_down='ro_3_02')",
+                "device_class='blind', cover_run_time=35.5, tilt_change_time=1.5, position_update_interval=1.0, "
+                "cover_up='ro_3_01', cover_down='ro_3_02')",
             ),
             (
                 (CONFIG_DUPLICATE_COVERS_CIRCUITS, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
@@ -314,6 +322,26 @@ class TestUnhappyPathConfig:
                 "[FEATURE] Invalid value 'invalid id' in 'object_id'. "
                 "The following characters are prohibited: a-z 0-9 -_",
             ),
+            (
+                (CONFIG_INVALID_FEATURE_DEADBAND, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
+                "[FEATURE] Invalid value '-1.0' in 'deadband'. The value must not be negative.",
+            ),
+            (
+                (CONFIG_INVALID_FEATURE_PRECISION, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
+                "[FEATURE] Invalid value '-1' in 'precision'. The precision must not be negative.",
+            ),
+            (
+                (CONFIG_INVALID_MQTT_PUBLISH_WINDOW, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
+                "[MQTT] Invalid value '0' in 'publish_window'. The publish window must be at least 1.",
+            ),
+            (
+                (
+                    CONFIG_INVALID_COVER_POSITION_UPDATE_INTERVAL,
+                    HARDWARE_DATA_CONTENT,
+                    EXTENSION_HARDWARE_DATA_CONTENT,
+                ),
+                "[COVER] Invalid value '-1.0' in 'position_update_interval'. The value must not be negative.",
+            ),
             (
                 (CONFIG_INVALID_MODBUS_BAUD_RATE, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
                 "[MODBUS] Invalid baud rate '2401'. "
@@ -323,6 +351,22 @@ class TestUnhappyPathConfig:
                 (CONFIG_INVALID_MODBUS_PARITY, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
                 "[MODBUS] Invalid value 'S' in 'parity'. The following parity options are allowed: E O N.",
             ),
+            (
+                (CONFIG_INVALID_MODBUS_MAX_REGISTER_GAP, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
+                "[MODBUS] Invalid value '125' in 'max_register_gap'. The register gap must be between 0 and 124.",
+            ),
+            (
+                (CONFIG_INVALID_MODBUS_POLLING_INTERVAL, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
+                "[MODBUS] Invalid value '0.0' in 'slow'. The polling interval must be greater than 0.",
+            ),
+            (
+                (CONFIG_INVALID_MODBUS_SCAN_BUDGET, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
+                "[MODBUS] Invalid value '0.0' in 'scan_budget'. The scan budget must be greater than 0.",
+            ),
+            (
+                (CONFIG_INVALID_MODBUS_UNIT_PRIORITY, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
+                "[MODBUS] Invalid value '11' in 'priority' for unit '1'. The priority must be between 1 and 10.",
+            ),
             (
                 (CONFIG_DUPLICATE_MODBUS_UNIT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
                 "[MODBUS] Duplicate modbus unit '1' found in 'units'!",
@@ -214,6 +214,50 @@ features:
 logging:
   level: debug"""
 
+CONFIG_INVALID_FEATURE_DEADBAND: Final[
+    str
+] = """device_info:
+  name: MOCKED UNIPI
+features:
+  voltage_1:
+    deadband: -1
+logging:
+  level: debug"""
+
+CONFIG_INVALID_MQTT_PUBLISH_WINDOW: Final[
+    str
+] = """device_info:
+  name: MOCKED UNIPI
+mqtt:
+  publish_window: 0
+logging:
+  level: debug"""
+
+CONFIG_INVALID_COVER_POSITION_UPDATE_INTERVAL: Final[
+    str
+] = """device_info:
+  name: MOCKED UNIPI
+covers:
+  - object_id: MOCKED_BLIND_TOPIC_NAME
+    friendly_name: MOCKED_FRIENDLY_NAME - BLIND
+    device_class: blind
+    cover_run_time: 35.5
+    position_update_interval: -1
+    cover_up: ro_3_01
+    cover_down: ro_3_02
+logging:
+  level: debug"""
+
+CONFIG_INVALID_FEATURE_PRECISION: Final[
+    str
+] = """device_info:
+  name: MOCKED UNIPI
+features:
+  voltage_1:
+    precision: -1
+logging:
+  level: debug"""
+
 CONFIG_INVALID_MODBUS_BAUD_RATE: Final[
     str
 ] = """device_info:
@@ -234,6 +278,47 @@ modbus_serial:
 logging:
   level: debug"""
 
+CONFIG_INVALID_MODBUS_MAX_REGISTER_GAP: Final[
+    str
+] = """device_info:
+  name: MOCKED UNIPI
+modbus_tcp:
+  max_register_gap: 125
+logging:
+  level: debug"""
+
+CONFIG_INVALID_MODBUS_POLLING_INTERVAL: Final[
+    str
+] = """device_info:
+  name: MOCKED UNIPI
+modbus_serial:
+  polling:
+    slow: 0
+logging:
+  level: debug"""
+
+CONFIG_INVALID_MODBUS_SCAN_BUDGET: Final[
+    str
+] = """device_info:
+  name: MOCKED UNIPI
+modbus_serial:
+  scan_budget: 0
+logging:
+  level: debug"""
+
+CONFIG_INVALID_MODBUS_UNIT_PRIORITY: Final[
+    str
+] = """device_info:
+  name: MOCKED UNIPI
+modbus_serial:
+  units:
+    - unit: 1
+      device_name: MOCKED Eastron SDM120M
+      identifier: Eastron_SDM120M
+      priority: 11
+logging:
+  level: debug"""
+
 CONFIG_DUPLICATE_MODBUS_UNIT: Final[
     str
 ] = """device_info:
@@ -0,0 +1,110 @@
+"""Unit tests for the event bus."""
+
+import asyncio
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+from _pytest.logging import LogCaptureFixture
+
+from unipi_control.events import EventBus
+from unipi_control.events import EventSubscription
+from unipi_control.events import FeatureStateChanged
+from unipi_control.events import MeterValueChanged
+
+
+class TestHappyPathEventBus:
+    @pytest.mark.asyncio()
+    async def test_subscription(self) -> None:
+        """Test subscriptions get all new events of their event types in publish order."""
+        feature: MagicMock = MagicMock()
+        meter: MagicMock = MagicMock()
+        events: EventBus = EventBus(size=4)
+
+        features_subscription: EventSubscription = events.subscribe(FeatureStateChanged)
+        all_subscription: EventSubscription = events.subscribe(FeatureStateChanged, MeterValueChanged)
+
+        events.publish(FeatureStateChanged(topic="unipi/input/di_1_01/get", payload="ON", feature=feature))
+        events.publish(MeterValueChanged(topic="unipi/meter/voltage_1/get", payload=235.2, feature=meter))
+        events.publish(FeatureStateChanged(topic="unipi/input/di_1_01/get", payload="OFF", feature=feature))
+
+        assert await features_subscription.wait() == [
+            FeatureStateChanged(topic="unipi/input/di_1_01/get", payload="ON", feature=feature),
+            FeatureStateChanged(topic="unipi/input/di_1_01/get", payload="OFF", feature=feature),
+        ]
+        assert await all_subscription.wait() == [
+            FeatureStateChanged(topic="unipi/input/di_1_01/get", payload="ON", feature=feature),
+            MeterValueChanged(topic="unipi/meter/voltage_1/get", payload=235.2, feature=meter),
+            FeatureStateChanged(topic="unipi/input/di_1_01/get", payload="OFF", feature=feature),
+        ]
+
+        # Events of other event types do not wake up the subscription.
+        wait_task: asyncio.Task = asyncio.create_task(features_subscription.wait())
+        events.publish(MeterValueChanged(topic="unipi/meter/voltage_1/get", payload=235.7, feature=meter))
+        await asyncio.sleep(0)
+
+        assert wait_task.done() is False
+
+        events.publish(FeatureStateChanged(topic="unipi/input/di_1_02/get", payload="ON", feature=feature))
+
+        assert await wait_task == [
+            FeatureStateChanged(topic="unipi/input/di_1_02/get", payload="ON", feature=feature),
+        ]
+
+    def test_latest(self) -> None:
+        """Test new subscriptions start with the latest event per topic of their event types."""
+        feature: MagicMock = MagicMock()
+        meter: MagicMock = MagicMock()
+        events: EventBus = EventBus(size=4)
+
+        events.publish(FeatureStateChanged(topic="unipi/input/di_1_01/get", payload="ON", feature=feature))
+        events.publish(FeatureStateChanged(topic="unipi/input/di_1_01/get", payload="OFF", feature=feature))
+        events.publish(MeterValueChanged(topic="unipi/meter/voltage_1/get", payload=235.2, feature=meter))
+
+        subscription: EventSubscription = events.subscribe(FeatureStateChanged)
+
+        assert subscription.latest() == [
+            FeatureStateChanged(topic="unipi/input/di_1_01/get", payload="OFF", feature=feature),
+        ]
+        assert subscription.sequence == 3
+
+    @pytest.mark.asyncio()
+    async def test_topic_subscription(self) -> None:
+        """Test topic subscriptions only get the events of their topic."""
+        feature: MagicMock = MagicMock()
+        events: EventBus = EventBus(size=4)
+        subscription: EventSubscription = events.subscribe(FeatureStateChanged, topic="unipi/input/di_1_02/get")
+
+        wait_task: asyncio.Task = asyncio.create_task(subscription.wait())
+        events.publish(FeatureStateChanged(topic="unipi/input/di_1_01/get", payload="ON", feature=feature))
+        await asyncio.sleep(0)
+
+        assert wait_task.done() is False
+
+        events.publish(FeatureStateChanged(topic="unipi/input/di_1_02/get", payload="ON", feature=feature))
+
+        assert await wait_task == [
+            FeatureStateChanged(topic="unipi/input/di_1_02/get", payload="ON", feature=feature),
+        ]
+
+    @pytest.mark.asyncio()
+    async def test_overwritten_events(self, caplog: LogCaptureFixture) -> None:
+        """Test subscriptions that fell behind get the latest event per topic."""
+        feature: MagicMock = MagicMock()
+        events: EventBus = EventBus(size=2)
+        subscription: EventSubscription = events.subscribe(FeatureStateChanged)
+
+        for payload in ("ON", "OFF", "ON"):
+            events.publish(FeatureStateChanged(topic="unipi/input/di_1_01/get", payload=payload, feature=feature))
+
+        events.publish(FeatureStateChanged(topic="unipi/input/di_1_02/get", payload="ON", feature=feature))
+
+        assert await subscription.wait() == [
+            FeatureStateChanged(topic="unipi/input/di_1_01/get", payload="ON", feature=feature),
+            FeatureStateChanged(topic="unipi/input/di_1_02/get", payload="ON", feature=feature),
+        ]
+        assert subscription.sequence == 4
+
+        logs: List[str] = [record.getMessage() for record in caplog.records]
+
+        assert "[MQTT] 2 event(s) were overwritten. Replaying the latest event per topic." in logs
@@ -1,23 +1,34 @@
 """Unit tests for input and output features."""
 
+from typing import Dict
+from typing import List
 from typing import NamedTuple
 from typing import Optional
+from typing import Tuple
 from typing import Union
 from unittest.mock import MagicMock
 
 import pytest
 from pymodbus.pdu import ModbusResponse
+from pytest_mock import MockerFixture
 
 from tests.conftest import MockModbusClient
 from tests.conftest_data import CONFIG_CONTENT
 from tests.conftest_data import EXTENSION_HARDWARE_DATA_CONTENT
 from tests.conftest_data import HARDWARE_DATA_CONTENT
+from unipi_control.config import FeatureConfig
+from unipi_control.config import HardwareType
 from unipi_control.features.extensions import EastronMeter
+from unipi_control.features.extensions import MeterDecoder
+from unipi_control.features.extensions import MeterDecoderBlock
 from unipi_control.features.neuron import DigitalInput
 from unipi_control.features.neuron import DigitalOutput
 from unipi_control.features.neuron import Led
 from unipi_control.features.neuron import Relay
+from unipi_control.features.utils import PublishPolicy
 from unipi_control.helpers.exception import ConfigError
+from unipi_control.helpers.typing import HardwareDefinition
+from unipi_control.modbus import RegisterChange
 from unipi_control.neuron import Neuron
 
 
@@ -96,6 +107,7 @@ class TestHappyPathFeatures:
             assert feature.val_coil == expected.coil
             assert feature.payload == ("ON" if expected.value == 1 else "OFF")
             assert await feature.set_state(False)
+            assert feature.value == 0
         elif isinstance(feature, EastronMeter):
             assert feature.payload == expected.value
 
@@ -124,6 +136,174 @@ class TestHappyPathFeatures:
 
         assert feature.sw_version == expected
 
+    @pytest.mark.parametrize(
+        ("config_loader", "feature_types", "expected"),
+        [
+            (
+                (CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
+                ["RO", "METER"],
+                ["ro_2_01", "ro_2_02", "ro_2_14", "current_1"],
+            ),
+            (
+                (CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
+                ["DI"],
+                [],
+            ),
+        ],
+        indirect=["config_loader"],
+    )
+    def test_changed_by_dirty_registers(self, neuron: Neuron, feature_types: List[str], expected: List[str]) -> None:
+        """Test changed features are found by the changed bits of the dirty registers."""
+        dirty_registers: Dict[Tuple[int, int], RegisterChange] = {
+            (0, 101): RegisterChange(value=0b0010_0000_0000_0001, changed_bits=0b0010_0000_0000_0011),
+            (1, 6): RegisterChange(value=0x3E94, changed_bits=0xFFFF),
+        }
+
+        features: List[Union[DigitalInput, DigitalOutput, Led, Relay, EastronMeter]] = list(
+            neuron.features.changed_by_dirty_registers(dirty_registers, feature_types=feature_types)
+        )
+
+        assert [feature.feature_id for feature in features] == expected
+        assert [feature.payload for feature in features if feature.hardware.feature_type.short_name == "RO"] == (
+            ["ON", "OFF", "ON"] if expected else []
+        )
+        assert not list(neuron.features.changed_by_dirty_registers(dirty_registers, feature_types=feature_types))
+
+    @pytest.mark.parametrize(
+        ("config_loader", "feature_id", "register"),
+        [
+            ((CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT), "ro_2_14", (0, 101)),
+            ((CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT), "active_power_1", (1, 12)),
+        ],
+        indirect=["config_loader"],
+    )
+    def test_value_decoded_once_per_generation(
+        self, mocker: MockerFixture, neuron: Neuron, feature_id: str, register: Tuple[int, int]
+    ) -> None:
+        """Test the feature value is only decoded again if the register cache changed."""
+        feature: Union[DigitalInput, DigitalOutput, Led, Relay, EastronMeter] = neuron.features.by_feature_id(
+            feature_id
+        )
+        get_register_view: MagicMock = mocker.patch.object(
+            neuron.modbus_cache_data, "get_register_view", wraps=neuron.modbus_cache_data.get_register_view
+        )
+
+        value: Optional[Union[float, int]] = feature.value
+        call_count: int = get_register_view.call_count
+
+        assert call_count
+        assert feature.changed
+        assert feature.payload is not None
+        assert feature.value == value
+        assert get_register_view.call_count == call_count
+
+        unit, address = register
+        neuron.modbus_cache_data.registers.store_block(unit=unit, start=address, words=[0, 0])
+
+        assert feature.value == 0
+        assert feature.changed
+        assert get_register_view.call_count > call_count
+
+    @pytest.mark.parametrize(
+        "config_loader", [(CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT)], indirect=True
+    )
+    def test_meter_decoder(self, neuron: Neuron) -> None:
+        """Test all meter values of a register block are decoded with one precompiled struct."""
+        meter: Union[DigitalInput, DigitalOutput, Led, Relay, EastronMeter] = neuron.features.by_feature_id(
+            "active_power_1"
+        )
+
+        assert isinstance(meter, EastronMeter)
+
+        decoder: MeterDecoder = meter.modbus.decoder
+        blocks: Dict[int, MeterDecoderBlock] = {block.start_reg: block for block in decoder.blocks}
+
+        assert blocks[12].decoder.format == ">f"
+        assert blocks[70].val_regs == [70, 72, 74, 76, 78]
+        assert blocks[70].decoder.format == ">fffff"
+
+        # 1.5 and -2.25 as big endian 32-bit floats
+        neuron.modbus_cache_data.registers.store_block(unit=1, start=70, words=[0x3FC0, 0, 0xC010, 0, 0, 0, 0, 0])
+
+        assert decoder.value(70) == 1.5
+        assert decoder.value(72) == -2.25
+        assert decoder.value(74) == 0
+        assert decoder.value(1) is None
+
+        decoder.set_precision(70, 0)
+
+        assert decoder.value(70) == 2
+        assert decoder.value(72) == -2.25
+
+    @pytest.mark.parametrize(
+        ("features_config", "published", "expected"),
+        [
+            # value, seconds since the last publish, should publish
+            (FeatureConfig(), [(230.0, 0), (230.0, 1), (230.01, 1)], [True, False, True]),
+            (FeatureConfig(deadband=0.5), [(230.0, 0), (230.5, 1), (229.4, 1)], [True, False, True]),
+            (FeatureConfig(deadband_percent=1), [(200.0, 0), (201.9, 1), (197.9, 1)], [True, False, True]),
+            (FeatureConfig(min_interval=10), [(230.0, 0), (231.0, 5), (231.0, 10)], [True, False, True]),
+            (FeatureConfig(max_interval=60), [(230.0, 0), (230.0, 59), (230.0, 60)], [True, False, True]),
+            (FeatureConfig(deadband=1, max_interval=60), [(230.0, 0), (230.4, 30), (230.4, 60)], [True, False, True]),
+        ],
+    )
+    def test_publish_policy(
+        self, features_config: FeatureConfig, published: List[Tuple[float, float]], expected: List[bool]
+    ) -> None:
+        """Test the deadband, minimum interval and maximum interval of the publish policy."""
+        publish_policy: PublishPolicy = PublishPolicy(features_config)
+        results: List[bool] = []
+        now: float = 0
+
+        for value, elapsed in published:
+            now = (publish_policy.published_at or 0) + elapsed
+            results.append(publish_policy.should_publish(value, now))
+
+            if results[-1]:
+                publish_policy.published(value, now)
+
+        assert results == expected
+        assert publish_policy.is_timed == bool(features_config.min_interval or features_config.max_interval)
+
+    @pytest.mark.parametrize(
+        "config_loader", [(CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT)], indirect=True
+    )
+    def test_meter_decoder_format(self, neuron: Neuron) -> None:
+        """Test the struct format skips registers between meter values and values outside of the register blocks."""
+        definition: HardwareDefinition = HardwareDefinition(
+            unit=5,
+            hardware_type=HardwareType.EXTENSION,
+            device_name=None,
+            suggested_area=None,
+            manufacturer=None,
+            model="MOCKED_METER",
+            modbus_register_blocks=[{"start_reg": 0, "count": 8, "slave": None, "poll": "normal"}],
+            modbus_features=[
+                {"feature_type": "METER", "val_reg": val_reg, "major_group": 0, "count": 2, "val_coil": None}
+                for val_reg in (4, 0, 20)
+            ],
+        )
+
+        decoder: MeterDecoder = MeterDecoder(cache=neuron.modbus_cache_data, definition=definition)
+
+        assert [(block.start_reg, block.count, block.decoder.format) for block in decoder.blocks] == [
+            (0, 8, ">f4xf"),
+            (20, 2, ">f"),
+        ]
+
+    @pytest.mark.parametrize(
+        "config_loader", [(CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT)], indirect=True
+    )
+    def test_feature_map_indexes(self, neuron: Neuron) -> None:
+        """Test features are found by feature id and the cover circuits are collected."""
+        feature: Union[DigitalInput, DigitalOutput, Led, Relay, EastronMeter] = neuron.features.by_feature_id(
+            "ro_2_01", feature_types=["RO"]
+        )
+
+        assert feature.feature_id == "ro_2_01"
+        assert feature in neuron.features.by_feature_types(["RO"])
+        assert neuron.features.cover_circuits == {"ro_3_01", "ro_3_02", "ro_3_03", "ro_3_04"}
+
 
 class TestUnhappyPathFeatures:
     @pytest.mark.parametrize(
@@ -133,7 +313,12 @@ class TestUnhappyPathFeatures:
                 (CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
                 "INVALID",
                 "[CONFIG] 'INVALID' not found in FeatureMap!",
-            )
+            ),
+            (
+                (CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
+                "di_2_15",
+                "[CONFIG] 'di_2_15' not found in FeatureMap!",
+            ),
         ],
         indirect=["config_loader"],
     )
@@ -1,29 +1,754 @@
 """Unit tests for modbus."""
 
 import asyncio
+import math
+import time
 from typing import Any
 from typing import Callable
+from typing import Dict
 from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Union
 from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
 from unittest.mock import PropertyMock
 
 import pytest
 from _pytest.logging import LogCaptureFixture
 from pymodbus.exceptions import ModbusException
+from pymodbus.exceptions import ModbusIOException
+from pymodbus.pdu import ModbusResponse
 from pytest_mock import MockerFixture
 
 from tests.conftest import ConfigLoader
 from tests.conftest import MockHardwareInfo
 from tests.conftest_data import CONFIG_CONTENT
+from tests.conftest_data import CONFIG_CONTENT_SERIAL_UNITS
 from tests.conftest_data import EXTENSION_HARDWARE_DATA_CONTENT
 from tests.conftest_data import HARDWARE_DATA_CONTENT
+from tests.conftest_data import HARDWARE_DATA_POLLING_CONTENT
 from unipi_control.config import Config
 from unipi_control.config import HardwareType
+from unipi_control.helpers.exception import ConfigError
 from unipi_control.helpers.typing import ModbusClient
+from unipi_control.helpers.typing import ModbusReadData
+from unipi_control.helpers.typing import ModbusRegisterBlock
+from unipi_control.helpers.typing import ModbusWriteData
+from unipi_control.helpers.typing import ModbusWriteMultipleData
+from unipi_control.modbus import MODBUS_PIPELINING_FAILURE_THRESHOLD
+from unipi_control.modbus import MODBUS_STATS
+from unipi_control.modbus import ModbusCacheData
+from unipi_control.modbus import ModbusCallStats
+from unipi_control.modbus import ModbusRegisterStore
+from unipi_control.modbus import ModbusSlaveHealth
+from unipi_control.modbus import RTUBusScheduler
+from unipi_control.modbus import RTUPollScheduler
+from unipi_control.modbus import RegisterChange
+from unipi_control.modbus import check_modbus_call
+from unipi_control.modbus import get_request_size
+from unipi_control.modbus import get_rtu_frame_gap
+from unipi_control.modbus import plan_coil_writes
+from unipi_control.modbus import plan_register_blocks
 from unipi_control.neuron import Neuron
 
 
+class MockPipelineModbusTcpClient:
+    """Modbus TCP client that answers concurrent requests like a real server."""
+
+    def __init__(self, pipelining: bool) -> None:
+        self.pipelining: bool = pipelining
+        self.in_flight: int = 0
+        self.max_in_flight: int = 0
+        self.read_addresses: List[int] = []
+
+    async def read_input_registers(self, address: int, count: int, slave: Optional[int]) -> MagicMock:  # noqa: ARG002
+        """Read input registers and fail on concurrent requests if pipelining is not supported."""
+        self.read_addresses.append(address)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            await asyncio.sleep(0)
+
+            if not self.pipelining and self.in_flight > 1:
+                raise asyncio.exceptions.TimeoutError
+
+            response: MagicMock = MagicMock(spec=ModbusResponse, registers=[address] * count)
+            response.isError.return_value = False
+
+            return response
+        finally:
+            self.in_flight -= 1
+
+
+class MockRTUModbusSerialClient:
+    """Modbus RTU client that records the slave of every request."""
+
+    def __init__(self) -> None:
+        self.read_slaves: List[int] = []
+        self.failing_slaves: Set[int] = set()
+
+    async def read_input_registers(self, address: int, count: int, slave: int) -> MagicMock:
+        """Read input registers from a slave."""
+        self.read_slaves.append(slave)
+        await asyncio.sleep(1e-3)
+
+        response: MagicMock = MagicMock(spec=ModbusResponse, registers=[address] * count)
+        response.isError.return_value = slave in self.failing_slaves
+
+        return response
+
+
+class TestHappyPathModbus:
+    @pytest.mark.parametrize(
+        ("modbus_register_blocks", "max_register_gap", "expected"),
+        [
+            (
+                [
+                    {"start_reg": 0, "count": 2, "slave": 1},
+                    {"start_reg": 2, "count": 3, "slave": 1},
+                    {"start_reg": 5, "count": 16, "slave": 1},
+                    {"start_reg": 1000, "count": 32, "slave": 1},
+                    {"start_reg": 100, "count": 35, "slave": 2},
+                    {"start_reg": 1100, "count": 29, "slave": 2},
+                ],
+                0,
+                [
+                    {"start_reg": 0, "count": 21, "slave": 1, "poll": "fast"},
+                    {"start_reg": 1000, "count": 32, "slave": 1, "poll": "fast"},
+                    {"start_reg": 100, "count": 35, "slave": 2, "poll": "fast"},
+                    {"start_reg": 1100, "count": 29, "slave": 2, "poll": "fast"},
+                ],
+            ),
+            (
+                [
+                    {"start_reg": 0, "count": 2},
+                    {"start_reg": 6, "count": 2},
+                    {"start_reg": 12, "count": 2},
+                    {"start_reg": 70, "count": 10},
+                ],
+                0,
+                [
+                    {"start_reg": 0, "count": 2, "slave": 1, "poll": "fast"},
+                    {"start_reg": 6, "count": 2, "slave": 1, "poll": "fast"},
+                    {"start_reg": 12, "count": 2, "slave": 1, "poll": "fast"},
+                    {"start_reg": 70, "count": 10, "slave": 1, "poll": "fast"},
+                ],
+            ),
+            (
+                [
+                    {"start_reg": 12, "count": 2},
+                    {"start_reg": 0, "count": 2},
+                    {"start_reg": 6, "count": 2},
+                    {"start_reg": 70, "count": 10},
+                ],
+                4,
+                [
+                    {"start_reg": 0, "count": 14, "slave": 1, "poll": "fast"},
+                    {"start_reg": 70, "count": 10, "slave": 1, "poll": "fast"},
+                ],
+            ),
+            (
+                [
+                    {"start_reg": 0, "count": 100},
+                    {"start_reg": 100, "count": 30},
+                    {"start_reg": 130, "count": 10},
+                ],
+                0,
+                [
+                    {"start_reg": 0, "count": 100, "slave": 1, "poll": "fast"},
+                    {"start_reg": 100, "count": 40, "slave": 1, "poll": "fast"},
+                ],
+            ),
+            (
+                [
+                    {"start_reg": 0, "count": 2, "slave": 1},
+                    {"start_reg": 2, "count": 3, "slave": 1, "poll": "normal"},
+                    {"start_reg": 5, "count": 16, "slave": 1, "poll": "normal"},
+                    {"start_reg": 1000, "count": 32, "slave": 1, "poll": "once"},
+                    {"start_reg": 100, "count": 35, "slave": 2},
+                    {"start_reg": 1100, "count": 29, "slave": 2, "poll": "once"},
+                ],
+                0,
+                [
+                    {"start_reg": 0, "count": 2, "slave": 1, "poll": "fast"},
+                    {"start_reg": 2, "count": 19, "slave": 1, "poll": "normal"},
+                    {"start_reg": 1000, "count": 32, "slave": 1, "poll": "once"},
+                    {"start_reg": 100, "count": 35, "slave": 2, "poll": "fast"},
+                    {"start_reg": 1100, "count": 29, "slave": 2, "poll": "once"},
+                ],
+            ),
+            (
+                [
+                    {"start_reg": 0, "count": 2, "poll": 5},
+                    {"start_reg": 2, "count": 2, "poll": 5},
+                    {"start_reg": 4, "count": 2, "poll": 10},
+                ],
+                0,
+                [
+                    {"start_reg": 4, "count": 2, "slave": 1, "poll": 10},
+                    {"start_reg": 0, "count": 4, "slave": 1, "poll": 5},
+                ],
+            ),
+        ],
+    )
+    def test_plan_register_blocks(
+        self,
+        modbus_register_blocks: List[ModbusRegisterBlock],
+        max_register_gap: int,
+        expected: List[ModbusRegisterBlock],
+    ) -> None:
+        """Test merging register blocks into the fewest reads within the Modbus limit."""
+        assert plan_register_blocks(modbus_register_blocks, unit=1, max_register_gap=max_register_gap) == expected
+
+    @pytest.mark.parametrize(
+        ("coils", "expected"),
+        [
+            ({}, []),
+            (
+                {(0, 101): False, (0, 0): True, (0, 100): True, (0, 103): True, (1, 104): False},
+                [
+                    {"address": 0, "values": [True], "slave": 0},
+                    {"address": 100, "values": [True, False], "slave": 0},
+                    {"address": 103, "values": [True], "slave": 0},
+                    {"address": 104, "values": [False], "slave": 1},
+                ],
+            ),
+        ],
+    )
+    def test_plan_coil_writes(
+        self, coils: Dict[Tuple[int, int], bool], expected: List[ModbusWriteMultipleData]
+    ) -> None:
+        """Test coalescing coil writes into one multiple coil write per contiguous coil range and slave."""
+        assert plan_coil_writes(coils) == expected
+
+    @pytest.mark.parametrize(
+        "config_loader", [(CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT)], indirect=True
+    )
+    def test_scan_plan(self, neuron: Neuron, caplog: LogCaptureFixture) -> None:
+        """Test scan plan is created and logged for every hardware definition."""
+        logs: List[str] = [record.getMessage() for record in caplog.get_records("setup")]
+
+        assert len(neuron.modbus_cache_data.scan_plan[0]) == 4
+        assert len(neuron.modbus_cache_data.scan_plan[1]) == 12
+        assert "[MODBUS] 4 register block(s) for unit 0 merged into 4 read(s) per scan." in logs
+        assert "[MODBUS] 13 register block(s) for unit 1 merged into 12 read(s) per scan." in logs
+
+    def test_register_store(self) -> None:
+        """Test registers are stored in place and read as zero-copy views."""
+        register_store: ModbusRegisterStore = ModbusRegisterStore()
+        register_store.allocate(unit=1, start=0, count=2)
+        register_store.allocate(unit=1, start=6, count=2)
+
+        assert register_store.view(unit=1, address=0, count=2) is None
+
+        assert register_store.store_block(unit=1, start=0, words=[1, 2]) == {
+            0: RegisterChange(value=1, changed_bits=0xFFFF),
+            1: RegisterChange(value=2, changed_bits=0xFFFF),
+        }
+        assert register_store.store_block(unit=1, start=6, words=[0, 8]) == {
+            6: RegisterChange(value=0, changed_bits=0xFFFF),
+            7: RegisterChange(value=8, changed_bits=0xFFFF),
+        }
+        view = register_store.view(unit=1, address=0, count=2)
+
+        assert view is not None
+        assert view.tolist() == [1, 2]
+        assert register_store.store_block(unit=1, start=0, words=[1, 4]) == {
+            1: RegisterChange(value=4, changed_bits=0b110)
+        }
+        assert register_store.generation == 3
+        assert register_store.store_block(unit=1, start=0, words=[1, 4]) == {}
+        assert register_store.generation == 3
+        assert view.tolist() == [1, 4]
+        assert register_store.view(unit=1, address=1, count=2) is None
+        assert register_store.view(unit=2, address=0, count=1) is None
+
+        register_store.store_block(unit=1, start=2, words=[5, 6, 7, 8])
+
+        assert len(register_store.segments[1]) == 1
+        assert register_store.view(unit=1, address=0, count=8).tolist() == [1, 4, 5, 6, 7, 8, 0, 8]
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        "config_loader", [(CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT)], indirect=True
+    )
+    async def test_write_register_bit(self, neuron: Neuron) -> None:
+        """Test written bits update the cached register and wake up the publisher."""
+        modbus_cache_data: ModbusCacheData = neuron.modbus_cache_data
+        register: int = modbus_cache_data.get_register(address=101, index=1, unit=0)[0]
+
+        assert register & 0x2000
+
+        modbus_cache_data.write_register_bit(scan_type="tcp", unit=0, address=101, mask=0x2000, value=True)
+
+        assert await modbus_cache_data.wait_for_writes("tcp", timeout=1e-3) == {}
+
+        modbus_cache_data.write_register_bit(scan_type="tcp", unit=0, address=101, mask=0x2000, value=False)
+        modbus_cache_data.write_register_bit(scan_type="tcp", unit=0, address=101, mask=0x1, value=True)
+
+        assert modbus_cache_data.get_register(address=101, index=1, unit=0) == [register & 0xDFFF | 0x1]
+        assert await modbus_cache_data.wait_for_writes("serial", timeout=1e-3) == {}
+        assert await modbus_cache_data.wait_for_writes("tcp", timeout=1) == {
+            (0, 101): RegisterChange(value=register & 0xDFFF | 0x1, changed_bits=0x2001)
+        }
+        assert await modbus_cache_data.wait_for_writes("tcp", timeout=1e-3) == {}
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        ("config_loader", "pipelining"),
+        [
+            ((CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT), True),
+            ((CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT), False),
+        ],
+        indirect=["config_loader"],
+    )
+    async def test_scan_pipelined(
+        self,
+        mocker: MockerFixture,
+        config_loader: ConfigLoader,
+        pipelining: bool,
+    ) -> None:
+        """Test TCP reads are pipelined and fall back to serial reads if the server does not support it."""
+        mock_hardware_info: PropertyMock = mocker.patch(
+            "unipi_control.config.HardwareInfo", new_callable=PropertyMock()
+        )
+        mock_hardware_info.return_value = MockHardwareInfo()
+
+        mock_modbus_tcp_client: MockPipelineModbusTcpClient = MockPipelineModbusTcpClient(pipelining=pipelining)
+        modbus_client = ModbusClient(tcp=mock_modbus_tcp_client, serial=AsyncMock())  # type: ignore[arg-type]
+        neuron: Neuron = Neuron(config=config_loader.get_config(), modbus_client=modbus_client)
+
+        dirty_registers: Dict[Tuple[int, int], RegisterChange] = await neuron.modbus_cache_data.scan(
+            "tcp", hardware_types=[HardwareType.NEURON]
+        )
+
+        assert dirty_registers == {
+            (0, address): RegisterChange(value=value, changed_bits=0xFFFF)
+            for address, value in ((0, 0), (1, 0), (20, 20), (100, 100), (101, 100), (200, 200), (201, 200))
+        }
+        assert mock_modbus_tcp_client.max_in_flight == 4
+        assert neuron.modbus_cache_data.pipelining is True
+        assert neuron.modbus_cache_data.pipelining_failures == (0 if pipelining else 1)
+        assert neuron.modbus_cache_data.get_register(address=0, index=2, unit=0) == [0, 0]
+        assert neuron.modbus_cache_data.get_register(address=20, index=1, unit=0) == [20]
+        assert neuron.modbus_cache_data.get_register(address=100, index=2, unit=0) == [100, 100]
+        assert neuron.modbus_cache_data.get_register(address=200, index=2, unit=0) == [200, 200]
+
+        # The serial retries don't count as failures of the slave.
+        assert neuron.modbus_cache_data.slave_health[0].failures == 0
+
+        # Fall back to serial reads after repeated evidence only.
+        for _ in range(MODBUS_PIPELINING_FAILURE_THRESHOLD - 1):
+            await neuron.modbus_cache_data.scan("tcp", hardware_types=[HardwareType.NEURON])
+
+        assert neuron.modbus_cache_data.pipelining is pipelining
+
+        mock_modbus_tcp_client.max_in_flight = 0
+        dirty_registers = await neuron.modbus_cache_data.scan("tcp", hardware_types=[HardwareType.NEURON])
+
+        assert dirty_registers == {}
+        assert mock_modbus_tcp_client.max_in_flight == (4 if pipelining else 1)
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        "config_loader", [(CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT)], indirect=True
+    )
+    async def test_scan_pipelining_probe(
+        self, mocker: MockerFixture, config_loader: ConfigLoader, caplog: LogCaptureFixture
+    ) -> None:
+        """Test disabled pipelining is probed again and enabled if the server supports it now."""
+        mock_hardware_info: PropertyMock = mocker.patch(
+            "unipi_control.config.HardwareInfo", new_callable=PropertyMock()
+        )
+        mock_hardware_info.return_value = MockHardwareInfo()
+
+        mock_modbus_tcp_client: MockPipelineModbusTcpClient = MockPipelineModbusTcpClient(pipelining=False)
+        modbus_client = ModbusClient(tcp=mock_modbus_tcp_client, serial=AsyncMock())  # type: ignore[arg-type]
+        neuron: Neuron = Neuron(config=config_loader.get_config(), modbus_client=modbus_client)
+        modbus_cache_data: ModbusCacheData = neuron.modbus_cache_data
+
+        for _ in range(MODBUS_PIPELINING_FAILURE_THRESHOLD):
+            await modbus_cache_data.scan("tcp", hardware_types=[HardwareType.NEURON])
+
+        assert modbus_cache_data.pipelining is False
+        assert modbus_cache_data.next_pipelining_probe > time.monotonic()
+
+        # A failed probe falls back immediately.
+        modbus_cache_data.next_pipelining_probe = 0
+        await modbus_cache_data.scan("tcp", hardware_types=[HardwareType.NEURON])
+
+        assert modbus_cache_data.pipelining is False
+        assert modbus_cache_data.next_pipelining_probe > time.monotonic()
+
+        mock_modbus_tcp_client.pipelining = True
+        mock_modbus_tcp_client.max_in_flight = 0
+        modbus_cache_data.next_pipelining_probe = 0
+        await modbus_cache_data.scan("tcp", hardware_types=[HardwareType.NEURON])
+
+        assert modbus_cache_data.pipelining is True
+        assert modbus_cache_data.pipelining_failures == 0
+        assert mock_modbus_tcp_client.max_in_flight == 4
+
+        logs: List[str] = [record.getMessage() for record in caplog.records]
+
+        assert "[MODBUS] TCP server does not support pipelining. Fall back to serial reads for 300.0 seconds." in logs
+        assert "[MODBUS] TCP server supports pipelining again." in logs
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        "config_loader",
+        [(CONFIG_CONTENT, HARDWARE_DATA_POLLING_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT)],
+        indirect=True,
+    )
+    async def test_scan_polling_tiers(self, mocker: MockerFixture, config_loader: ConfigLoader) -> None:
+        """Test only register blocks that are due are read."""
+        mock_hardware_info: PropertyMock = mocker.patch(
+            "unipi_control.config.HardwareInfo", new_callable=PropertyMock()
+        )
+        mock_hardware_info.return_value = MockHardwareInfo()
+
+        config: Config = config_loader.get_config()
+        config.modbus_tcp.polling.normal = 0.1
+
+        mock_modbus_tcp_client: MockPipelineModbusTcpClient = MockPipelineModbusTcpClient(pipelining=True)
+        modbus_client = ModbusClient(tcp=mock_modbus_tcp_client, serial=AsyncMock())  # type: ignore[arg-type]
+        neuron: Neuron = Neuron(config=config, modbus_client=modbus_client)
+
+        await neuron.modbus_cache_data.scan("tcp", hardware_types=[HardwareType.NEURON])
+
+        assert sorted(mock_modbus_tcp_client.read_addresses) == [0, 20, 100, 200]
+
+        mock_modbus_tcp_client.read_addresses = []
+        await neuron.modbus_cache_data.scan("tcp", hardware_types=[HardwareType.NEURON])
+
+        assert sorted(mock_modbus_tcp_client.read_addresses) == [0, 100]
+
+        mock_modbus_tcp_client.read_addresses = []
+        await asyncio.sleep(0.1)
+        await neuron.modbus_cache_data.scan("tcp", hardware_types=[HardwareType.NEURON])
+
+        assert sorted(mock_modbus_tcp_client.read_addresses) == [0, 20, 100]
+
+    @pytest.mark.parametrize(
+        ("baud_rate", "parity", "expected"),
+        [
+            (2400, "N", 3.5 * 10 / 2400),
+            (9600, "E", 3.5 * 11 / 9600),
+            (19200, "O", 3.5 * 11 / 19200),
+            (38400, "N", 1.75e-3),
+        ],
+    )
+    def test_get_rtu_frame_gap(self, baud_rate: int, parity: str, expected: float) -> None:
+        """Test the inter-frame gap is 3.5 character times and fixed above 19200 baud."""
+        assert get_rtu_frame_gap(baud_rate=baud_rate, parity=parity) == pytest.approx(expected)
+
+    @pytest.mark.asyncio()
+    async def test_rtu_bus_scheduler(self) -> None:
+        """Test serial requests run back to back with the inter-frame gap."""
+        frame_starts: List[float] = []
+
+        async def read_input_registers(address: int, count: int, slave: int) -> MagicMock:  # noqa: ARG001
+            frame_starts.append(time.monotonic())
+
+            response: MagicMock = MagicMock(spec=ModbusResponse, registers=[address] * count)
+            response.isError.return_value = False
+
+            return response
+
+        rtu_bus_scheduler: RTUBusScheduler = RTUBusScheduler(baud_rate=2400, parity="N")
+
+        for address in range(4):
+            response: Optional[ModbusResponse] = await rtu_bus_scheduler.execute(
+                read_input_registers, {"address": address, "count": 1, "slave": 1}
+            )
+
+            assert response is not None
+            assert response.registers == [address]
+
+        assert all(
+            frame_start - frame_starts[index] >= rtu_bus_scheduler.frame_gap
+            for index, frame_start in enumerate(frame_starts[1:])
+        )
+        assert 0 < rtu_bus_scheduler.requests_per_second <= 1 / rtu_bus_scheduler.frame_gap
+
+    def test_rtu_poll_scheduler(self) -> None:
+        """Test slaves are interleaved by priority and each slave is selected in every weighted round."""
+        rtu_poll_scheduler: RTUPollScheduler = RTUPollScheduler(priorities={1: 3, 2: 1, 3: 1})
+        units: List[int] = [rtu_poll_scheduler.next_unit() for _ in range(rtu_poll_scheduler.round_size * 4)]
+
+        assert units[:5] == [1, 2, 1, 3, 1]
+
+        for index in range(0, len(units), rtu_poll_scheduler.round_size):
+            weighted_round: List[int] = units[index : index + rtu_poll_scheduler.round_size]
+
+            assert [weighted_round.count(unit) for unit in (1, 2, 3)] == [3, 1, 1]
+
+        assert rtu_poll_scheduler.freshness(now=10.0) == {1: None, 2: None, 3: None}
+
+        rtu_poll_scheduler.last_reads[1] = 9.5
+
+        assert rtu_poll_scheduler.freshness(now=10.0)[1] == pytest.approx(500)
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        ("config_loader", "scan_budget", "expected"),
+        [
+            (
+                (CONFIG_CONTENT_SERIAL_UNITS, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
+                10.0,
+                [[1, 2, 3, 1], [1, 2, 3, 1]],
+            ),
+            (
+                (CONFIG_CONTENT_SERIAL_UNITS, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT),
+                1e-3,
+                [[1], [2], [3], [1]],
+            ),
+        ],
+        indirect=["config_loader"],
+    )
+    async def test_scan_round_robin(
+        self, mocker: MockerFixture, config_loader: ConfigLoader, scan_budget: float, expected: List[List[int]]
+    ) -> None:
+        """Test serial slaves are read in a weighted round-robin within the scan budget."""
+        mock_hardware_info: PropertyMock = mocker.patch(
+            "unipi_control.config.HardwareInfo", new_callable=PropertyMock()
+        )
+        mock_hardware_info.return_value = MockHardwareInfo()
+
+        config: Config = config_loader.get_config()
+        config.modbus_serial.scan_budget = scan_budget
+
+        mock_modbus_serial_client: MockRTUModbusSerialClient = MockRTUModbusSerialClient()
+        modbus_client = ModbusClient(tcp=AsyncMock(), serial=mock_modbus_serial_client)  # type: ignore[arg-type]
+        neuron: Neuron = Neuron(config=config, modbus_client=modbus_client)
+
+        for scan_units in expected:
+            mock_modbus_serial_client.read_slaves = []
+            await neuron.modbus_cache_data.scan("serial", hardware_types=[HardwareType.EXTENSION])
+
+            assert mock_modbus_serial_client.read_slaves == [
+                unit for unit in scan_units for _ in neuron.modbus_cache_data.scan_plan[unit]
+            ]
+
+        freshness: Dict[int, Optional[float]] = neuron.modbus_cache_data.serial_poll.freshness(time.monotonic())
+
+        assert all(unit_freshness is not None and unit_freshness >= 0 for unit_freshness in freshness.values())
+
+    @pytest.mark.asyncio()
+    async def test_modbus_stats(self, caplog: LogCaptureFixture) -> None:
+        """Test modbus calls are counted and their latency is recorded by function and slave."""
+        responses: List[Union[MagicMock, Exception]] = [
+            MagicMock(spec=ModbusResponse, registers=[0] * 10),
+            MagicMock(spec=ModbusResponse, registers=[0] * 10),
+            MagicMock(spec=ModbusResponse),
+            ModbusIOException("No response received after 3 retries"),
+            ModbusException("Not connected"),
+        ]
+
+        for index, response in enumerate(responses):
+            if isinstance(response, MagicMock):
+                response.isError.return_value = index == 2
+
+        async def read_input_registers(address: int, count: int, slave: int) -> MagicMock:  # noqa: ARG001
+            response: Union[MagicMock, Exception] = responses.pop(0)
+
+            if isinstance(response, Exception):
+                raise response
+
+            return response
+
+        MODBUS_STATS.reset()
+
+        for _ in range(5):
+            await check_modbus_call(read_input_registers, {"address": 0, "count": 10, "slave": 1})
+
+        call_stats: ModbusCallStats = MODBUS_STATS.calls[("read_input_registers", 1)]
+
+        assert call_stats.requests == 5
+        assert call_stats.exception_responses == 1
+        assert call_stats.timeouts == 1
+        assert call_stats.errors == 1
+        assert call_stats.bytes_sent == 25
+        assert call_stats.bytes_received == 44
+        assert sum(call_stats.latency_buckets) == 3
+        assert call_stats.percentile(99) == 0.5
+
+        MODBUS_STATS.log()
+        logs: List[str] = [record.getMessage() for record in caplog.records]
+
+        assert (
+            "[MODBUS] read_input_registers (unit: 1): 5 request(s), p50 0.5 ms, p95 0.5 ms, p99 0.5 ms, 1 timeout(s), "
+            "1 exception response(s), 1 error(s), 25 byte(s) sent, 44 byte(s) received."
+        ) in logs
+
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            ({"address": 0, "count": 10, "slave": 1}, 5),
+            ({"address": 0, "value": True, "slave": 1}, 5),
+            ({"address": 0, "values": [True] * 9, "slave": 1}, 8),
+        ],
+    )
+    def test_get_request_size(
+        self, data: Union[ModbusReadData, ModbusWriteData, ModbusWriteMultipleData], expected: int
+    ) -> None:
+        """Test the request PDU size of reads, single writes and multiple writes."""
+        assert get_request_size(data) == expected
+
+    def test_modbus_call_stats_percentile(self) -> None:
+        """Test percentiles are calculated from the latency buckets."""
+        call_stats: ModbusCallStats = ModbusCallStats()
+
+        assert call_stats.percentile(50) is None
+
+        for latency in [1e-3] * 90 + [15e-3] * 9 + [10]:
+            call_stats.record_latency(latency)
+
+        assert call_stats.percentile(50) == 1
+        assert call_stats.percentile(95) == 20
+        assert call_stats.percentile(99) == 20
+        assert call_stats.percentile(100) == math.inf
+
+    def test_modbus_slave_health(self) -> None:
+        """Test the circuit opens after repeated failures and the probe backoff doubles up to the maximum."""
+        slave_health: ModbusSlaveHealth = ModbusSlaveHealth()
+
+        assert slave_health.record_failure(now=0) is False
+        assert slave_health.record_failure(now=0) is False
+        assert slave_health.record_failure(now=0) is True
+        assert slave_health.next_probe == 1
+        assert slave_health.is_probe_due(now=0.5) is False
+        assert slave_health.is_probe_due(now=1) is True
+
+        backoffs: List[float] = []
+
+        for _ in range(10):
+            slave_health.record_failure(now=0)
+            backoffs.append(slave_health.backoff)
+
+        assert backoffs == [2, 4, 8, 16, 32, 64, 128, 256, 300, 300]
+        assert slave_health.record_success() is True
+        assert slave_health.is_open is False
+        assert slave_health.record_success() is False
+
+
 class TestUnhappyPathModbus:
+    @pytest.mark.parametrize(
+        ("poll", "expected"),
+        [
+            (
+                "always",
+                "[MODBUS] Invalid poll 'always' in register block 0 (unit: 1). "
+                "The following polling tiers are allowed: fast normal slow once or an interval in seconds.",
+            ),
+            (
+                0,
+                "[MODBUS] Invalid poll '0' in register block 0 (unit: 1). "
+                "The following polling tiers are allowed: fast normal slow once or an interval in seconds.",
+            ),
+        ],
+    )
+    def test_invalid_poll(self, poll: Union[str, int], expected: str) -> None:
+        """Test that an invalid polling tier raises ConfigError when planning register blocks."""
+        with pytest.raises(ConfigError) as error:
+            plan_register_blocks([{"start_reg": 0, "count": 2, "poll": poll}], unit=1)  # type: ignore[typeddict-item]
+
+        assert str(error.value) == expected
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        "config_loader",
+        [(CONFIG_CONTENT_SERIAL_UNITS, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT)],
+        indirect=True,
+    )
+    async def test_failing_slave(
+        self, mocker: MockerFixture, config_loader: ConfigLoader, caplog: LogCaptureFixture
+    ) -> None:
+        """Test a failing slave is skipped and probed with one read while the other slaves keep their cadence."""
+        mock_hardware_info: PropertyMock = mocker.patch(
+            "unipi_control.config.HardwareInfo", new_callable=PropertyMock()
+        )
+        mock_hardware_info.return_value = MockHardwareInfo()
+
+        mock_modbus_serial_client: MockRTUModbusSerialClient = MockRTUModbusSerialClient()
+        mock_modbus_serial_client.failing_slaves = {2}
+
+        modbus_client = ModbusClient(tcp=AsyncMock(), serial=mock_modbus_serial_client)  # type: ignore[arg-type]
+        neuron: Neuron = Neuron(config=config_loader.get_config(), modbus_client=modbus_client)
+        modbus_cache_data: ModbusCacheData = neuron.modbus_cache_data
+        reads_per_unit: int = len(modbus_cache_data.scan_plan[1])
+
+        await modbus_cache_data.scan("serial", hardware_types=[HardwareType.EXTENSION])
+
+        # The remaining reads of the failing slave are skipped and only one failure per scan is counted.
+        assert (
+            mock_modbus_serial_client.read_slaves
+            == [1] * reads_per_unit + [2] + [3] * reads_per_unit + [1] * reads_per_unit
+        )
+        assert modbus_cache_data.slave_health[2].failures == 1
+        assert modbus_cache_data.is_stale(2) is False
+
+        for _ in range(2):
+            await modbus_cache_data.scan("serial", hardware_types=[HardwareType.EXTENSION])
+
+        assert modbus_cache_data.is_stale(2) is True
+        assert modbus_cache_data.is_stale(1) is False
+
+        mock_modbus_serial_client.read_slaves = []
+        await modbus_cache_data.scan("serial", hardware_types=[HardwareType.EXTENSION])
+
+        assert 2 not in mock_modbus_serial_client.read_slaves
+
+        mock_modbus_serial_client.read_slaves = []
+        mock_modbus_serial_client.failing_slaves = set()
+        modbus_cache_data.slave_health[2].next_probe = 0
+        await modbus_cache_data.scan("serial", hardware_types=[HardwareType.EXTENSION])
+
+        assert mock_modbus_serial_client.read_slaves.count(2) == 1
+        assert modbus_cache_data.is_stale(2) is False
+
+        logs: List[str] = [record.getMessage() for record in caplog.records]
+
+        assert "[MODBUS] Unit 2 does not respond. Cached registers are stale. Next probe in 1.0 seconds." in logs
+        assert "[MODBUS] Unit 2 responds again." in logs
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        "config_loader", [(CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT)], indirect=True
+    )
+    async def test_failing_pipelined_slave(self, mocker: MockerFixture, config_loader: ConfigLoader) -> None:
+        """Test the pipelined reads of a failing slave count as one failure per scan of the slave."""
+        mock_hardware_info: PropertyMock = mocker.patch(
+            "unipi_control.config.HardwareInfo", new_callable=PropertyMock()
+        )
+        mock_hardware_info.return_value = MockHardwareInfo()
+
+        mock_modbus_tcp_client: AsyncMock = AsyncMock()
+        mock_modbus_tcp_client.read_input_registers.side_effect = asyncio.exceptions.TimeoutError
+        modbus_client = ModbusClient(tcp=mock_modbus_tcp_client, serial=AsyncMock())  # type: ignore[arg-type]
+        neuron: Neuron = Neuron(config=config_loader.get_config(), modbus_client=modbus_client)
+        modbus_cache_data: ModbusCacheData = neuron.modbus_cache_data
+
+        # The Neuron registers are cached as unit 0 and read from slave 1.
+        for modbus_register_block in modbus_cache_data.scan_plan[0]:
+            modbus_register_block["slave"] = 1
+
+        modbus_cache_data.slave_health = {1: ModbusSlaveHealth()}
+
+        await modbus_cache_data.scan("tcp", hardware_types=[HardwareType.NEURON])
+
+        assert mock_modbus_tcp_client.read_input_registers.call_count == 4
+        assert mock_modbus_tcp_client.read_input_registers.call_args.kwargs["slave"] == 1
+        assert modbus_cache_data.slave_health[1].failures == 1
+
+        for _ in range(2):
+            await modbus_cache_data.scan("tcp", hardware_types=[HardwareType.NEURON])
+
+        assert modbus_cache_data.is_stale(0) is True
+
     @pytest.mark.parametrize(
         "config_loader", [(CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT)], indirect=True
     )
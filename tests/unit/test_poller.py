@@ -0,0 +1,110 @@
+"""Unit tests for the Modbus poller."""
+
+from typing import TYPE_CHECKING
+from typing import Union
+from unittest.mock import MagicMock
+from unittest.mock import PropertyMock
+from unittest.mock import call
+
+import pytest
+from pytest_mock import MockerFixture
+
+from tests.conftest_data import CONFIG_CONTENT
+from tests.conftest_data import EXTENSION_HARDWARE_DATA_CONTENT
+from tests.conftest_data import HARDWARE_DATA_CONTENT
+from unipi_control.config import FeatureConfig
+from unipi_control.events import EventBus
+from unipi_control.events import EventSubscription
+from unipi_control.events import FeatureStateChanged
+from unipi_control.events import MeterValueChanged
+from unipi_control.features.extensions import EastronMeter
+from unipi_control.features.utils import PublishPolicy
+from unipi_control.modbus import MODBUS_CIRCUIT_FAILURE_THRESHOLD
+from unipi_control.neuron import Neuron
+from unipi_control.poller import ModbusPoller
+
+if TYPE_CHECKING:
+    from unipi_control.features.neuron import DigitalInput
+    from unipi_control.features.neuron import DigitalOutput
+    from unipi_control.features.neuron import Led
+    from unipi_control.features.neuron import Relay
+
+
+class TestHappyPathModbusPoller:
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        "config_loader", [(CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT)], indirect=True
+    )
+    async def test_poll(self, mocker: MockerFixture, neuron: Neuron) -> None:
+        """Test the first scan publishes all features and later scans only changed features."""
+        mock_modbus_cache_data_scan: MagicMock = mocker.patch(
+            "unipi_control.modbus.ModbusCacheData.scan", return_value={}
+        )
+
+        ModbusPoller.POLL_RUNNING = PropertyMock(side_effect=[True, True, False])
+
+        events: EventBus = EventBus()
+        subscription: EventSubscription = events.subscribe(FeatureStateChanged)
+        poller: ModbusPoller = ModbusPoller(neuron, events)
+        await poller.poll("tcp", sleep=1e-3)
+
+        assert mock_modbus_cache_data_scan.mock_calls == [
+            # In the first run features changed.
+            call("tcp", ["Neuron"]),
+            # In the second run features not changed.
+            call("tcp", ["Neuron"]),
+        ]
+
+        payloads = {event.topic: event.payload for event in await subscription.wait()}
+
+        assert len(payloads) == events.sequence
+        assert payloads["mocked_unipi/input/di_1_01/get"] == "OFF"
+        assert payloads["mocked_unipi/relay/ro_2_13/get"] == "OFF"
+        assert events.subscribe(MeterValueChanged).latest() == []
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        "config_loader", [(CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT)], indirect=True
+    )
+    async def test_publish_policy(self, neuron: Neuron) -> None:
+        """Test meter values inside the deadband are not published."""
+        meter: Union[DigitalInput, DigitalOutput, Led, Relay, EastronMeter] = neuron.features.by_feature_id("voltage_1")
+
+        assert isinstance(meter, EastronMeter)
+
+        meter.publish_policy = PublishPolicy(FeatureConfig(deadband=1.0))
+        events: EventBus = EventBus()
+        subscription: EventSubscription = events.subscribe(MeterValueChanged)
+        poller: ModbusPoller = ModbusPoller(neuron, events)
+
+        # 235.2, 235.7 and 236.5 as big endian 32-bit floats
+        for registers in ([0x436B, 0x3333], [0x436B, 0xB333], [0x436C, 0x8000]):
+            neuron.modbus_cache_data.registers.store_block(unit=1, start=0, words=registers)
+            poller._publish_features([meter])  # noqa: SLF001
+
+        assert await subscription.wait() == [
+            MeterValueChanged(topic="mocked_unipi/meter/voltage_1/get", payload=235.2, feature=meter),
+            MeterValueChanged(topic="mocked_unipi/meter/voltage_1/get", payload=236.5, feature=meter),
+        ]
+
+    @pytest.mark.parametrize(
+        "config_loader", [(CONFIG_CONTENT, HARDWARE_DATA_CONTENT, EXTENSION_HARDWARE_DATA_CONTENT)], indirect=True
+    )
+    def test_stale_unit(self, neuron: Neuron) -> None:
+        """Test features of a unit that does not respond are not published."""
+        meter: Union[DigitalInput, DigitalOutput, Led, Relay, EastronMeter] = neuron.features.by_feature_id("voltage_1")
+        events: EventBus = EventBus()
+        subscription: EventSubscription = events.subscribe(MeterValueChanged)
+        poller: ModbusPoller = ModbusPoller(neuron, events)
+
+        for _ in range(MODBUS_CIRCUIT_FAILURE_THRESHOLD):
+            neuron.modbus_cache_data.slave_health[1].record_failure(now=0)
+
+        poller._publish_features([meter])  # noqa: SLF001
+
+        assert subscription.latest() == []
+
+        neuron.modbus_cache_data.slave_health[1].record_success()
+        poller._publish_features([meter])  # noqa: SLF001
+
+        assert [event.topic for event in subscription.latest()] == ["mocked_unipi/meter/voltage_1/get"]
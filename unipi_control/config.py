@@ -52,6 +52,9 @@ DEVICE_CLASSES: Final[List[str]] = [
 
 MODBUS_BAUD_RATES: Final[List[int]] = [2400, 4800, 9600, 19200, 38400, 57600, 115200]
 MODBUS_PARITY: Final[List[str]] = ["E", "O", "N"]
+MODBUS_MAX_READ_COUNT: Final[int] = 125
+MODBUS_POLL_TIERS: Final[List[str]] = ["fast", "normal", "slow", "once"]
+MODBUS_MAX_PRIORITY: Final[int] = 10
 
 
 class LogPrefix:
@@ -169,7 +172,8 @@ class ConfigLoaderMixin:
                 value.validate()
             else:
                 if method := getattr(self, f"_validate_{_field.name}", None):
-                    setattr(self, _field.name, method(getattr(self, _field.name), name=_field.name))
+                    value = method(value, name=_field.name)
+                    setattr(self, _field.name, value)
 
                 if not isinstance(value, field_type) and not is_dataclass(value):
                     msg = f"Expected {_field.name} to be {field_type}, got {value!r}"
@@ -198,6 +202,17 @@ class MqttConfig(ConfigLoaderMixin):
     keepalive: int = field(default=15)
     retry_limit: int = field(default=30)
     reconnect_interval: int = field(default=10)
+    publish_window: int = field(default=16)
+
+    @staticmethod
+    def _validate_publish_window(value: int, name: str) -> int:
+        if isinstance(value, int) and value < 1:
+            exception_message: str = (
+                f"{LogPrefix.MQTT} Invalid value '{value}' in '{name}'. The publish window must be at least 1."
+            )
+            raise ConfigError(exception_message)
+
+        return value
 
 
 @dataclass
@@ -210,6 +225,28 @@ class FeatureConfig(ConfigLoaderMixin):
     unit_of_measurement: str = field(default_factory=str)
     suggested_area: str = field(default_factory=str)
     invert_state: bool = field(default=False)
+    deadband: float = field(default=0.0)
+    deadband_percent: float = field(default=0.0)
+    min_interval: float = field(default=0.0)
+    max_interval: float = field(default=0.0)
+    precision: int = field(default=2)
+
+    def validate(self) -> None:
+        """Validate the publish policy."""
+        for _field in ("deadband", "deadband_percent", "min_interval", "max_interval"):
+            value: Any = getattr(self, _field)
+
+            if isinstance(value, int) and not isinstance(value, bool):
+                value = float(value)
+                setattr(self, _field, value)
+
+            if isinstance(value, float) and value < 0:
+                exception_message: str = (
+                    f"{LogPrefix.FEATURE} Invalid value '{value}' in '{_field}'. The value must not be negative."
+                )
+                raise ConfigError(exception_message)
+
+        super().validate()
 
     @staticmethod
     def _validate_object_id(value: str, name: str) -> str:
@@ -221,6 +258,14 @@ class FeatureConfig(ConfigLoaderMixin):
 
         return value
 
+    @staticmethod
+    def _validate_precision(value: int, name: str) -> int:
+        if isinstance(value, int) and value < 0:
+            msg = f"{LogPrefix.FEATURE} Invalid value '{value}' in '{name}'. The precision must not be negative."
+            raise ConfigError(msg)
+
+        return value
+
 
 @dataclass
 class CoverConfig(ConfigLoaderMixin):
@@ -230,6 +275,7 @@ class CoverConfig(ConfigLoaderMixin):
     device_class: str = field(default_factory=str)
     cover_run_time: float = field(default_factory=float)
     tilt_change_time: float = field(default_factory=float)
+    position_update_interval: float = field(default=1.0)
     cover_up: str = field(default_factory=str)
     cover_down: str = field(default_factory=str)
 
@@ -255,6 +301,17 @@ class CoverConfig(ConfigLoaderMixin):
 
         return value
 
+    @staticmethod
+    def _validate_position_update_interval(value: float, name: str) -> float:
+        if isinstance(value, int) and not isinstance(value, bool):
+            value = float(value)
+
+        if isinstance(value, float) and value < 0:
+            msg = f"{LogPrefix.COVER} Invalid value '{value}' in '{name}'. The value must not be negative."
+            raise ConfigError(msg)
+
+        return value
+
     def _validate_device_class(self, value: str, name: str) -> str:
         if (value := value.lower()) not in DEVICE_CLASSES:
             exception_message: str = (
@@ -272,6 +329,7 @@ class ModbusUnitConfig(ConfigLoaderMixin):
     device_name: str = field(default_factory=str)
     identifier: str = field(default_factory=str)
     suggested_area: str = field(default_factory=str)
+    priority: int = field(default=1)
 
     def _validate_device_name(self, value: str, name: str) -> str:  # noqa: ARG002
         if not value:
@@ -280,11 +338,59 @@ class ModbusUnitConfig(ConfigLoaderMixin):
 
         return value
 
+    def _validate_priority(self, value: int, name: str) -> int:
+        if isinstance(value, int) and not 1 <= value <= MODBUS_MAX_PRIORITY:
+            exception_message: str = (
+                f"{LogPrefix.MODBUS} Invalid value '{value}' in '{name}' for unit '{self.unit}'. "
+                f"The priority must be between 1 and {MODBUS_MAX_PRIORITY}."
+            )
+            raise ConfigError(exception_message)
+
+        return value
+
+
+@dataclass
+class ModbusPollingConfig(ConfigLoaderMixin):
+    fast: float = field(default=25e-3)
+    normal: float = field(default=1.0)
+    slow: float = field(default=60.0)
+
+    def validate(self) -> None:
+        """Validate polling intervals."""
+        for _field in dataclasses.fields(self):
+            value: Any = getattr(self, _field.name)
+
+            if isinstance(value, int) and not isinstance(value, bool):
+                value = float(value)
+                setattr(self, _field.name, value)
+
+            if isinstance(value, float) and value <= 0:
+                exception_message: str = (
+                    f"{LogPrefix.MODBUS} Invalid value '{value}' in '{_field.name}'. "
+                    "The polling interval must be greater than 0."
+                )
+                raise ConfigError(exception_message)
+
+        super().validate()
+
 
 @dataclass
 class ModbusTCPConfig(ConfigLoaderMixin):
     host: str = field(default="localhost")
     port: int = field(default=502)
+    max_register_gap: int = field(default=0)
+    polling: ModbusPollingConfig = field(default_factory=ModbusPollingConfig)
+
+    @staticmethod
+    def _validate_max_register_gap(value: int, name: str) -> int:
+        if isinstance(value, int) and not 0 <= value < MODBUS_MAX_READ_COUNT:
+            exception_message: str = (
+                f"{LogPrefix.MODBUS} Invalid value '{value}' in '{name}'. "
+                f"The register gap must be between 0 and {MODBUS_MAX_READ_COUNT - 1}."
+            )
+            raise ConfigError(exception_message)
+
+        return value
 
 
 @dataclass
@@ -292,6 +398,9 @@ class ModbusSerialConfig(ConfigLoaderMixin):
     port: str = field(default="/dev/extcomm/0/0")
     baud_rate: int = field(default=2400)
     parity: str = field(default="N")
+    max_register_gap: int = field(default=0)
+    polling: ModbusPollingConfig = field(default_factory=ModbusPollingConfig)
+    scan_budget: float = field(default=0.5)
     units: List[ModbusUnitConfig] = field(init=False, default_factory=list)
 
     def get_units_by_identifier(self, identifier: str) -> Iterator[ModbusUnitConfig]:
@@ -344,6 +453,30 @@ class ModbusSerialConfig(ConfigLoaderMixin):
 
         return value
 
+    @staticmethod
+    def _validate_max_register_gap(value: int, name: str) -> int:
+        if isinstance(value, int) and not 0 <= value < MODBUS_MAX_READ_COUNT:
+            exception_message: str = (
+                f"{LogPrefix.MODBUS} Invalid value '{value}' in '{name}'. "
+                f"The register gap must be between 0 and {MODBUS_MAX_READ_COUNT - 1}."
+            )
+            raise ConfigError(exception_message)
+
+        return value
+
+    @staticmethod
+    def _validate_scan_budget(value: float, name: str) -> float:
+        if isinstance(value, int) and not isinstance(value, bool):
+            value = float(value)
+
+        if isinstance(value, float) and value <= 0:
+            exception_message: str = (
+                f"{LogPrefix.MODBUS} Invalid value '{value}' in '{name}'. The scan budget must be greater than 0."
+            )
+            raise ConfigError(exception_message)
+
+        return value
+
 
 @dataclass
 class HomeAssistantConfig(ConfigLoaderMixin):
@@ -475,6 +608,10 @@ class Config(ConfigLoaderMixin):
         self._validate_covers_circuits()
         self._validate_cover_ids()
 
+    @staticmethod
+    def _validate_sys_bus_dir(value: Union[str, Path], name: str) -> Path:  # noqa: ARG004
+        return Path(value)
+
     def _validate_feature_object_ids(self) -> None:
         object_ids: List[str] = []
 
@@ -505,13 +642,12 @@ class Config(ConfigLoaderMixin):
     def _validate_covers_circuits(self) -> None:
         circuits: List[str] = self.get_cover_circuits()
 
-        for circuit in circuits:
-            if circuits.count(circuit) > 1:
-                exception_message: str = (
-                    f"{LogPrefix.COVER} Duplicate circuits found in 'covers'. "
-                    f"Driving both signals up and down at the same time can damage the motor!"
-                )
-                raise ConfigError(exception_message)
+        if len(set(circuits)) != len(circuits):
+            exception_message: str = (
+                f"{LogPrefix.COVER} Duplicate circuits found in 'covers'. "
+                f"Driving both signals up and down at the same time can damage the motor!"
+            )
+            raise ConfigError(exception_message)
 
     def _validate_cover_ids(self) -> None:
         object_ids: List[str] = []
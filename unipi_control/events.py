@@ -0,0 +1,191 @@
+"""In-process publish/subscribe bus for typed change events."""
+
+import asyncio
+from collections import deque
+from itertools import islice
+from typing import Deque
+from typing import Dict
+from typing import Final
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import TYPE_CHECKING
+from typing import Tuple
+from typing import Type
+from typing import Union
+
+from unipi_control.config import LogPrefix
+from unipi_control.config import UNIPI_LOGGER
+from unipi_control.features.extensions import EastronMeter
+from unipi_control.features.neuron import DigitalInput
+from unipi_control.features.neuron import DigitalOutput
+from unipi_control.features.neuron import Led
+from unipi_control.features.neuron import Relay
+
+if TYPE_CHECKING:
+    from unipi_control.integrations.covers import Cover
+
+EVENT_BUFFER_SIZE: Final[int] = 1024
+
+
+class FeatureStateChanged(NamedTuple):
+    topic: str
+    payload: str
+    feature: Union[DigitalInput, DigitalOutput, Led, Relay]
+
+
+class MeterValueChanged(NamedTuple):
+    topic: str
+    payload: Optional[float]
+    feature: EastronMeter
+
+
+class CoverStateChanged(NamedTuple):
+    topic: str
+    payload: Optional[str]
+    cover: "Cover"
+
+
+class CoverPositionChanged(NamedTuple):
+    topic: str
+    payload: Optional[int]
+    cover: "Cover"
+
+
+class CoverTiltChanged(NamedTuple):
+    topic: str
+    payload: Optional[int]
+    cover: "Cover"
+
+
+Event = Union[FeatureStateChanged, MeterValueChanged, CoverStateChanged, CoverPositionChanged, CoverTiltChanged]
+
+
+class EventBus:
+    """Bounded ring buffer of change events with the latest event per topic.
+
+    Producers publish every change once. Every subscription reads the events of its event types independent of all
+    other subscriptions. A subscription that fell behind more than ``size`` events gets the latest event per topic
+    instead.
+
+    Attributes
+    ----------
+    size: int
+        The maximum number of buffered events.
+    sequence: int
+        The sequence number of the last event.
+    """
+
+    def __init__(self, size: int = EVENT_BUFFER_SIZE) -> None:
+        self.size: int = size
+        self.sequence: int = 0
+
+        self._events: Deque[Event] = deque(maxlen=size)
+        self._latest: Dict[str, Event] = {}
+        self._published: Optional[asyncio.Event] = None
+
+    def publish(self, event: Event) -> None:
+        """Add an event and wake up all waiting subscriptions."""
+        self.sequence += 1
+        self._events.append(event)
+        self._latest[event.topic] = event
+
+        if self._published:
+            self._published.set()
+
+    def subscribe(self, *event_types: Type[Event], topic: Optional[str] = None) -> "EventSubscription":
+        """Subscribe to all future events of the event types.
+
+        Parameters
+        ----------
+        event_types: type
+            The event classes e.g. ``FeatureStateChanged``.
+        topic: str, optional
+            Only subscribe to the events of this topic.
+
+        Returns
+        -------
+        EventSubscription
+            The subscription that starts after the last published event.
+        """
+        return EventSubscription(self, event_types, topic)
+
+    def latest(self) -> List[Event]:
+        """Return the latest event of every topic."""
+        return list(self._latest.values())
+
+    def events_after(self, sequence: int) -> Optional[List[Event]]:
+        """Return all events after a sequence number or ``None`` if some of these events were overwritten."""
+        if (missed := self.sequence - sequence) > len(self._events):
+            UNIPI_LOGGER.warning(
+                "%s %s event(s) were overwritten. Replaying the latest event per topic.",
+                LogPrefix.MQTT,
+                missed - len(self._events),
+            )
+            return None
+
+        return list(islice(self._events, len(self._events) - missed, None))
+
+    async def wait(self, sequence: int) -> None:
+        """Wait until an event after the sequence number was published."""
+        while self.sequence == sequence:
+            if self._published is None:
+                self._published = asyncio.Event()
+
+            self._published.clear()
+            await self._published.wait()
+
+
+class EventSubscription:
+    """Read the events of some event types from the event bus.
+
+    Attributes
+    ----------
+    bus: EventBus
+        The event bus.
+    event_types: tuple
+        The subscribed event classes.
+    topic: str, optional
+        The subscribed topic or ``None`` for all topics.
+    sequence: int
+        The sequence number of the last read event.
+    """
+
+    def __init__(self, bus: EventBus, event_types: Tuple[Type[Event], ...], topic: Optional[str] = None) -> None:
+        self.bus: EventBus = bus
+        self.event_types: Tuple[Type[Event], ...] = event_types
+        self.topic: Optional[str] = topic
+        self.sequence: int = bus.sequence
+
+    def _filter(self, events: List[Event]) -> List[Event]:
+        return [
+            event
+            for event in events
+            if isinstance(event, self.event_types) and (self.topic is None or event.topic == self.topic)
+        ]
+
+    def latest(self) -> List[Event]:
+        """Return the latest event of every subscribed topic and continue after the last published event."""
+        self.sequence = self.bus.sequence
+        return self._filter(self.bus.latest())
+
+    async def wait(self) -> List[Event]:
+        """Wait for new events of the subscribed event types.
+
+        Returns
+        -------
+        list
+            All new events in publish order or the latest event per topic if the subscription fell behind.
+        """
+        while True:
+            await self.bus.wait(self.sequence)
+
+            events: Optional[List[Event]] = self.bus.events_after(self.sequence)
+
+            if events is None:
+                events = self.bus.latest()
+
+            self.sequence = self.bus.sequence
+
+            if events := self._filter(events):
+                return events
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 from unipi_control.config import Config
 from unipi_control.features.extensions import EastronMeter
 from unipi_control.features.extensions import Hardware
+from unipi_control.features.extensions import MeterDecoder
 from unipi_control.features.extensions import MeterProps
 from unipi_control.features.extensions import Modbus
 from unipi_control.features.map import FeatureMap
@@ -17,7 +18,6 @@ from unipi_control.helpers.typing import HardwareDefinition
 from unipi_control.helpers.typing import ModbusClient
 from unipi_control.helpers.typing import ModbusReadData
 from unipi_control.modbus import ModbusCacheData
-from unipi_control.modbus import check_modbus_call
 
 if TYPE_CHECKING:
     from pymodbus.pdu import ModbusResponse
@@ -40,6 +40,7 @@ class EastronSDM120M:
         self.modbus_cache_data: ModbusCacheData = modbus_cache_data
         self.definition: HardwareDefinition = definition
         self.features: FeatureMap = features
+        self.decoder: MeterDecoder = MeterDecoder(cache=modbus_cache_data, definition=definition)
         self._sw_version: Optional[str] = None
 
     def _parse_feature_meter(self, modbus_feature: EastronModbusFeature) -> None:
@@ -48,6 +49,7 @@ class EastronSDM120M:
             modbus=Modbus(
                 cache=self.modbus_cache_data,
                 val_reg=modbus_feature["val_reg"],
+                decoder=self.decoder,
             ),
             hardware=Hardware(
                 feature_type=FeatureType[modbus_feature["feature_type"]],
@@ -85,7 +87,7 @@ class EastronSDM120M:
         while retry:
             retry_reconnect += 1
 
-            response: Optional[ModbusResponse] = await check_modbus_call(
+            response: Optional[ModbusResponse] = await self.modbus_cache_data.serial_bus.execute(
                 self.modbus_client.serial.read_holding_registers, data
             )
 
@@ -100,7 +102,8 @@ class EastronSDM120M:
             if retry_reconnect == self.RETRY_LIMIT:
                 retry = False
 
-            await asyncio.sleep(1)
+            if retry:
+                await asyncio.sleep(1)
 
         return sw_version
 
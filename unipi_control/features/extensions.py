@@ -1,27 +1,164 @@
 """Extensions features classes."""
 
+import struct
+import sys
+from array import array
 from dataclasses import dataclass
 from functools import cached_property
-from typing import Callable
-from typing import Iterable
+from typing import Dict
+from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
-from pymodbus.constants import Endian
-from pymodbus.payload import BinaryPayloadDecoder
-
 from unipi_control.config import Config
 from unipi_control.config import FeatureConfig
 from unipi_control.features.utils import FeatureType
+from unipi_control.features.utils import PublishPolicy
 from unipi_control.helpers.text import slugify
 from unipi_control.helpers.typing import HardwareDefinition
 from unipi_control.modbus import ModbusCacheData
 
 
+@dataclass
+class MeterDecoderBlock:
+    start_reg: int
+    count: int
+    val_regs: List[int]
+    precisions: List[int]
+    decoder: struct.Struct
+
+
+class MeterDecoder:
+    """Decode the 32-bit float values of all meters of one hardware definition.
+
+    The decode step of every register block is compiled once into a struct format. All meter values of a block are
+    unpacked with one ``struct.unpack_from`` call and rounded in the same pass.
+
+    Attributes
+    ----------
+    cache: ModbusCacheData
+        The cached registers.
+    unit: int
+        The unit of the meter.
+    blocks: list
+        The compiled register blocks.
+    """
+
+    def __init__(self, cache: ModbusCacheData, definition: HardwareDefinition) -> None:
+        self.cache: ModbusCacheData = cache
+        self.unit: int = definition.unit
+        self.blocks: List[MeterDecoderBlock] = self._compile(
+            definition,
+            sorted(
+                modbus_feature["val_reg"]
+                for modbus_feature in definition.modbus_features
+                if modbus_feature["feature_type"] == FeatureType.METER.short_name
+            ),
+        )
+
+        self._values: Dict[int, Optional[float]] = {}
+        self._values_generation: Optional[int] = None
+
+    @staticmethod
+    def _compile(definition: HardwareDefinition, val_regs: List[int]) -> List[MeterDecoderBlock]:
+        val_regs_by_block: Dict[Tuple[int, int], List[int]] = {}
+
+        for val_reg in val_regs:
+            # Values outside the register blocks of the hardware definition are decoded on their own.
+            block: Tuple[int, int] = next(
+                (
+                    (modbus_register_block["start_reg"], modbus_register_block["count"])
+                    for modbus_register_block in definition.modbus_register_blocks
+                    if modbus_register_block["start_reg"]
+                    <= val_reg
+                    <= modbus_register_block["start_reg"] + modbus_register_block["count"] - 2
+                ),
+                (val_reg, 2),
+            )
+            val_regs_by_block.setdefault(block, []).append(val_reg)
+
+        blocks: List[MeterDecoderBlock] = []
+
+        for (start_reg, count), block_val_regs in val_regs_by_block.items():
+            # Registers are big endian and the high word comes first.
+            decoder_format: str = ">"
+            next_reg: int = start_reg
+
+            for val_reg in block_val_regs:
+                decoder_format += f"{(val_reg - next_reg) * 2}xf" if val_reg > next_reg else "f"
+                next_reg = val_reg + 2
+
+            blocks.append(
+                MeterDecoderBlock(
+                    start_reg=start_reg,
+                    count=count,
+                    val_regs=block_val_regs,
+                    precisions=[2] * len(block_val_regs),
+                    decoder=struct.Struct(decoder_format),
+                )
+            )
+
+        return blocks
+
+    def _decode(self) -> Dict[int, Optional[float]]:
+        values: Dict[int, Optional[float]] = {}
+
+        for block in self.blocks:
+            words: array = array("H", self.cache.get_register_view(block.start_reg, block.count, self.unit))
+
+            if not words:
+                values.update(dict.fromkeys(block.val_regs))
+                continue
+
+            if sys.byteorder == "little":
+                words.byteswap()
+
+            for index, value in enumerate(block.decoder.unpack_from(words)):
+                values[block.val_regs[index]] = round(value, block.precisions[index])
+
+        return values
+
+    def set_precision(self, val_reg: int, precision: int) -> None:
+        """Set the number of decimals of a meter value.
+
+        Parameters
+        ----------
+        val_reg: int
+            The first register of the meter value.
+        precision: int
+            The number of decimals.
+        """
+        for block in self.blocks:
+            if val_reg in block.val_regs:
+                block.precisions[block.val_regs.index(val_reg)] = precision
+                self._values_generation = None
+
+    def value(self, val_reg: int) -> Optional[float]:
+        """Get a meter value. All values are decoded at most once per generation of the register cache.
+
+        Parameters
+        ----------
+        val_reg: int
+            The first register of the meter value.
+
+        Returns
+        -------
+        float, optional
+            The meter value or ``None`` if the registers are not cached.
+        """
+        if self._values_generation != (generation := self.cache.generation):
+            self._values = self._decode()
+            self._values_generation = generation
+
+        return self._values.get(val_reg)
+
+
 @dataclass
 class Modbus:
     cache: ModbusCacheData
     val_reg: int
+    decoder: MeterDecoder
 
 
 @dataclass
@@ -48,16 +185,17 @@ class EastronMeter:
         props: MeterProps,
     ) -> None:
         self.config: Config = config
+        self.modbus: Modbus = modbus
         self.hardware: Hardware = hardware
         self.props: MeterProps = props
 
         self.features_config: Optional[FeatureConfig] = config.features.get(self.feature_id)
-
-        self._reg_value: Callable[..., Iterable[int]] = lambda: modbus.cache.get_register(
-            address=modbus.val_reg, index=2, unit=hardware.definition.unit
-        )
+        self.publish_policy: PublishPolicy = PublishPolicy(self.features_config)
         self.saved_value: Optional[Union[float, int]] = None
 
+        if self.features_config:
+            modbus.decoder.set_precision(modbus.val_reg, self.features_config.precision)
+
     def __repr__(self) -> str:
         return self.props.friendly_name
 
@@ -69,32 +207,22 @@ class EastronMeter:
     @property
     def value(self) -> Optional[float]:
         """Return Eastron meter value."""
-        _reg_value: Iterable[int] = self._reg_value()
-
-        return (
-            round(
-                float(
-                    BinaryPayloadDecoder.fromRegisters(  # type: ignore[no-untyped-call]
-                        _reg_value, byteorder=Endian.BIG, wordorder=Endian.BIG
-                    ).decode_32bit_float()
-                ),
-                2,
-            )
-            if _reg_value
-            else None
-        )
+        return self.modbus.decoder.value(self.modbus.val_reg)
 
     @property
     def changed(self) -> bool:
         """Detect whether the status has changed."""
-        changed: bool = False
-
-        if self.value != self.saved_value:
-            changed = True
-            self.saved_value = self.value
+        value: Optional[float] = self.value
+        changed: bool = value != self.saved_value
+        self.saved_value = value
 
         return changed
 
+    @cached_property
+    def register_addresses(self) -> List[Tuple[int, int]]:
+        """Return the ``(unit, register)`` addresses of the meter value."""
+        return [(self.hardware.definition.unit, self.modbus.val_reg + index) for index in range(2)]
+
     @cached_property
     def feature_id(self) -> str:
         """Return slugify friendly name for unique feature id."""
@@ -2,11 +2,13 @@
 
 import itertools
 from typing import Dict, TYPE_CHECKING
+from typing import FrozenSet
 from typing import Iterable
 from typing import Iterator
 from typing import List
 from typing import Mapping
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 from unipi_control.config import LogPrefix
@@ -16,14 +18,30 @@ from unipi_control.features.neuron import DigitalOutput
 from unipi_control.features.neuron import Led
 from unipi_control.features.neuron import Relay
 from unipi_control.helpers.exception import ConfigError
+from unipi_control.modbus import RegisterChange
 
 if TYPE_CHECKING:
     from unipi_control.features.utils import FeatureType
 
 
 class FeatureMap(Mapping[str, List[Union[DigitalInput, DigitalOutput, Led, Relay, EastronMeter]]]):
-    def __init__(self) -> None:
+    """Registered features by feature type with indexes by feature id and by register address.
+
+    Attributes
+    ----------
+    cover_circuits: frozenset
+        The feature ids of all outputs that are used by covers.
+    """
+
+    def __init__(self, cover_circuits: Iterable[str] = ()) -> None:
         self.data: Dict[str, List[Union[DigitalInput, DigitalOutput, Led, Relay, EastronMeter]]] = {}
+        self.cover_circuits: FrozenSet[str] = frozenset(cover_circuits)
+
+        self._by_feature_id: Dict[str, Union[DigitalInput, DigitalOutput, Led, Relay, EastronMeter]] = {}
+        self._by_register_bit: Dict[
+            Tuple[int, int], Dict[int, List[Union[DigitalInput, DigitalOutput, Led, Relay]]]
+        ] = {}
+        self._by_register_address: Dict[Tuple[int, int], List[EastronMeter]] = {}
 
     def __getitem__(self, key: str) -> List[Union[DigitalInput, DigitalOutput, Led, Relay, EastronMeter]]:
         data: List[Union[DigitalInput, DigitalOutput, Led, Relay, EastronMeter]] = self.data[key]
@@ -55,6 +73,17 @@ class FeatureMap(Mapping[str, List[Union[DigitalInput, DigitalOutput, Led, Relay
 
         self.data[feature_type.short_name].append(feature)
 
+        # The first registered feature wins like the former linear search.
+        self._by_feature_id.setdefault(feature.feature_id, feature)
+
+        for register_address in feature.register_addresses:
+            if isinstance(feature, EastronMeter):
+                self._by_register_address.setdefault(register_address, []).append(feature)
+            else:
+                self._by_register_bit.setdefault(register_address, {}).setdefault(feature.register_bit, []).append(
+                    feature
+                )
+
     def by_feature_id(
         self, feature_id: str, feature_types: Optional[List[str]] = None
     ) -> Union[DigitalInput, DigitalOutput, Led, Relay, EastronMeter]:
@@ -76,22 +105,15 @@ class FeatureMap(Mapping[str, List[Union[DigitalInput, DigitalOutput, Led, Relay
         ConfigError
             Get an exception if feature type not found.
         """
-        data: Iterable[Union[DigitalInput, DigitalOutput, Led, Relay, EastronMeter]] = itertools.chain.from_iterable(
-            self.values()
+        feature: Optional[Union[DigitalInput, DigitalOutput, Led, Relay, EastronMeter]] = self._by_feature_id.get(
+            feature_id
         )
 
-        if feature_types:
-            data = self.by_feature_types(feature_types)
-
-        try:
-            features: Union[DigitalInput, DigitalOutput, Led, Relay, EastronMeter] = next(
-                d for d in data if d.feature_id == feature_id
-            )
-        except StopIteration as error:
+        if feature is None or (feature_types and feature.hardware.feature_type.short_name not in feature_types):
             msg = f"{LogPrefix.CONFIG} '{feature_id}' not found in {self.__class__.__name__}!"
-            raise ConfigError(msg) from error
+            raise ConfigError(msg)
 
-        return features
+        return feature
 
     def by_feature_types(
         self, feature_types: List[str]
@@ -111,3 +133,47 @@ class FeatureMap(Mapping[str, List[Union[DigitalInput, DigitalOutput, Led, Relay
         return itertools.chain.from_iterable(
             [item for item in (self.get(feature_type) for feature_type in feature_types) if item is not None]
         )
+
+    def changed_by_dirty_registers(
+        self, dirty_registers: Mapping[Tuple[int, int], RegisterChange], feature_types: List[str]
+    ) -> Iterator[Union[DigitalInput, DigitalOutput, Led, Relay, EastronMeter]]:
+        """Filter changed features by dirty registers and feature type.
+
+        Features with a status bit (e.g. Digital Input, Relay) are found by the set bits of the changed bits and
+        updated from the new register value. Other features are re-evaluated if one of their registers is dirty.
+
+        Parameters
+        ----------
+        dirty_registers: Mapping
+            The register changes of one scan by ``(unit, register)`` address.
+        feature_types: list
+            List of feature types e.g. DI, RO, ...
+
+        Returns
+        -------
+        Iterator
+            A list of changed features filtered by feature type.
+        """
+        features: Dict[Union[DigitalInput, DigitalOutput, Led, Relay, EastronMeter], None] = {}
+
+        for register_address in sorted(dirty_registers):
+            register_change: RegisterChange = dirty_registers[register_address]
+
+            if features_by_bit := self._by_register_bit.get(register_address):
+                changed_bits: int = register_change.changed_bits
+
+                while changed_bits:
+                    register_bit: int = (changed_bits & -changed_bits).bit_length() - 1
+                    changed_bits &= changed_bits - 1
+
+                    for neuron_feature in features_by_bit.get(register_bit, []):
+                        if neuron_feature.hardware.feature_type.short_name in feature_types and neuron_feature.update(
+                            register_change.value
+                        ):
+                            features[neuron_feature] = None
+
+            for feature in self._by_register_address.get(register_address, []):
+                if feature.hardware.feature_type.short_name in feature_types and feature.changed:
+                    features[feature] = None
+
+        return iter(features)
@@ -3,7 +3,11 @@
 from dataclasses import dataclass
 from functools import cached_property
 from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Mapping
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 from pymodbus.pdu import ModbusResponse
@@ -18,6 +22,7 @@ from unipi_control.helpers.typing import ModbusClient
 from unipi_control.helpers.typing import ModbusWriteData
 from unipi_control.modbus import ModbusCacheData
 from unipi_control.modbus import check_modbus_call
+from unipi_control.modbus import plan_coil_writes
 
 
 @dataclass
@@ -53,25 +58,86 @@ class NeuronFeature:
         self.val_coil: Optional[int] = (
             None if modbus.val_coil is None else modbus.val_coil + self.hardware.feature_index
         )
-        self._reg_value: Callable[..., int] = lambda: modbus.cache.get_register(
+        self._reg_value: Callable[..., int] = lambda: modbus.cache.get_register_view(
             address=modbus.val_reg, index=1, unit=0
         )[0]
         self.saved_value: Optional[Union[float, int]] = None
 
+        self._value: int = 0
+        self._value_generation: Optional[int] = None
+
     def __repr__(self) -> str:
         return self.base_friendly_name
 
     @property
     def changed(self) -> bool:
         """Detect whether the status has changed."""
-        changed: bool = False
+        value: int = self.value
+        changed: bool = value != self.saved_value
+        self.saved_value = value
+
+        return changed
+
+    def update(self, register_value: int) -> bool:
+        """Update the status from the value register and detect whether the status has changed.
+
+        Parameters
+        ----------
+        register_value: int
+            The new value of the value register.
 
-        if self.value != self.saved_value:
-            changed = True
-            self.saved_value = self.value
+        Returns
+        -------
+        bool
+            ``True`` if the status has changed.
+        """
+        value: int = 1 if register_value & self.register_mask else 0
+        changed: bool = value != self.saved_value
+        self.saved_value = value
 
         return changed
 
+    async def _write_coil(self, value: bool) -> Optional[ModbusResponse]:
+        data: ModbusWriteData = {
+            "address": self.val_coil,
+            "value": value,
+            "slave": 0,
+        }
+
+        response: Optional[ModbusResponse] = await check_modbus_call(self.modbus.client.tcp.write_coil, data)
+
+        if response:
+            self.write_through(value)
+
+        return response
+
+    def write_through(self, value: bool) -> None:
+        """Update the feature status in the register cache after a successful write.
+
+        Parameters
+        ----------
+        value: bool
+            The written feature value.
+        """
+        self.modbus.cache.write_register_bit(
+            scan_type="tcp", unit=0, address=self.modbus.val_reg, mask=self.register_mask, value=value
+        )
+
+    @cached_property
+    def register_addresses(self) -> List[Tuple[int, int]]:
+        """Return the ``(unit, register)`` addresses of the feature value."""
+        return [(0, self.modbus.val_reg)]
+
+    @cached_property
+    def register_bit(self) -> int:
+        """Return the bit of the feature status in the value register."""
+        return self.hardware.feature_index % 16
+
+    @cached_property
+    def register_mask(self) -> int:
+        """Return the mask of the feature status in the value register."""
+        return 0x1 << self.register_bit
+
     @cached_property
     def feature_id(self) -> str:
         """Return unique feature id."""
@@ -124,14 +190,21 @@ class NeuronFeature:
 
     @property
     def payload(self) -> str:
-        """Return the feature state as friendly name."""
-        return FeatureState.ON if self.value == 1 else FeatureState.OFF
+        """Return the last detected feature state as friendly name."""
+        value: Union[float, int] = self.value if self.saved_value is None else self.saved_value
+        return FeatureState.ON if value == 1 else FeatureState.OFF
 
     @property
     def value(self) -> int:
-        """Return the feature state as integer."""
-        mask: int = 0x1 << (self.hardware.feature_index % 16)
-        return 1 if self._reg_value() & mask else 0
+        """Return the feature state as integer.
+
+        The state is decoded at most once per generation of the register cache.
+        """
+        if self._value_generation != (generation := self.modbus.cache.generation):
+            self._value = 1 if self._reg_value() & self.register_mask else 0
+            self._value_generation = generation
+
+        return self._value
 
     @cached_property
     def icon(self) -> Optional[str]:
@@ -164,13 +237,7 @@ class Relay(NeuronFeature):
         -------
         ModbusResponse
         """
-        data: ModbusWriteData = {
-            "address": self.val_coil,
-            "value": value,
-            "slave": 0,
-        }
-
-        return await check_modbus_call(self.modbus.client.tcp.write_coil, data)
+        return await self._write_coil(value)
 
 
 class DigitalOutput(NeuronFeature):
@@ -188,13 +255,7 @@ class DigitalOutput(NeuronFeature):
         -------
         ModbusResponse
         """
-        data: ModbusWriteData = {
-            "address": self.val_coil,
-            "value": value,
-            "slave": 0,
-        }
-
-        return await check_modbus_call(self.modbus.client.tcp.write_coil, data)
+        return await self._write_coil(value)
 
 
 class DigitalInput(NeuronFeature):
@@ -216,10 +277,38 @@ class Led(NeuronFeature):
         -------
         ModbusResponse
         """
-        data: ModbusWriteData = {
-            "address": self.val_coil,
-            "value": value,
-            "slave": 0,
-        }
-
-        return await check_modbus_call(self.modbus.client.tcp.write_coil, data)
+        return await self._write_coil(value)
+
+
+async def set_states(
+    modbus_client: ModbusClient, states: Mapping[Union[DigitalOutput, Led, Relay], bool]
+) -> List[Union[DigitalOutput, Led, Relay]]:
+    """Set the state of multiple output features with as few modbus requests as possible.
+
+    Features with contiguous coils are written with one multiple coil write (FC15).
+
+    Parameters
+    ----------
+    modbus_client: ModbusClient
+        Modbus named tuple with tcp and serial client.
+    states: Mapping
+        The new feature values by feature.
+
+    Returns
+    -------
+    list
+        The features with a successful write.
+    """
+    features_by_coil: Dict[Tuple[int, int], Union[DigitalOutput, Led, Relay]] = {
+        (0, feature.val_coil): feature for feature in states if feature.val_coil is not None
+    }
+    written_features: List[Union[DigitalOutput, Led, Relay]] = []
+
+    for data in plan_coil_writes({coil: states[feature] for coil, feature in features_by_coil.items()}):
+        if await check_modbus_call(modbus_client.tcp.write_coils, data):
+            for index, value in enumerate(data["values"]):
+                feature = features_by_coil[(data["slave"], data["address"] + index)]
+                feature.write_through(value)
+                written_features.append(feature)
+
+    return written_features
@@ -2,8 +2,13 @@
 
 from enum import Enum
 from typing import Final
+from typing import Optional
+from typing import TYPE_CHECKING
 from typing import Tuple
 
+if TYPE_CHECKING:
+    from unipi_control.config import FeatureConfig
+
 
 class FeatureState:
     ON: str = "ON"
@@ -21,3 +26,86 @@ class FeatureType(Enum):
         self.short_name: str = short_name
         self.topic_name: str = topic_name
         self.long_name: str = long_name
+
+
+class PublishPolicy:
+    """Decide whether a changed feature value is published.
+
+    A value is published if it moved more than the deadband away from the last published value and the minimum
+    interval has elapsed. The last value is published again after the maximum interval (heartbeat).
+
+    Attributes
+    ----------
+    deadband: float
+        Absolute deadband.
+    deadband_percent: float
+        Relative deadband in percent of the last published value.
+    min_interval: float
+        Minimum seconds between two publishes.
+    max_interval: float
+        Maximum seconds between two publishes. ``0`` disables the heartbeat.
+    published_value: float, optional
+        The last published value.
+    published_at: float, optional
+        The monotonic time of the last publish.
+    """
+
+    def __init__(self, features_config: Optional["FeatureConfig"]) -> None:
+        self.deadband: float = features_config.deadband if features_config else 0.0
+        self.deadband_percent: float = features_config.deadband_percent if features_config else 0.0
+        self.min_interval: float = features_config.min_interval if features_config else 0.0
+        self.max_interval: float = features_config.max_interval if features_config else 0.0
+
+        self.published_value: Optional[float] = None
+        self.published_at: Optional[float] = None
+
+    @property
+    def is_timed(self) -> bool:
+        """Return ``True`` if the policy must be checked on every scan and not only for changed values."""
+        return bool(self.min_interval or self.max_interval)
+
+    def should_publish(self, value: Optional[float], now: float) -> bool:
+        """Check the policy for the current value.
+
+        Parameters
+        ----------
+        value: float, optional
+            The current feature value.
+        now: float
+            The current monotonic time.
+
+        Returns
+        -------
+        bool
+            ``True`` if the value should be published.
+        """
+        if self.published_at is None:
+            return True
+
+        elapsed: float = now - self.published_at
+
+        if self.max_interval and elapsed >= self.max_interval:
+            return True
+
+        if value == self.published_value or elapsed < self.min_interval:
+            return False
+
+        if value is None or self.published_value is None:
+            return True
+
+        delta: float = abs(value - self.published_value)
+
+        return delta > self.deadband and delta > abs(self.published_value) * self.deadband_percent / 100
+
+    def published(self, value: Optional[float], now: float) -> None:
+        """Remember the published value.
+
+        Parameters
+        ----------
+        value: float, optional
+            The published feature value.
+        now: float
+            The monotonic time of the publish.
+        """
+        self.published_value = value
+        self.published_at = now
@@ -4,6 +4,7 @@ from typing import List
 from typing import NamedTuple
 from typing import Optional
 from typing import TypedDict
+from typing import Union
 
 from pymodbus.client import AsyncModbusSerialClient
 from pymodbus.client import AsyncModbusTcpClient
@@ -18,6 +19,7 @@ class ModbusRegisterBlock(TypedDict):
     start_reg: int
     count: int
     slave: Optional[int]
+    poll: Union[str, float]
 
 
 class ModbusFeature(TypedDict):
@@ -41,6 +43,12 @@ class ModbusWriteData(TypedDict):
     slave: int
 
 
+class ModbusWriteMultipleData(TypedDict):
+    address: int
+    values: List[bool]
+    slave: int
+
+
 class ModbusReadData(TypedDict):
     address: int
     count: int
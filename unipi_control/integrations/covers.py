@@ -3,6 +3,7 @@
 import asyncio
 import functools
 import itertools
+import math
 import time
 from asyncio import Future
 from asyncio import Task
@@ -26,6 +27,10 @@ from typing import Union
 from unipi_control.config import Config
 from unipi_control.config import LogPrefix
 from unipi_control.config import UNIPI_LOGGER
+from unipi_control.events import CoverPositionChanged
+from unipi_control.events import CoverStateChanged
+from unipi_control.events import CoverTiltChanged
+from unipi_control.events import EventBus
 from unipi_control.features.map import FeatureMap
 from unipi_control.features.neuron import DigitalOutput
 from unipi_control.features.neuron import NeuronFeature
@@ -58,6 +63,7 @@ class CoverSettings(NamedTuple):
     device_class: str
     cover_run_time: float
     tilt_change_time: float
+    position_update_interval: float
     cover_up: str
     cover_down: str
     cover_up_feature: Union[DigitalOutput, Relay]
@@ -141,6 +147,7 @@ class CoverTimer:
 class CoverTimerStatus:
     timer: Optional[CoverTimer] = None
     start: Optional[float] = None
+    position_task: Optional[Task] = None
 
 
 @dataclass
@@ -165,12 +172,16 @@ class CoverStatus:
 
 
 class Cover:
-    """Class to control a cover and get the state of it."""
+    """Class to control a cover and get the state of it.
+
+    Every change of the cover state, position or tilt is published as event to the event bus.
+    """
 
     def __init__(
         self,
         config: Config,
         settings: CoverSettings,
+        events: EventBus,
     ) -> None:
         """Initialize cover.
 
@@ -180,9 +191,12 @@ class Cover:
             Dataclass with configuration settings from yaml file.
         settings: CoverSettings
             Cover settings from the yaml configuration.
+        events: EventBus
+            The event bus for the cover changes.
         """
         self.config: Config = config
         self.settings: CoverSettings = settings
+        self.events: EventBus = events
 
         self.status: CoverStatus = CoverStatus()
         self.properties: CoverProperty = getattr(CoverProperties, settings.device_class)
@@ -332,13 +346,52 @@ class Cover:
 
         return False
 
+    def _start_timer(self, cover_run_time: float, notify_position: bool = False) -> None:
+        self.timer.timer = CoverTimer(cover_run_time, self.stop_cover)
+        self.timer.timer.start()
+
+        # Tilt changes and calibration runs do not publish an interpolated position.
+        if notify_position and self.settings.position_update_interval and not self.calibration.mode:
+            self.timer.position_task = asyncio.create_task(self._notify_moving_position(cover_run_time))
+
+    def _cancel_position_task(self) -> None:
+        if self.timer.position_task is not None:
+            self.timer.position_task.cancel()
+            self.timer.position_task = None
+
     def _stop_timer(self) -> None:
         if self.timer.timer is not None:
             self.timer.timer.cancel()
             self.timer.timer = None
 
+        self._cancel_position_task()
         self.timer.start = None
 
+    def _notify(self) -> None:
+        if self.position_changed:
+            self.events.publish(
+                CoverPositionChanged(topic=f"{self.topic}/position", payload=self.status.position, cover=self)
+            )
+
+        if self.tilt_changed:
+            self.events.publish(CoverTiltChanged(topic=f"{self.topic}/tilt", payload=self.status.tilt, cover=self))
+
+        if self.state_changed:
+            self.events.publish(CoverStateChanged(topic=f"{self.topic}/state", payload=self.state, cover=self))
+
+    async def _notify_moving_position(self, cover_run_time: float) -> None:
+        # The position is only changed when the cover stops. Publish the interpolated position while it moves, but
+        # not longer than the cover run time.
+        for _ in range(math.ceil(cover_run_time / self.settings.position_update_interval)):
+            await asyncio.sleep(self.settings.position_update_interval)
+
+            if not (self.is_opening or self.is_closing):
+                break
+
+            if (position := self._moving_position()) != self.current.position:
+                self.current.position = position
+                self.events.publish(CoverPositionChanged(topic=f"{self.topic}/position", payload=position, cover=self))
+
     def _update_state(self) -> None:
         if self.settings.cover_run_time:
             if self.status.position is not None:
@@ -351,27 +404,32 @@ class Cover:
         else:
             self.status.state = CoverState.STOPPED
 
-    def _update_position(self) -> None:
-        if not self.settings.cover_run_time:
-            return
+    def _moving_position(self) -> Optional[int]:
+        position: Optional[int] = self.status.position
 
-        if self.timer.start is None:
-            return
+        if not self.settings.cover_run_time or self.timer.start is None or position is None:
+            return position
 
-        if self.status.position is not None:
-            end_timer = time.monotonic() - self.timer.start
+        end_timer = time.monotonic() - self.timer.start
 
-            if self.is_closing:
-                self.status.position = int(
-                    round(100 * (self.settings.cover_run_time - end_timer) / self.settings.cover_run_time)
-                ) - (100 - self.status.position)
-            elif self.is_opening:
-                self.status.position = self.status.position + int(round(100 * end_timer / self.settings.cover_run_time))
+        if self.is_closing:
+            position = int(round(100 * (self.settings.cover_run_time - end_timer) / self.settings.cover_run_time)) - (
+                100 - position
+            )
+        elif self.is_opening:
+            position = position + int(round(100 * end_timer / self.settings.cover_run_time))
 
-            if self.status.position <= CoverState.CLOSED_IN_PERCENT:
-                self.status.position = CoverState.CLOSED_IN_PERCENT
-            elif self.status.position >= CoverState.OPEN_IN_PERCENT:
-                self.status.position = CoverState.OPEN_IN_PERCENT
+        if position <= CoverState.CLOSED_IN_PERCENT:
+            position = CoverState.CLOSED_IN_PERCENT
+        elif position >= CoverState.OPEN_IN_PERCENT:
+            position = CoverState.OPEN_IN_PERCENT
+
+        return position
+
+    def _update_position(self) -> None:
+        # The interpolated position is based on the position at the start of the move.
+        self._cancel_position_task()
+        self.status.position = self._moving_position()
 
     def _delete_position(self) -> None:
         if self.settings.cover_run_time:
@@ -395,6 +453,8 @@ class Cover:
 
                 self.calibration.mode = True
 
+        self._notify()
+
     async def calibrate(self) -> Optional[float]:
         """Calibrate cover if it is not calibrated.
 
@@ -463,11 +523,12 @@ class Cover:
                     if self.settings.tilt_change_time and cover_run_time < self.settings.tilt_change_time:
                         cover_run_time = self.settings.tilt_change_time
 
-                    self.timer.timer = CoverTimer(cover_run_time, self.stop_cover)
-                    self.timer.timer.start()
+                    self._start_timer(cover_run_time, notify_position=True)
 
                     self._delete_position()
 
+        self._notify()
+
         return cover_run_time
 
     async def close_cover(self, position: int = CoverState.CLOSED_IN_PERCENT) -> Optional[float]:
@@ -524,11 +585,12 @@ class Cover:
                     if self.settings.tilt_change_time and cover_run_time < self.settings.tilt_change_time:
                         cover_run_time = self.settings.tilt_change_time
 
-                    self.timer.timer = CoverTimer(cover_run_time, self.stop_cover)
-                    self.timer.timer.start()
+                    self._start_timer(cover_run_time, notify_position=True)
 
                     self._delete_position()
 
+        self._notify()
+
         return cover_run_time
 
     async def stop_cover(self) -> None:
@@ -551,6 +613,7 @@ class Cover:
                 self.calibration.mode = False
             else:
                 self.status.position = CoverState.CLOSED_IN_PERCENT
+                self._cancel_position_task()
                 return
 
         await self.settings.cover_down_feature.set_state(False)
@@ -561,6 +624,7 @@ class Cover:
         self._update_state()
 
         self.current.device_state = CoverDeviceState.IDLE
+        self._notify()
 
     async def _open_tilt(self, tilt: int = CoverState.OPEN_IN_PERCENT) -> Optional[float]:
         cover_run_time: Optional[float] = None
@@ -579,8 +643,7 @@ class Cover:
 
                 cover_run_time = (tilt - self.status.tilt) * self.settings.tilt_change_time / 100
 
-                self.timer.timer = CoverTimer(cover_run_time, self.stop_cover)
-                self.timer.timer.start()
+                self._start_timer(cover_run_time)
 
                 self._delete_position()
 
@@ -603,8 +666,7 @@ class Cover:
 
                 cover_run_time = (self.status.tilt - tilt) * self.settings.tilt_change_time / 100
 
-                self.timer.timer = CoverTimer(cover_run_time, self.stop_cover)
-                self.timer.timer.start()
+                self._start_timer(cover_run_time)
 
                 self._delete_position()
 
@@ -664,15 +726,18 @@ class Cover:
 
             self.status.tilt = tilt
 
+        self._notify()
+
         return cover_run_time
 
 
 class CoverMap(Mapping[str, List[Cover]]):
-    def __init__(self, config: Config, features: FeatureMap) -> None:
+    def __init__(self, config: Config, features: FeatureMap, events: EventBus) -> None:
         self.data: Dict[str, List[Cover]] = {}
 
         self.config: Config = config
         self.features: FeatureMap = features
+        self.events: EventBus = events
 
     def __getitem__(self, key: str) -> List[Cover]:
         data: List[Cover] = self.data[key]
@@ -711,6 +776,7 @@ class CoverMap(Mapping[str, List[Cover]]):
                         cover_up_feature=cover_up_feature,
                         cover_down_feature=cover_down_feature,
                     ),
+                    events=self.events,
                 )
 
                 _cover.read_position()
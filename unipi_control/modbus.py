@@ -1,28 +1,227 @@
 """Modbus helpers and register caches."""
 
 import asyncio
+import bisect
+import math
+import time
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from dataclasses import field
 from typing import Any
 from typing import Callable
+from typing import Deque
 from typing import Dict
+from typing import Final
 from typing import List
+from typing import Mapping
+from typing import NamedTuple
 from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Tuple
 from typing import Union
 
 from pymodbus.exceptions import ModbusException
+from pymodbus.exceptions import ModbusIOException
 from pymodbus.pdu import ModbusResponse
 
 from unipi_control.config import HardwareMap
+from unipi_control.config import HardwareType
 from unipi_control.config import LogPrefix
+from unipi_control.config import MODBUS_MAX_READ_COUNT
+from unipi_control.config import MODBUS_POLL_TIERS
+from unipi_control.config import ModbusPollingConfig
 from unipi_control.config import UNIPI_LOGGER
+from unipi_control.helpers.exception import ConfigError
 from unipi_control.helpers.typing import HardwareDefinition
 from unipi_control.helpers.typing import ModbusClient
 from unipi_control.helpers.typing import ModbusReadData
 from unipi_control.helpers.typing import ModbusRegisterBlock
 from unipi_control.helpers.typing import ModbusWriteData
+from unipi_control.helpers.typing import ModbusWriteMultipleData
+
+EMPTY_REGISTERS: Final[memoryview] = memoryview(array("H"))
+MODBUS_RTU_MAX_VARIABLE_BAUD_RATE: Final[int] = 19200
+MODBUS_RTU_FIXED_FRAME_GAP: Final[float] = 1.75e-3
+MODBUS_RTU_STATS_SIZE: Final[int] = 50
+MODBUS_CIRCUIT_FAILURE_THRESHOLD: Final[int] = 3
+MODBUS_CIRCUIT_MIN_BACKOFF: Final[float] = 1.0
+MODBUS_CIRCUIT_MAX_BACKOFF: Final[float] = 300.0
+MODBUS_PIPELINING_FAILURE_THRESHOLD: Final[int] = 3
+MODBUS_PIPELINING_PROBE_INTERVAL: Final[float] = 300.0
+MODBUS_LATENCY_BUCKETS: Final[Tuple[float, ...]] = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+@dataclass
+class ModbusCallStats:
+    """Latency histogram and counters of one modbus function and slave.
+
+    Attributes
+    ----------
+    requests: int
+        The number of modbus calls.
+    timeouts: int
+        The number of modbus calls without a response in time.
+    exception_responses: int
+        The number of modbus exception responses.
+    errors: int
+        The number of modbus calls that raised a modbus exception.
+    bytes_sent: int
+        The sent bytes of all request PDUs.
+    bytes_received: int
+        The received bytes of all response PDUs.
+    latency_buckets: list
+        The number of responses by latency bucket. The bucket upper bounds in milliseconds are
+        ``MODBUS_LATENCY_BUCKETS``. The last bucket counts all slower responses.
+    """
+
+    requests: int = 0
+    timeouts: int = 0
+    exception_responses: int = 0
+    errors: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    latency_buckets: List[int] = field(default_factory=lambda: [0] * (len(MODBUS_LATENCY_BUCKETS) + 1))
+
+    def record_latency(self, latency: float) -> None:
+        """Add a response latency in seconds to the histogram."""
+        self.latency_buckets[bisect.bisect_left(MODBUS_LATENCY_BUCKETS, latency * 1e3)] += 1
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """Return the latency bucket upper bound in milliseconds that contains the percentile.
+
+        Parameters
+        ----------
+        percent: float
+            The percentile between 0 and 100.
+
+        Returns
+        -------
+        float, optional
+            The latency in milliseconds, ``math.inf`` for the overflow bucket or ``None`` without responses.
+        """
+        if (responses := sum(self.latency_buckets)) == 0:
+            return None
+
+        rank: float = responses * percent / 100
+        cumulative_responses: int = 0
+
+        for index, bucket in enumerate(self.latency_buckets):
+            cumulative_responses += bucket
+
+            if cumulative_responses >= rank:
+                return MODBUS_LATENCY_BUCKETS[index] if index < len(MODBUS_LATENCY_BUCKETS) else math.inf
+
+        return math.inf
+
+
+class ModbusStats:
+    """Collect latency histograms and counters of all modbus calls by function and slave.
+
+    Attributes
+    ----------
+    calls: dict
+        The call statistics by ``(function, slave)``.
+    """
+
+    def __init__(self) -> None:
+        self.calls: Dict[Tuple[str, int], ModbusCallStats] = {}
+
+    def get(self, function: str, slave: int) -> ModbusCallStats:
+        """Return the call statistics of a modbus function and slave.
+
+        Parameters
+        ----------
+        function: str
+            The modbus client function e.g. read_input_registers.
+        slave: int
+            The slave of the modbus call.
+
+        Returns
+        -------
+        ModbusCallStats
+            The call statistics. Created on the first call.
+        """
+        if (call_stats := self.calls.get((function, slave))) is None:
+            call_stats = self.calls[(function, slave)] = ModbusCallStats()
+
+        return call_stats
+
+    def reset(self) -> None:
+        """Remove all call statistics."""
+        self.calls.clear()
+
+    def log(self) -> None:
+        """Log the call statistics of every modbus function and slave."""
+        for (function, slave), call_stats in sorted(self.calls.items()):
+            UNIPI_LOGGER.info(
+                "%s %s (unit: %s): %s request(s), p50 %s ms, p95 %s ms, p99 %s ms, %s timeout(s), "
+                "%s exception response(s), %s error(s), %s byte(s) sent, %s byte(s) received.",
+                LogPrefix.MODBUS,
+                function,
+                slave,
+                call_stats.requests,
+                call_stats.percentile(50),
+                call_stats.percentile(95),
+                call_stats.percentile(99),
+                call_stats.timeouts,
+                call_stats.exception_responses,
+                call_stats.errors,
+                call_stats.bytes_sent,
+                call_stats.bytes_received,
+            )
+
+
+MODBUS_STATS: Final[ModbusStats] = ModbusStats()
+
+
+def get_request_size(data: Union[ModbusReadData, ModbusWriteData, ModbusWriteMultipleData]) -> int:
+    """Return the size of a modbus request PDU in bytes.
+
+    Parameters
+    ----------
+    data: ModbusReadData
+        Arguments pass to the modbus callback function.
+
+    Returns
+    -------
+    int
+        The function code and data size without the transport header.
+    """
+    if isinstance(values := data.get("values"), list):
+        # Write multiple coils has the address, the quantity, the byte count and the packed values.
+        return 6 + (len(values) + 7) // 8
+
+    # Reads have the address and the quantity, single writes the address and the value.
+    return 5
+
+
+def get_response_size(response: ModbusResponse) -> int:
+    """Return the size of a modbus response PDU in bytes.
+
+    Parameters
+    ----------
+    response: ModbusResponse
+        The modbus response.
+
+    Returns
+    -------
+    int
+        The function code and data size without the transport header.
+    """
+    if registers := getattr(response, "registers", None):
+        return 2 + len(registers) * 2
+
+    if bits := getattr(response, "bits", None):
+        return 2 + (len(bits) + 7) // 8
+
+    # Write responses echo the address and the value or quantity.
+    return 5
 
 
 async def check_modbus_call(
-    callback: Callable[..., Any], data: Union[ModbusReadData, ModbusWriteData]
+    callback: Callable[..., Any], data: Union[ModbusReadData, ModbusWriteData, ModbusWriteMultipleData]
 ) -> Optional[ModbusResponse]:
     """Check modbus read/write call has errors and log the errors.
 
@@ -39,20 +238,549 @@ async def check_modbus_call(
         Return modbus response if no errors found else None.
     """
     response: Optional[ModbusResponse] = None
+    call_stats: ModbusCallStats = MODBUS_STATS.get(getattr(callback, "__name__", "unknown"), data["slave"] or 0)
+    call_stats.requests += 1
+    call_stats.bytes_sent += get_request_size(data)
+    start: float = time.perf_counter()
 
     try:
         response = await callback(**data)
+        call_stats.record_latency(time.perf_counter() - start)
 
         if response and response.isError():
+            call_stats.exception_responses += 1
             response = None
+        elif response:
+            call_stats.bytes_received += get_response_size(response)
+    except ModbusIOException as error:
+        # The client raises an I/O exception if no response was received after all retries.
+        call_stats.timeouts += 1
+        UNIPI_LOGGER.error("%s %s", LogPrefix.MODBUS, error)
     except ModbusException as error:
+        call_stats.errors += 1
         UNIPI_LOGGER.error("%s %s", LogPrefix.MODBUS, error)
     except asyncio.exceptions.TimeoutError:
+        call_stats.timeouts += 1
         UNIPI_LOGGER.error("%s Timeout on: %s", LogPrefix.MODBUS, data)
 
     return response
 
 
+def get_slave(modbus_register_block: ModbusRegisterBlock, unit: int) -> int:
+    """Return the slave of a register block.
+
+    Parameters
+    ----------
+    modbus_register_block: ModbusRegisterBlock
+        The register block.
+    unit: int
+        The default slave for blocks without a slave.
+
+    Returns
+    -------
+    int
+        The slave that is read.
+    """
+    slave: Optional[int] = modbus_register_block["slave"]
+    return unit if slave is None else slave
+
+
+def plan_register_blocks(
+    modbus_register_blocks: List[ModbusRegisterBlock], unit: int, max_register_gap: int = 0
+) -> List[ModbusRegisterBlock]:
+    """Merge adjacent and nearly adjacent register blocks into as few reads as possible.
+
+    Blocks are grouped by slave and polling tier and sorted by start register.
+    A block is merged into the previous read if the gap between them is not
+    greater than ``max_register_gap`` and the merged read stays within the
+    Modbus limit of 125 registers. Blocks without a ``poll`` key are polled
+    in the ``fast`` tier.
+
+    Parameters
+    ----------
+    modbus_register_blocks: list
+        Register blocks from the hardware definition.
+    unit: int
+        The default slave for blocks without a ``slave`` key.
+    max_register_gap: int
+        Maximum number of unused registers between two blocks that are read together.
+
+    Returns
+    -------
+    list
+        The planned register blocks for one full scan.
+
+    Raises
+    ------
+    ConfigError
+        Get an exception if a polling tier is invalid.
+    """
+    register_blocks: List[ModbusRegisterBlock] = sorted(
+        (
+            ModbusRegisterBlock(
+                start_reg=modbus_register_block["start_reg"],
+                count=modbus_register_block["count"],
+                slave=modbus_register_block.get("slave", unit),
+                poll=modbus_register_block.get("poll", "fast"),
+            )
+            for modbus_register_block in modbus_register_blocks
+        ),
+        key=lambda register_block: (
+            register_block["slave"] or 0,
+            str(register_block["poll"]),
+            register_block["start_reg"],
+        ),
+    )
+
+    for register_block in register_blocks:
+        poll: Union[str, float] = register_block["poll"]
+
+        if not (
+            poll in MODBUS_POLL_TIERS or (isinstance(poll, (int, float)) and not isinstance(poll, bool) and poll > 0)
+        ):
+            exception_message: str = (
+                f"{LogPrefix.MODBUS} Invalid poll '{poll}' in register block {register_block['start_reg']} "
+                f"(unit: {unit}). The following polling tiers are allowed: {' '.join(MODBUS_POLL_TIERS)} "
+                "or an interval in seconds."
+            )
+            raise ConfigError(exception_message)
+
+    planned_blocks: List[ModbusRegisterBlock] = []
+
+    for register_block in register_blocks:
+        if planned_blocks:
+            planned_block: ModbusRegisterBlock = planned_blocks[-1]
+            planned_end: int = planned_block["start_reg"] + planned_block["count"]
+            merged_end: int = max(planned_end, register_block["start_reg"] + register_block["count"])
+
+            if (
+                planned_block["slave"] == register_block["slave"]
+                and planned_block["poll"] == register_block["poll"]
+                and register_block["start_reg"] - planned_end <= max_register_gap
+                and merged_end - planned_block["start_reg"] <= MODBUS_MAX_READ_COUNT
+            ):
+                planned_block["count"] = merged_end - planned_block["start_reg"]
+                continue
+
+        planned_blocks.append(register_block)
+
+    return planned_blocks
+
+
+def plan_coil_writes(coils: Mapping[Tuple[int, int], bool]) -> List[ModbusWriteMultipleData]:
+    """Coalesce coil writes into as few multiple coil writes (FC15) as possible.
+
+    Coils are grouped by slave and every contiguous coil range is written with one request.
+
+    Parameters
+    ----------
+    coils: Mapping
+        The coil values by ``(slave, coil)`` address.
+
+    Returns
+    -------
+    list
+        The write requests sorted by slave and coil address.
+    """
+    coil_writes: List[ModbusWriteMultipleData] = []
+
+    for slave, address in sorted(coils):
+        value: bool = coils[(slave, address)]
+
+        if (
+            coil_writes
+            and (coil_write := coil_writes[-1])["slave"] == slave
+            and coil_write["address"] + len(coil_write["values"]) == address
+        ):
+            coil_write["values"].append(value)
+        else:
+            coil_writes.append({"address": address, "values": [value], "slave": slave})
+
+    return coil_writes
+
+
+class RegisterChange(NamedTuple):
+    value: int
+    changed_bits: int
+
+
+@dataclass
+class ModbusRegisterSegment:
+    start: int
+    count: int
+    words: array = field(init=False)
+    words_view: memoryview = field(init=False)
+    filled: bytearray = field(init=False)
+    complete: bool = field(init=False, default=False)
+
+    def __post_init__(self) -> None:
+        self.words = array("H", [0]) * self.count
+        self.words_view = memoryview(self.words)
+        self.filled = bytearray(self.count)
+
+    @property
+    def end(self) -> int:
+        """Return the first address after this segment."""
+        return self.start + self.count
+
+
+class ModbusRegisterStore:
+    """Compact register store with an unsigned 16 bit array segment per register block.
+
+    Attributes
+    ----------
+    segments: dict
+        Sorted register segments by unit.
+    generation: int
+        Incremented whenever a stored register changes. Values decoded from the registers are valid as long as
+        the generation is unchanged.
+    """
+
+    def __init__(self) -> None:
+        self.segments: Dict[int, List[ModbusRegisterSegment]] = {}
+        self.generation: int = 0
+        self._segments_by_address: Dict[int, Dict[int, ModbusRegisterSegment]] = {}
+
+    def _find_segment(self, unit: int, address: int) -> Optional[ModbusRegisterSegment]:
+        segments: Optional[Dict[int, ModbusRegisterSegment]] = self._segments_by_address.get(unit)
+        return segments.get(address) if segments else None
+
+    def allocate(self, unit: int, start: int, count: int) -> ModbusRegisterSegment:
+        """Allocate a register segment.
+
+        Overlapping and adjacent segments are merged into one segment and keep their registers.
+
+        Parameters
+        ----------
+        unit: int
+            The unit of the registers.
+        start: int
+            The first register address.
+        count: int
+            The number of registers.
+
+        Returns
+        -------
+        ModbusRegisterSegment
+            The segment that contains the registers.
+        """
+        segments: List[ModbusRegisterSegment] = self.segments.setdefault(unit, [])
+        end: int = start + count
+
+        merged_segments: List[ModbusRegisterSegment] = [
+            segment for segment in segments if segment.start <= end and start <= segment.end
+        ]
+
+        if len(merged_segments) == 1 and merged_segments[0].start <= start and end <= merged_segments[0].end:
+            return merged_segments[0]
+
+        merged_start: int = min([start, *(segment.start for segment in merged_segments)])
+        merged_end: int = max([end, *(segment.end for segment in merged_segments)])
+        merged_segment: ModbusRegisterSegment = ModbusRegisterSegment(
+            start=merged_start, count=merged_end - merged_start
+        )
+
+        for segment in merged_segments:
+            offset: int = segment.start - merged_start
+            merged_segment.words_view[offset : offset + segment.count] = segment.words_view
+            merged_segment.filled[offset : offset + segment.count] = segment.filled
+            segment.words_view.release()
+            segments.remove(segment)
+
+        segments.append(merged_segment)
+        segments.sort(key=lambda segment: segment.start)
+        self._segments_by_address.setdefault(unit, {}).update(
+            dict.fromkeys(range(merged_segment.start, merged_segment.end), merged_segment)
+        )
+
+        return merged_segment
+
+    def store_block(self, unit: int, start: int, words: Sequence[int]) -> Dict[int, RegisterChange]:
+        """Store a block of registers in place and compare it with the previous copy.
+
+        Parameters
+        ----------
+        unit: int
+            The unit of the registers.
+        start: int
+            The first register address.
+        words: Sequence
+            The register values.
+
+        Returns
+        -------
+        dict
+            The changes of all registers that changed or were stored the first time by address.
+        """
+        count: int = len(words)
+        segment: Optional[ModbusRegisterSegment] = self._find_segment(unit, start)
+
+        if segment is None or start + count > segment.end:
+            segment = self.allocate(unit, start, count)
+
+        offset: int = start - segment.start
+        new_words: array = array("H", words)
+        old_words: memoryview = segment.words_view[offset : offset + count]
+        register_changes: Dict[int, RegisterChange] = {}
+
+        if not segment.complete or old_words != new_words:
+            filled: bytearray = segment.filled
+
+            for index in range(count):
+                changed_bits: int = old_words[index] ^ new_words[index] if filled[offset + index] else 0xFFFF
+
+                if changed_bits:
+                    register_changes[start + index] = RegisterChange(value=new_words[index], changed_bits=changed_bits)
+
+            old_words[:] = new_words
+
+            if register_changes:
+                self.generation += 1
+
+            if not segment.complete:
+                filled[offset : offset + count] = b"\x01" * count
+                segment.complete = filled.find(0) == -1
+
+        return register_changes
+
+    def view(self, unit: int, address: int, count: int) -> Optional[memoryview]:
+        """Return a zero-copy view of stored registers.
+
+        Parameters
+        ----------
+        unit: int
+            The unit of the registers.
+        address: int
+            The first register address.
+        count: int
+            The number of registers.
+
+        Returns
+        -------
+        memoryview, optional
+            The registers or ``None`` if at least one register was not stored.
+        """
+        segment: Optional[ModbusRegisterSegment] = self._find_segment(unit, address)
+
+        if segment is None or address + count > segment.end:
+            return None
+
+        offset: int = address - segment.start
+
+        if not segment.complete and segment.filled.find(0, offset, offset + count) != -1:
+            return None
+
+        return segment.words_view[offset : offset + count]
+
+
+def get_rtu_frame_gap(baud_rate: int, parity: str, stop_bits: int = 1) -> float:
+    """Get the Modbus RTU inter-frame gap of 3.5 character times.
+
+    Parameters
+    ----------
+    baud_rate: int
+        The baud rate of the serial bus.
+    parity: str
+        The parity of the serial bus e.g. N, E or O.
+    stop_bits: int
+        The number of stop bits.
+
+    Returns
+    -------
+    float
+        The inter-frame gap in seconds. Above 19200 baud the fixed gap of 1.75 ms is used.
+    """
+    if baud_rate > MODBUS_RTU_MAX_VARIABLE_BAUD_RATE:
+        return MODBUS_RTU_FIXED_FRAME_GAP
+
+    # Start bit, 8 data bits, optional parity bit and stop bits.
+    character_bits: int = 1 + 8 + (0 if parity.upper() == "N" else 1) + stop_bits
+    return 3.5 * character_bits / baud_rate
+
+
+class RTUBusScheduler:
+    """Run Modbus RTU requests back to back with the inter-frame gap of the serial bus.
+
+    Attributes
+    ----------
+    frame_gap: float
+        The silent interval in seconds between two frames.
+    request_times: deque
+        The monotonic end times of the latest requests.
+    """
+
+    def __init__(self, baud_rate: int, parity: str, stop_bits: int = 1) -> None:
+        self.frame_gap: float = get_rtu_frame_gap(baud_rate=baud_rate, parity=parity, stop_bits=stop_bits)
+        self.request_times: Deque[float] = deque(maxlen=MODBUS_RTU_STATS_SIZE)
+
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._last_frame_end: float = 0
+
+    @property
+    def requests_per_second(self) -> float:
+        """Return the achieved requests per second of the latest requests."""
+        if len(self.request_times) < 2:
+            return 0.0
+
+        return (len(self.request_times) - 1) / max(self.request_times[-1] - self.request_times[0], 1e-9)
+
+    async def execute(
+        self, callback: Callable[..., Any], data: Union[ModbusReadData, ModbusWriteData]
+    ) -> Optional[ModbusResponse]:
+        """Wait for the inter-frame gap and run the modbus call.
+
+        Parameters
+        ----------
+        callback: Callable
+            modbus callback function e.g. read_input_registers()
+        data: dict
+            The modbus call arguments.
+
+        Returns
+        -------
+        ModbusResponse, optional
+            The modbus response or ``None`` if the modbus call failed.
+        """
+        async with self._lock:
+            if (delay := self._last_frame_end + self.frame_gap - time.monotonic()) > 0:
+                await asyncio.sleep(delay)
+
+            response: Optional[ModbusResponse] = await check_modbus_call(callback, data)
+
+            self._last_frame_end = time.monotonic()
+            self.request_times.append(self._last_frame_end)
+
+        return response
+
+
+class ModbusSlaveHealth:
+    """Circuit breaker for a modbus slave that stops answering.
+
+    After ``MODBUS_CIRCUIT_FAILURE_THRESHOLD`` scans in a row with a failed read the circuit opens. The register
+    blocks of an open circuit are skipped and only one read probes the slave when the backoff has elapsed. The backoff
+    doubles with every failed probe up to ``MODBUS_CIRCUIT_MAX_BACKOFF``. A successful read closes the circuit.
+
+    Attributes
+    ----------
+    failures: int
+        The number of scans in a row with a failed read.
+    backoff: float
+        The current backoff in seconds.
+    next_probe: float
+        The monotonic time of the next probe.
+    """
+
+    def __init__(self) -> None:
+        self.failures: int = 0
+        self.backoff: float = 0
+        self.next_probe: float = 0
+
+    @property
+    def is_open(self) -> bool:
+        """Return ``True`` if the slave does not answer."""
+        return self.failures >= MODBUS_CIRCUIT_FAILURE_THRESHOLD
+
+    def is_probe_due(self, now: float) -> bool:
+        """Return ``True`` if the backoff of an open circuit has elapsed."""
+        return now >= self.next_probe
+
+    def record_success(self) -> bool:
+        """Close the circuit after a successful read.
+
+        Returns
+        -------
+        bool
+            ``True`` if the circuit was open.
+        """
+        was_open: bool = self.is_open
+
+        self.failures = 0
+        self.backoff = 0
+        self.next_probe = 0
+
+        return was_open
+
+    def record_failure(self, now: float) -> bool:
+        """Count a scan with a failed read and schedule the next probe if the circuit is open.
+
+        Parameters
+        ----------
+        now: float
+            The monotonic time of the failed read.
+
+        Returns
+        -------
+        bool
+            ``True`` if the circuit is open.
+        """
+        self.failures += 1
+
+        if self.is_open:
+            self.backoff = min(self.backoff * 2, MODBUS_CIRCUIT_MAX_BACKOFF) or MODBUS_CIRCUIT_MIN_BACKOFF
+            self.next_probe = now + self.backoff
+
+        return self.is_open
+
+
+class RTUPollScheduler:
+    """Interleave Modbus RTU slaves with a smooth weighted round-robin.
+
+    Every slave is selected ``priority`` times per weighted round and at least
+    once in every round, so the staleness of a slave is bounded by two rounds.
+
+    Attributes
+    ----------
+    priorities: dict
+        The priority (weight) by unit.
+    last_reads: dict
+        The monotonic time of the last successful read by unit.
+    """
+
+    def __init__(self, priorities: Dict[int, int]) -> None:
+        self.priorities: Dict[int, int] = priorities
+        self.last_reads: Dict[int, float] = {}
+
+        self._current_weights: Dict[int, int] = dict.fromkeys(priorities, 0)
+
+    @property
+    def round_size(self) -> int:
+        """Return the number of turns in one weighted round."""
+        return sum(self.priorities.values())
+
+    def next_unit(self) -> int:
+        """Select the unit for the next turn.
+
+        Returns
+        -------
+        int
+            The unit with the highest current weight.
+        """
+        for unit, priority in self.priorities.items():
+            self._current_weights[unit] += priority
+
+        unit = max(self._current_weights, key=lambda _unit: self._current_weights[_unit])
+        self._current_weights[unit] -= self.round_size
+
+        return unit
+
+    def freshness(self, now: float) -> Dict[int, Optional[float]]:
+        """Get the age of the cached registers by unit.
+
+        Parameters
+        ----------
+        now: float
+            The current monotonic time.
+
+        Returns
+        -------
+        dict
+            Milliseconds since the last successful read or ``None`` if the unit was never read.
+        """
+        return {
+            unit: (now - self.last_reads[unit]) * 1000 if unit in self.last_reads else None for unit in self.priorities
+        }
+
+
 class ModbusCacheData:
     """Class that scan modbus register blocks and cache the response.
 
@@ -62,21 +790,152 @@ class ModbusCacheData:
         A modbus client.
     hardware: HardwareMap
         The Unipi Neuron hardware definitions.
+    registers: ModbusRegisterStore
+        The cached registers.
+    scan_plan: dict
+        The planned reads for one full scan by unit.
+    pipelining: bool
+        Send all TCP reads of a scan at once. Disabled if the server does not support it.
+    pipelining_failures: int
+        The number of pipelined scans in a row that only succeeded with serial retries.
+    next_pipelining_probe: float
+        The monotonic time when a disabled pipelining is probed again.
+    next_reads: dict
+        The monotonic time when a planned register block is due by ``(unit, start_reg)``.
+    serial_bus: RTUBusScheduler
+        Scheduler for all requests on the Modbus RTU bus.
+    serial_poll: RTUPollScheduler
+        Round-robin scheduler for the Modbus RTU slaves.
+    written_registers: dict
+        The changed bits of registers updated by successful writes by scan type and ``(unit, register)`` address.
+    slave_health: dict
+        The circuit breaker of every modbus slave.
     """
 
     def __init__(self, modbus_client: ModbusClient, hardware: HardwareMap) -> None:
         self.modbus_client: ModbusClient = modbus_client
         self.hardware: HardwareMap = hardware
+        self.serial_bus: RTUBusScheduler = RTUBusScheduler(
+            baud_rate=hardware.config.modbus_serial.baud_rate, parity=hardware.config.modbus_serial.parity
+        )
+        extension_units: Set[int] = {
+            definition.unit for definition in hardware.get_definition_by_hardware_types([HardwareType.EXTENSION])
+        }
+        self.serial_poll: RTUPollScheduler = RTUPollScheduler(
+            priorities={
+                unit.unit: unit.priority for unit in hardware.config.modbus_serial.units if unit.unit in extension_units
+            }
+        )
+
+        self.registers: ModbusRegisterStore = ModbusRegisterStore()
+        self.scan_plan: Dict[int, List[ModbusRegisterBlock]] = {}
+        self.pipelining: bool = True
+        self.pipelining_failures: int = 0
+        self.next_pipelining_probe: float = 0
+        self.next_reads: Dict[Tuple[int, int], float] = {}
+        self.written_registers: Dict[str, Dict[Tuple[int, int], int]] = {}
+        self.slave_health: Dict[int, ModbusSlaveHealth] = {}
+
+        self._write_events: Dict[str, asyncio.Event] = {}
+
+        self._init_scan_plan()
+
+    def _get_write_event(self, scan_type: str) -> asyncio.Event:
+        if (write_event := self._write_events.get(scan_type)) is None:
+            write_event = self._write_events[scan_type] = asyncio.Event()
 
-        self.data: Dict[int, Dict[int, int]] = {}
+        return write_event
+
+    def _get_polling(self, definition: HardwareDefinition) -> ModbusPollingConfig:
+        polling: ModbusPollingConfig = (
+            self.hardware.config.modbus_tcp.polling
+            if definition.hardware_type == HardwareType.NEURON
+            else self.hardware.config.modbus_serial.polling
+        )
+
+        return polling
+
+    def _get_poll_interval(self, definition: HardwareDefinition, modbus_register_block: ModbusRegisterBlock) -> float:
+        poll: Union[str, float] = modbus_register_block["poll"]
+
+        if poll == "once":
+            return math.inf
+
+        if isinstance(poll, str):
+            interval: float = getattr(self._get_polling(definition), poll)
+            return interval
+
+        return float(poll)
+
+    def _get_due_blocks(self, definition: HardwareDefinition, now: float) -> List[ModbusRegisterBlock]:
+        due_blocks: List[ModbusRegisterBlock] = [
+            modbus_register_block
+            for modbus_register_block in self.scan_plan[definition.unit]
+            if modbus_register_block["poll"] == "fast"
+            or self.next_reads.get((definition.unit, modbus_register_block["start_reg"]), 0) <= now
+        ]
+
+        probed_slaves: Set[int] = set()
+        available_blocks: List[ModbusRegisterBlock] = []
+
+        for modbus_register_block in due_blocks:
+            slave: int = get_slave(modbus_register_block, definition.unit)
+
+            if (slave_health := self.slave_health[slave]).is_open:
+                # Skip the slave until the backoff has elapsed and then probe it with one read.
+                if slave in probed_slaves or not slave_health.is_probe_due(now):
+                    continue
+
+                probed_slaves.add(slave)
+
+            available_blocks.append(modbus_register_block)
+
+        return available_blocks
+
+    def _init_scan_plan(self) -> None:
+        for definition in self.hardware.values():
+            max_register_gap: int = (
+                self.hardware.config.modbus_tcp.max_register_gap
+                if definition.hardware_type == HardwareType.NEURON
+                else self.hardware.config.modbus_serial.max_register_gap
+            )
+
+            self.scan_plan[definition.unit] = plan_register_blocks(
+                definition.modbus_register_blocks, unit=definition.unit, max_register_gap=max_register_gap
+            )
+
+            UNIPI_LOGGER.info(
+                "%s %s register block(s) for unit %s merged into %s read(s) per scan.",
+                LogPrefix.MODBUS,
+                len(definition.modbus_register_blocks),
+                definition.unit,
+                len(self.scan_plan[definition.unit]),
+            )
+
+            for register_block in self.scan_plan[definition.unit]:
+                self.registers.allocate(definition.unit, register_block["start_reg"], register_block["count"])
+                self.slave_health.setdefault(get_slave(register_block, definition.unit), ModbusSlaveHealth())
+
+                UNIPI_LOGGER.debug(
+                    "%s Planned read for unit %s: %s",
+                    LogPrefix.MODBUS,
+                    definition.unit,
+                    register_block,
+                )
 
     async def _save_response(
-        self, scan_type: str, modbus_register_block: ModbusRegisterBlock, definition: HardwareDefinition
-    ) -> None:
+        self,
+        scan_type: str,
+        modbus_register_block: ModbusRegisterBlock,
+        definition: HardwareDefinition,
+        dirty_registers: Dict[Tuple[int, int], RegisterChange],
+        failed_slaves: Set[int],
+    ) -> bool:
+        slave: int = get_slave(modbus_register_block, definition.unit)
         data: ModbusReadData = {
             "address": modbus_register_block["start_reg"],
             "count": modbus_register_block["count"],
-            "slave": modbus_register_block.get("slave", definition.unit),
+            "slave": slave,
         }
 
         response: Optional[ModbusResponse] = None
@@ -84,24 +943,319 @@ class ModbusCacheData:
         if scan_type == "tcp":
             response = await check_modbus_call(self.modbus_client.tcp.read_input_registers, data)
         elif scan_type == "serial":
-            response = await check_modbus_call(self.modbus_client.serial.read_input_registers, data)
+            response = await self.serial_bus.execute(self.modbus_client.serial.read_input_registers, data)
+
+        slave_health: ModbusSlaveHealth = self.slave_health[slave]
+
+        if not response:
+            # Only the first failed read of a slave per scan is counted.
+            if slave not in failed_slaves:
+                failed_slaves.add(slave)
+
+                if slave_health.record_failure(time.monotonic()):
+                    UNIPI_LOGGER.warning(
+                        "%s Unit %s does not respond. Cached registers are stale. Next probe in %s seconds.",
+                        LogPrefix.MODBUS,
+                        slave,
+                        slave_health.backoff,
+                    )
+
+            return False
 
-        if response:
-            register: List[int] = response.registers
-            for index in range(data["count"]):
-                self.data[definition.unit][data["address"] + index] = register[index]
+        if slave_health.record_success():
+            UNIPI_LOGGER.info("%s Unit %s responds again.", LogPrefix.MODBUS, slave)
 
-    async def scan(self, scan_type: str, hardware_types: List[str]) -> None:
-        """Read modbus register blocks and cache the response."""
-        for definition in self.hardware.get_definition_by_hardware_types(hardware_types):
-            if not self.data.get(definition.unit):
-                self.data[definition.unit] = {}
+        self.next_reads[(definition.unit, modbus_register_block["start_reg"])] = time.monotonic() + (
+            self._get_poll_interval(definition, modbus_register_block)
+        )
 
-            if scan_type == "serial":
-                await asyncio.sleep(1)
+        for address, register_change in self.registers.store_block(
+            definition.unit, data["address"], response.registers
+        ).items():
+            dirty_registers[(definition.unit, address)] = register_change
 
-            for modbus_register_block in definition.modbus_register_blocks:
-                await self._save_response(scan_type, modbus_register_block, definition)
+        return True
+
+    async def _read_blocks(
+        self,
+        scan_type: str,
+        modbus_register_blocks: List[ModbusRegisterBlock],
+        definition: HardwareDefinition,
+        dirty_registers: Dict[Tuple[int, int], RegisterChange],
+        failed_slaves: Set[int],
+    ) -> List[bool]:
+        results: List[bool] = []
+
+        for modbus_register_block in modbus_register_blocks:
+            results.append(
+                await self._save_response(scan_type, modbus_register_block, definition, dirty_registers, failed_slaves)
+            )
+
+            # Don't wait for the timeouts of the remaining blocks when the slave did not answer in this scan.
+            if not results[-1]:
+                break
+
+        return results
+
+    async def _scan_pipelined(
+        self,
+        definitions: List[HardwareDefinition],
+        dirty_registers: Dict[Tuple[int, int], RegisterChange],
+        failed_slaves: Set[int],
+    ) -> None:
+        """Send all reads at once and let the TCP client match the responses by transaction ID.
+
+        If only some reads fail, they are repeated one by one. When all of them succeed now in
+        ``MODBUS_PIPELINING_FAILURE_THRESHOLD`` scans in a row, the server does not support pipelining and the
+        following scans are serial. Pipelining is probed again after ``MODBUS_PIPELINING_PROBE_INTERVAL``. The
+        retries count as the same scan for the circuit breaker.
+        """
+        now: float = time.monotonic()
+        requests: List[Tuple[ModbusRegisterBlock, HardwareDefinition]] = [
+            (modbus_register_block, definition)
+            for definition in definitions
+            for modbus_register_block in self._get_due_blocks(definition, now)
+        ]
+
+        results: List[bool] = await asyncio.gather(
+            *(
+                self._save_response("tcp", modbus_register_block, definition, dirty_registers, failed_slaves)
+                for modbus_register_block, definition in requests
+            )
+        )
+
+        failed_requests: List[Tuple[ModbusRegisterBlock, HardwareDefinition]] = [
+            requests[index] for index, result in enumerate(results) if not result
+        ]
+
+        if failed_requests and len(failed_requests) < len(requests):
+            retried: List[bool] = [
+                await self._save_response("tcp", modbus_register_block, definition, dirty_registers, failed_slaves)
+                for modbus_register_block, definition in failed_requests
+            ]
+
+            if all(retried):
+                self._record_pipelining_failure()
+        elif requests and not failed_requests:
+            self.pipelining_failures = 0
+
+            if not self.pipelining:
+                self.pipelining = True
+                UNIPI_LOGGER.info("%s TCP server supports pipelining again.", LogPrefix.MODBUS)
+
+    def _record_pipelining_failure(self) -> None:
+        self.pipelining_failures += 1
+
+        # A failed probe falls back immediately.
+        if self.pipelining and self.pipelining_failures < MODBUS_PIPELINING_FAILURE_THRESHOLD:
+            return
+
+        self.pipelining = False
+        self.next_pipelining_probe = time.monotonic() + MODBUS_PIPELINING_PROBE_INTERVAL
+
+        UNIPI_LOGGER.warning(
+            "%s TCP server does not support pipelining. Fall back to serial reads for %s seconds.",
+            LogPrefix.MODBUS,
+            MODBUS_PIPELINING_PROBE_INTERVAL,
+        )
+
+    async def _scan_round_robin(
+        self,
+        definitions: List[HardwareDefinition],
+        dirty_registers: Dict[Tuple[int, int], RegisterChange],
+        failed_slaves: Set[int],
+    ) -> None:
+        """Read the due blocks of one slave per turn until the scan budget or one weighted round is used up.
+
+        The next scan continues the round-robin, so a slow slave only delays its own turn.
+        """
+        definitions_by_unit: Dict[int, HardwareDefinition] = {
+            definition.unit: definition for definition in definitions if definition.unit in self.serial_poll.priorities
+        }
+
+        if not definitions_by_unit:
+            return
+
+        start: float = time.monotonic()
+        requests: int = 0
+
+        for _ in range(self.serial_poll.round_size):
+            if requests and time.monotonic() - start >= self.hardware.config.modbus_serial.scan_budget:
+                break
+
+            unit: int = self.serial_poll.next_unit()
+
+            if not (definition := definitions_by_unit.get(unit)):
+                continue
+
+            due_blocks: List[ModbusRegisterBlock] = self._get_due_blocks(definition, time.monotonic())
+            results: List[bool] = await self._read_blocks(
+                "serial", due_blocks, definition, dirty_registers, failed_slaves
+            )
+            requests += len(results)
+
+            if due_blocks and len(results) == len(due_blocks) and all(results):
+                self.serial_poll.last_reads[unit] = time.monotonic()
+
+        if requests:
+            UNIPI_LOGGER.debug(
+                "%s %s serial request(s) in %.1f ms (%.1f requests/s). Freshness: %s",
+                LogPrefix.MODBUS,
+                requests,
+                (time.monotonic() - start) * 1000,
+                self.serial_bus.requests_per_second,
+                ", ".join(
+                    f"unit {unit} {'-' if freshness is None else f'{freshness:.0f}'} ms"
+                    for unit, freshness in self.serial_poll.freshness(time.monotonic()).items()
+                ),
+            )
+
+    async def scan(self, scan_type: str, hardware_types: List[str]) -> Dict[Tuple[int, int], RegisterChange]:
+        """Read all due modbus register blocks and cache the response.
+
+        Blocks in the ``fast`` tier are read on every scan, all other blocks when their polling interval has
+        elapsed. Blocks in the ``once`` tier are only read until the first successful read. TCP reads are
+        pipelined, serial slaves are read in a weighted round-robin within the scan budget.
+
+        Parameters
+        ----------
+        scan_type: str
+            The modbus client to use e.g. tcp or serial.
+        hardware_types: list
+            List of hardware types e.g. Neuron, Extension, ...
+
+        Returns
+        -------
+        dict
+            The register changes of this scan by dirty ``(unit, register)`` address.
+        """
+        definitions: List[HardwareDefinition] = list(self.hardware.get_definition_by_hardware_types(hardware_types))
+        dirty_registers: Dict[Tuple[int, int], RegisterChange] = {}
+        failed_slaves: Set[int] = set()
+
+        if scan_type == "tcp" and (self.pipelining or time.monotonic() >= self.next_pipelining_probe):
+            await self._scan_pipelined(definitions, dirty_registers, failed_slaves)
+            return dirty_registers
+
+        if scan_type == "serial":
+            await self._scan_round_robin(definitions, dirty_registers, failed_slaves)
+            return dirty_registers
+
+        now: float = time.monotonic()
+
+        for definition in definitions:
+            await self._read_blocks(
+                scan_type, self._get_due_blocks(definition, now), definition, dirty_registers, failed_slaves
+            )
+
+        return dirty_registers
+
+    def write_register_bit(self, scan_type: str, unit: int, address: int, mask: int, value: bool) -> None:
+        """Update a bit of a cached register after a successful write.
+
+        The updated bit is published without waiting for the next scan. The next scan reads the register from the
+        hardware and reconciles the cached bit.
+
+        Parameters
+        ----------
+        scan_type: str
+            The scan type of the register e.g. tcp or serial.
+        unit: int
+            The unit of the register.
+        address: int
+            The register address.
+        mask: int
+            The mask of the bit in the register.
+        value: bool
+            The written value.
+        """
+        if (registers := self.registers.view(unit, address, 1)) is None:
+            return
+
+        register: int = registers[0] | mask if value else registers[0] & (0xFFFF ^ mask)
+        register_changes: Dict[int, RegisterChange] = self.registers.store_block(unit, address, [register])
+
+        if register_changes:
+            written_registers: Dict[Tuple[int, int], int] = self.written_registers.setdefault(scan_type, {})
+
+            for register_address, register_change in register_changes.items():
+                written_registers[(unit, register_address)] = (
+                    written_registers.get((unit, register_address), 0) | register_change.changed_bits
+                )
+
+            self._get_write_event(scan_type).set()
+
+    async def wait_for_writes(self, scan_type: str, timeout: float) -> Dict[Tuple[int, int], RegisterChange]:
+        """Wait until a register was updated by a write or the timeout is reached.
+
+        Parameters
+        ----------
+        scan_type: str
+            The scan type of the registers e.g. tcp or serial.
+        timeout: float
+            Maximum time to wait in seconds.
+
+        Returns
+        -------
+        dict
+            The changes of all written registers by ``(unit, register)`` address with the current cached value.
+        """
+        write_event: asyncio.Event = self._get_write_event(scan_type)
+
+        try:
+            await asyncio.wait_for(write_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return {}
+
+        write_event.clear()
+
+        return {
+            (unit, address): RegisterChange(
+                value=self.get_register_view(address, 1, unit)[0], changed_bits=changed_bits
+            )
+            for (unit, address), changed_bits in self.written_registers.pop(scan_type, {}).items()
+        }
+
+    def is_stale(self, unit: int) -> bool:
+        """Return ``True`` if the cached registers of a unit are stale because a slave of the unit does not respond.
+
+        Parameters
+        ----------
+        unit: int
+            The unit of the registers.
+        """
+        return any(
+            self.slave_health[get_slave(modbus_register_block, unit)].is_open
+            for modbus_register_block in self.scan_plan.get(unit, [])
+        )
+
+    def get_register_view(self, address: int, index: int, unit: int) -> memoryview:
+        """Get a zero-copy view of the cached modbus registers.
+
+        Parameters
+        ----------
+        address: int
+            The starting address to read from.
+        index: int
+            The number of registers to read.
+        unit: int
+            The unit this request is targeting.
+
+        Returns
+        -------
+        memoryview
+            The cached registers or an empty view if the registers are not cached.
+        """
+        if (registers := self.registers.view(unit, address, index)) is None:
+            UNIPI_LOGGER.error("%s Error on address %s (unit: %s)", LogPrefix.MODBUS, address, unit)
+            return EMPTY_REGISTERS
+
+        return registers
+
+    @property
+    def generation(self) -> int:
+        """Return the generation of the cached registers. It changes with every scan or write that changes them."""
+        return self.registers.generation
 
     def get_register(self, address: int, index: int, unit: int) -> List[int]:
         """Get the responses from the cached modbus register blocks.
@@ -120,12 +1274,5 @@ class ModbusCacheData:
         list
             A list of cached modbus register blocks.
         """
-        ret: List[int] = []
-
-        for _address in range(address, address + index):
-            if _address not in self.data[unit] or self.data[unit][_address] is None:
-                UNIPI_LOGGER.error("%s Error on address %s (unit: %s)", LogPrefix.MODBUS, address, unit)
-            else:
-                ret += [self.data[unit][_address]]
-
-        return ret
+        registers: List[int] = self.get_register_view(address, index, unit).tolist()
+        return registers
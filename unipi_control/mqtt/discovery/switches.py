@@ -99,7 +99,7 @@ class HassSwitchesDiscoveryMixin(HassDiscoveryMixin):
         for feature in self.neuron.features.by_feature_types(self.publish_feature_types):
             if (
                 isinstance(feature, (DigitalOutput, Relay))
-                and feature.feature_id not in self.config.get_cover_circuits()
+                and feature.feature_id not in self.neuron.features.cover_circuits
             ):
                 topic, message = self.get_discovery(feature)
 
@@ -1,129 +1,182 @@
 """Initialize MQTT subscribe and publish for features."""
 
 import asyncio
+import json
 from asyncio import Task
-from contextlib import AsyncExitStack
+from functools import partial
 from typing import Any
-from typing import AsyncIterable
 from typing import ClassVar
+from typing import Dict
+from typing import Iterable
 from typing import List
+from typing import Optional
 from typing import Set
+from typing import TYPE_CHECKING
+from typing import Tuple
+from typing import Type
 from typing import Union
 
 from aiomqtt import Client
 
-from unipi_control.config import HardwareType
+from unipi_control.config import LogPrefix
 from unipi_control.config import UNIPI_LOGGER
-from unipi_control.features.extensions import EastronMeter
+from unipi_control.events import Event
+from unipi_control.events import EventBus
+from unipi_control.events import EventSubscription
+from unipi_control.events import FeatureStateChanged
+from unipi_control.events import MeterValueChanged
 from unipi_control.features.neuron import DigitalInput
 from unipi_control.features.neuron import DigitalOutput
 from unipi_control.features.neuron import Led
 from unipi_control.features.neuron import Relay
+from unipi_control.features.neuron import set_states
+from unipi_control.features.utils import FeatureState
+from unipi_control.helpers.exception import ConfigError
 from unipi_control.helpers.log import LOG_LEVEL
 from unipi_control.helpers.log import LOG_MQTT_PUBLISH
 from unipi_control.helpers.log import LOG_MQTT_SUBSCRIBE
-from unipi_control.helpers.log import LOG_MQTT_SUBSCRIBE_TOPIC
+from unipi_control.helpers.text import slugify
+from unipi_control.mqtt.publisher import MqttPublisher
+from unipi_control.mqtt.router import MqttTopicRouter
 from unipi_control.neuron import Neuron
 
+if TYPE_CHECKING:
+    from unipi_control.features.extensions import EastronMeter
+
 
 class BaseFeaturesMqttPlugin:
     PUBLISH_RUNNING: bool = True
+    event_types: ClassVar[Tuple[Type[Event], ...]] = ()
     subscribe_feature_types: ClassVar[List[str]] = []
-    publish_feature_types: ClassVar[List[str]] = []
 
-    def __init__(self, neuron: Neuron, mqtt_client: Client) -> None:
+    def __init__(self, neuron: Neuron, mqtt_client: Client, events: EventBus) -> None:
         self.neuron: Neuron = neuron
         self.mqtt_client: Client = mqtt_client
+        self.events: EventBus = events
+        self.publisher: MqttPublisher = MqttPublisher(mqtt_client, window=neuron.config.mqtt.publish_window)
 
-    async def _publish(self, scan_type: str, hardware_types: List[str], feature_types: List[str], sleep: float) -> None:
-        while self.PUBLISH_RUNNING:
-            await self.neuron.modbus_cache_data.scan(scan_type, hardware_types)
+    async def _publish_events(self, events: Iterable[Event]) -> None:
+        for event in events:
+            await self.publisher.publish(topic=event.topic, payload=event.payload, qos=1, retain=True)
 
-            for feature in self.neuron.features.by_feature_types(feature_types):
-                if feature.changed:
-                    topic: str = f"{feature.topic}/get"
-                    await self.mqtt_client.publish(topic=topic, payload=feature.payload, qos=1, retain=True)
+            if (
+                isinstance(event, MeterValueChanged)
+                and LOG_LEVEL[self.neuron.config.logging.mqtt.meters_level] <= LOG_LEVEL["info"]
+            ) or (
+                isinstance(event, FeatureStateChanged)
+                and LOG_LEVEL[self.neuron.config.logging.mqtt.features_level] <= LOG_LEVEL["info"]
+            ):
+                UNIPI_LOGGER.log(
+                    level=LOG_LEVEL["info"],
+                    msg=LOG_MQTT_PUBLISH % (event.topic, event.payload),
+                )
+
+    async def _publish(self) -> None:
+        subscription: EventSubscription = self.events.subscribe(*self.event_types)
+
+        try:
+            # After (re)connect only the latest state per topic is published. Changes while the broker was not
+            # connected are already part of it.
+            await self._publish_events(subscription.latest())
 
-                    if (
-                        isinstance(feature, EastronMeter)
-                        and LOG_LEVEL[self.neuron.config.logging.mqtt.meters_level] <= LOG_LEVEL["info"]
-                    ) or (
-                        isinstance(feature, (DigitalInput, DigitalOutput, Led, Relay))
-                        and LOG_LEVEL[self.neuron.config.logging.mqtt.features_level] <= LOG_LEVEL["info"]
-                    ):
-                        UNIPI_LOGGER.log(
-                            level=LOG_LEVEL["info"],
-                            msg=LOG_MQTT_PUBLISH % (topic, feature.payload),
-                        )
+            while self.PUBLISH_RUNNING:
+                await self._publish_events(await subscription.wait())
 
-            await asyncio.sleep(sleep)
+            await self.publisher.flush()
+        finally:
+            # Don't leave messages in flight on a closed connection.
+            await self.publisher.cancel()
 
 
 class NeuronFeaturesMqttPlugin(BaseFeaturesMqttPlugin):
     """Provide features control as MQTT commands."""
 
+    event_types: ClassVar[Tuple[Type[Event], ...]] = (FeatureStateChanged,)
     subscribe_feature_types: ClassVar[List[str]] = ["DO", "RO"]
-    publish_feature_types: ClassVar[List[str]] = ["DI", "DO", "RO"]
-    scan_interval: float = 25e-3
 
-    async def init_tasks(self, stack: AsyncExitStack, tasks: Set[Task]) -> None:
-        """Initialize MQTT tasks for subscribe and publish MQTT topics.
+    def __init__(self, neuron: Neuron, mqtt_client: Client, events: EventBus) -> None:
+        super().__init__(neuron, mqtt_client, events)
+
+        self._pending_states: Dict[Union[DigitalOutput, Led, Relay], bool] = {}
+        self._write_task: Optional[Task] = None
+
+    async def init_tasks(self, router: MqttTopicRouter, tasks: Set[Task]) -> None:
+        """Initialize MQTT tasks for publish MQTT topics and add the command handlers to the router.
 
         Parameters
         ----------
-        stack: AsyncExitStack
-            The async exit stack for mqtt.
+        router: MqttTopicRouter
+            The router for all subscribed MQTT topics.
         tasks: set
             A set of all MQTT tasks.
         """
         for feature in self.neuron.features.by_feature_types(self.subscribe_feature_types):
             if isinstance(feature, (DigitalOutput, Relay)):
-                topic: str = f"{feature.topic}/set"
+                router.add_handler(f"{feature.topic}/set", partial(self._subscribe, feature))
 
-                manager = self.mqtt_client.filtered_messages(topic)
-                messages = await stack.enter_async_context(manager)
+        router.add_handler(f"{slugify(self.neuron.config.device_info.name)}/relay/set", self._subscribe_bulk)
 
-                subscribe_task: Task = asyncio.create_task(self._subscribe(feature, topic, messages))
-                tasks.add(subscribe_task)
+        task: Task = asyncio.create_task(self._publish())
+        tasks.add(task)
 
-                await self.mqtt_client.subscribe(topic)
-                UNIPI_LOGGER.debug(LOG_MQTT_SUBSCRIBE_TOPIC, topic)
+    def _set_state(self, feature: Union[DigitalOutput, Relay], value: bool) -> None:
+        # All commands that arrive before the write task runs are written together.
+        self._pending_states[feature] = value
 
-        task: Task = asyncio.create_task(
-            self._publish(
-                scan_type="tcp",
-                hardware_types=[HardwareType.NEURON],
-                feature_types=self.publish_feature_types,
-                sleep=self.scan_interval,
-            )
-        )
+        if self._write_task is None:
+            self._write_task = asyncio.create_task(self._write_pending_states())
 
-        tasks.add(task)
+    async def _write_pending_states(self) -> None:
+        states: Dict[Union[DigitalOutput, Led, Relay], bool] = self._pending_states
 
-    async def _subscribe(self, feature: Union[DigitalOutput, Relay], topic: str, messages: AsyncIterable[Any]) -> None:
-        async for message in messages:
-            value: str = message.payload.decode()
+        self._pending_states = {}
+        self._write_task = None
 
-            if value == "ON":
-                await feature.set_state(True)
-            elif value == "OFF":
-                await feature.set_state(False)
+        await set_states(self.neuron.modbus_client, states)
 
-            if (
-                value in {"ON", "OFF"}
-                and LOG_LEVEL[self.neuron.config.logging.mqtt.features_level] <= LOG_LEVEL["info"]
-            ):
+    async def _subscribe(self, feature: Union[DigitalOutput, Relay], topic: str, value: str) -> None:
+        if value in {FeatureState.ON, FeatureState.OFF}:
+            self._set_state(feature, value == FeatureState.ON)
+
+            if LOG_LEVEL[self.neuron.config.logging.mqtt.features_level] <= LOG_LEVEL["info"]:
                 UNIPI_LOGGER.log(
                     level=LOG_LEVEL["info"],
                     msg=LOG_MQTT_SUBSCRIBE % (topic, value),
                 )
 
+    async def _subscribe_bulk(self, topic: str, value: str) -> None:
+        try:
+            states: Any = json.loads(value)
+        except json.JSONDecodeError:
+            states = None
+
+        if not isinstance(states, dict):
+            UNIPI_LOGGER.error("%s [%s] Invalid bulk command: %s", LogPrefix.MQTT, topic, value)
+            return
+
+        for feature_id, state in states.items():
+            try:
+                feature: Union[
+                    DigitalInput, DigitalOutput, Led, Relay, EastronMeter
+                ] = self.neuron.features.by_feature_id(feature_id, feature_types=self.subscribe_feature_types)
+            except ConfigError:
+                UNIPI_LOGGER.error("%s [%s] Feature '%s' not found!", LogPrefix.MQTT, topic, feature_id)
+                continue
+
+            if isinstance(feature, (DigitalOutput, Relay)) and state in {FeatureState.ON, FeatureState.OFF}:
+                self._set_state(feature, state == FeatureState.ON)
+
+        if LOG_LEVEL[self.neuron.config.logging.mqtt.features_level] <= LOG_LEVEL["info"]:
+            UNIPI_LOGGER.log(
+                level=LOG_LEVEL["info"],
+                msg=LOG_MQTT_SUBSCRIBE % (topic, value),
+            )
+
 
 class MeterFeaturesMqttPlugin(BaseFeaturesMqttPlugin):
     """Provide features control as MQTT commands."""
 
-    publish_feature_types: ClassVar[List[str]] = ["METER"]
-    scan_interval: float = 25e-3
+    event_types: ClassVar[Tuple[Type[Event], ...]] = (MeterValueChanged,)
 
     async def init_tasks(self, tasks: Set[Task]) -> None:
         """Initialize MQTT tasks for publish MQTT topics.
@@ -133,12 +186,5 @@ class MeterFeaturesMqttPlugin(BaseFeaturesMqttPlugin):
         tasks: set
             A set of all MQTT tasks.
         """
-        task: Task = asyncio.create_task(
-            self._publish(
-                scan_type="serial",
-                hardware_types=[HardwareType.EXTENSION],
-                feature_types=self.publish_feature_types,
-                sleep=self.scan_interval,
-            )
-        )
+        task: Task = asyncio.create_task(self._publish())
         tasks.add(task)
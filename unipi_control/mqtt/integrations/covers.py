@@ -3,12 +3,13 @@ import asyncio
 import re
 from asyncio import Queue
 from asyncio import Task
-from contextlib import AsyncExitStack
-from typing import Any
-from typing import AsyncIterable
+from contextlib import suppress
+from functools import partial
 from typing import Awaitable
 from typing import Callable
 from typing import Dict
+from typing import Final
+from typing import Iterable
 from typing import NamedTuple
 from typing import Optional
 from typing import Set
@@ -19,13 +20,23 @@ from unipi_control.config import Config
 from unipi_control.config import DEVICE_CLASSES
 from unipi_control.config import LogPrefix
 from unipi_control.config import UNIPI_LOGGER
+from unipi_control.events import CoverPositionChanged
+from unipi_control.events import CoverStateChanged
+from unipi_control.events import CoverTiltChanged
+from unipi_control.events import Event
+from unipi_control.events import EventBus
+from unipi_control.events import EventSubscription
 from unipi_control.helpers.log import LOG_LEVEL
 from unipi_control.helpers.log import LOG_MQTT_PUBLISH
 from unipi_control.helpers.log import LOG_MQTT_SUBSCRIBE
-from unipi_control.helpers.log import LOG_MQTT_SUBSCRIBE_TOPIC
 from unipi_control.integrations.covers import Cover
 from unipi_control.integrations.covers import CoverDeviceState
 from unipi_control.integrations.covers import CoverMap
+from unipi_control.mqtt.publisher import MqttPublisher
+from unipi_control.mqtt.router import MqttTopicRouter
+
+
+COVER_STOP_TIMEOUT_MARGIN: Final[float] = 1.0
 
 
 class SubscribeCommand(NamedTuple):
@@ -43,7 +54,9 @@ class CoversMqttPlugin:
     def __init__(self, mqtt_client: Client, covers: CoverMap) -> None:
         self.config: Config = covers.config
         self.mqtt_client: Client = mqtt_client
+        self.publisher: MqttPublisher = MqttPublisher(mqtt_client, window=covers.config.mqtt.publish_window)
         self.covers: CoverMap = covers
+        self.events: EventBus = covers.events
 
         self._queues: Dict[str, Queue] = {}
 
@@ -63,19 +76,23 @@ class CoversMqttPlugin:
 
             UNIPI_LOGGER.info("%s [%s] [Worker] %s task(s) canceled.", LogPrefix.COVER, cover.topic, size)
 
-    async def init_tasks(self, stack: AsyncExitStack, tasks: Set[Task]) -> None:
-        """Initialize MQTT tasks for subscribe and publish MQTT topics.
+    async def init_tasks(self, router: MqttTopicRouter, tasks: Set[Task]) -> None:
+        """Initialize MQTT tasks for publish MQTT topics and add the command handlers to the router.
 
         Parameters
         ----------
-        stack: AsyncExitStack
-            The async exit stack for MQTT.
+        router: MqttTopicRouter
+            The router for all subscribed MQTT topics.
         tasks: set
             A set of all MQTT tasks.
         """
-        await self._set_position_topic(stack, tasks)
-        await self._tilt_command_topic(stack, tasks)
-        await self._command_topic(stack, tasks)
+        for cover in self.covers.by_device_classes(DEVICE_CLASSES):
+            router.add_handler(f"{cover.topic}/position/set", partial(self._subscribe_set_position_topic, cover))
+
+            if cover.settings.tilt_change_time:
+                router.add_handler(f"{cover.topic}/tilt/set", partial(self._subscribe_tilt_command_topic, cover))
+
+            router.add_handler(f"{cover.topic}/set", partial(self._subscribe_command_topic, cover))
 
         task: Task = asyncio.create_task(self._publish())
         tasks.add(task)
@@ -92,6 +109,7 @@ class CoversMqttPlugin:
                 UNIPI_LOGGER.info("%s [%s] [Worker] %s task(s) in queue.", LogPrefix.COVER, cover.topic, queue.qsize())
 
             subscribe_queue: SubscribeCommand = await queue.get()
+            subscription: EventSubscription = self.events.subscribe(CoverStateChanged, topic=f"{cover.topic}/state")
             command: Callable[[int], Awaitable[Optional[float]]] = getattr(cover, subscribe_queue.command)
             cover_run_time: Optional[float] = await command(subscribe_queue.value)
 
@@ -109,136 +127,88 @@ class CoversMqttPlugin:
                     cover_run_time,
                 )
 
-                while cover.is_closing or cover.is_opening:
-                    await asyncio.sleep(25e-3)
+                await self._wait_until_stopped(cover, subscription, timeout=cover_run_time + COVER_STOP_TIMEOUT_MARGIN)
 
             queue.task_done()
 
-    async def _command_topic(self, stack: AsyncExitStack, tasks: Set[Task]) -> None:
-        for cover in self.covers.by_device_classes(DEVICE_CLASSES):
-            topic: str = f"{cover.topic}/set"
-
-            manager = self.mqtt_client.filtered_messages(topic)
-            messages = await stack.enter_async_context(manager)
-
-            task: Task = asyncio.create_task(self._subscribe_command_topic(cover, topic, messages))
-            tasks.add(task)
-
-            await self.mqtt_client.subscribe(topic, qos=0)
-            UNIPI_LOGGER.debug(LOG_MQTT_SUBSCRIBE_TOPIC, topic)
-
-    async def _set_position_topic(self, stack: AsyncExitStack, tasks: Set[Task]) -> None:
-        for cover in self.covers.by_device_classes(DEVICE_CLASSES):
-            topic: str = f"{cover.topic}/position/set"
-
-            manager = self.mqtt_client.filtered_messages(topic)
-            messages = await stack.enter_async_context(manager)
-
-            task: Task = asyncio.create_task(self._subscribe_set_position_topic(cover, topic, messages))
-            tasks.add(task)
-
-            await self.mqtt_client.subscribe(topic, qos=0)
-            UNIPI_LOGGER.debug(LOG_MQTT_SUBSCRIBE_TOPIC, topic)
-
-    async def _tilt_command_topic(self, stack: AsyncExitStack, tasks: Set[Task]) -> None:
-        for cover in self.covers.by_device_classes(DEVICE_CLASSES):
-            if cover.settings.tilt_change_time:
-                topic: str = f"{cover.topic}/tilt/set"
-
-                manager = self.mqtt_client.filtered_messages(topic)
-                messages = await stack.enter_async_context(manager)
-
-                task: Task = asyncio.create_task(self._subscribe_tilt_command_topic(cover, topic, messages))
-                tasks.add(task)
-
-                await self.mqtt_client.subscribe(topic, qos=0)
-                UNIPI_LOGGER.debug(LOG_MQTT_SUBSCRIBE_TOPIC, topic)
+    @staticmethod
+    async def _wait_until_stopped(cover: Cover, subscription: EventSubscription, timeout: float) -> None:
+        async def wait() -> None:
+            while cover.is_closing or cover.is_opening:
+                await subscription.wait()
+
+        # Run the next command after the cover stopped. The timeout is a fallback if the cover never reports it.
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(wait(), timeout=timeout)
+
+    async def _subscribe_command_topic(self, cover: Cover, topic: str, value: str) -> None:
+        await self._clear_queue(cover)
+
+        if value == CoverDeviceState.OPEN:
+            await cover.open_cover()
+        elif value == CoverDeviceState.CLOSE:
+            await cover.close_cover()
+        elif value == CoverDeviceState.STOP:
+            await cover.stop_cover()
+
+        if LOG_LEVEL[self.config.logging.mqtt.covers_level] <= LOG_LEVEL["info"]:
+            UNIPI_LOGGER.log(
+                level=LOG_LEVEL["info"],
+                msg=LOG_MQTT_SUBSCRIBE % (topic, value),
+            )
+
+    async def _subscribe_set_position_topic(self, cover: Cover, topic: str, value: str) -> None:
+        if re.match(r"[+-]?\d+$", value):
+            position: int = int(value)
+            queue: Queue = self._queues[cover.topic]
 
-    async def _subscribe_command_topic(self, cover: Cover, topic: str, messages: AsyncIterable[Any]) -> None:
-        async for message in messages:
-            value: str = message.payload.decode()
+            await queue.put(
+                SubscribeCommand(
+                    command="set_position",
+                    value=position,
+                    log=LOG_MQTT_SUBSCRIBE % (topic, position),
+                ),
+            )
+
+    async def _subscribe_tilt_command_topic(self, cover: Cover, topic: str, value: str) -> None:
+        if re.match(r"[+-]?\d+$", value):
+            tilt: int = int(value)
+            queue: Queue = self._queues[cover.topic]
 
-            await self._clear_queue(cover)
+            await queue.put(
+                SubscribeCommand(
+                    command="set_tilt",
+                    value=tilt,
+                    log=LOG_MQTT_SUBSCRIBE % (topic, tilt),
+                ),
+            )
 
-            if value == CoverDeviceState.OPEN:
-                await cover.open_cover()
-            elif value == CoverDeviceState.CLOSE:
-                await cover.close_cover()
-            elif value == CoverDeviceState.STOP:
-                await cover.stop_cover()
+    async def _publish_events(self, events: Iterable[Event]) -> None:
+        for event in events:
+            await self.publisher.publish(topic=event.topic, payload=event.payload, qos=1, retain=True)
 
             if LOG_LEVEL[self.config.logging.mqtt.covers_level] <= LOG_LEVEL["info"]:
                 UNIPI_LOGGER.log(
                     level=LOG_LEVEL["info"],
-                    msg=LOG_MQTT_SUBSCRIBE % (topic, value),
-                )
-
-    async def _subscribe_set_position_topic(self, cover: Cover, topic: str, messages: AsyncIterable[Any]) -> None:
-        async for message in messages:
-            value: str = message.payload.decode()
-
-            if re.match(r"[+-]?\d+$", value):
-                position: int = int(value)
-                queue: Queue = self._queues[cover.topic]
-
-                await queue.put(
-                    SubscribeCommand(
-                        command="set_position",
-                        value=position,
-                        log=LOG_MQTT_SUBSCRIBE % (topic, position),
-                    ),
+                    msg=LOG_MQTT_PUBLISH % (event.topic, event.payload),
                 )
 
-    async def _subscribe_tilt_command_topic(self, cover: Cover, topic: str, messages: AsyncIterable[Any]) -> None:
-        async for message in messages:
-            value: str = message.payload.decode()
-
-            if re.match(r"[+-]?\d+$", value):
-                tilt: int = int(value)
-                queue: Queue = self._queues[cover.topic]
+    async def _publish(self) -> None:
+        subscription: EventSubscription = self.events.subscribe(
+            CoverStateChanged, CoverPositionChanged, CoverTiltChanged
+        )
 
-                await queue.put(
-                    SubscribeCommand(
-                        command="set_tilt",
-                        value=tilt,
-                        log=LOG_MQTT_SUBSCRIBE % (topic, tilt),
-                    ),
-                )
+        try:
+            # After (re)connect only the latest state, position and tilt per cover is published.
+            await self._publish_events(subscription.latest())
 
-    async def _publish(self) -> None:
-        while self.PUBLISH_RUNNING:
             for cover in self.covers.by_device_classes(DEVICE_CLASSES):
-                if cover.position_changed:
-                    position_topic: str = f"{cover.topic}/position"
-                    await self.mqtt_client.publish(
-                        topic=position_topic, payload=cover.status.position, qos=1, retain=True
-                    )
-
-                    if LOG_LEVEL[self.config.logging.mqtt.covers_level] <= LOG_LEVEL["info"]:
-                        UNIPI_LOGGER.log(
-                            level=LOG_LEVEL["info"],
-                            msg=LOG_MQTT_PUBLISH % (position_topic, cover.status.position),
-                        )
-
-                if cover.tilt_changed:
-                    tilt_topic: str = f"{cover.topic}/tilt"
-                    await self.mqtt_client.publish(topic=tilt_topic, payload=cover.status.tilt, qos=1, retain=True)
-
-                    if LOG_LEVEL[self.config.logging.mqtt.covers_level] <= LOG_LEVEL["info"]:
-                        UNIPI_LOGGER.log(
-                            level=LOG_LEVEL["info"],
-                            msg=LOG_MQTT_PUBLISH % (tilt_topic, cover.status.tilt),
-                        )
-
-                if cover.state_changed:
-                    state_topic: str = f"{cover.topic}/state"
-                    await self.mqtt_client.publish(topic=state_topic, payload=cover.state, qos=1, retain=True)
-
-                    if LOG_LEVEL[self.config.logging.mqtt.covers_level] <= LOG_LEVEL["info"]:
-                        UNIPI_LOGGER.log(
-                            level=LOG_LEVEL["info"],
-                            msg=LOG_MQTT_PUBLISH % (state_topic, cover.state),
-                        )
-
                 await cover.calibrate()
-            await asyncio.sleep(25e-3)
+
+            while self.PUBLISH_RUNNING:
+                await self._publish_events(await subscription.wait())
+
+            await self.publisher.flush()
+        finally:
+            # Don't leave messages in flight on a closed connection.
+            await self.publisher.cancel()
@@ -0,0 +1,172 @@
+"""Publish MQTT messages with a bounded number of messages in flight."""
+
+import asyncio
+import time
+from asyncio import Semaphore
+from asyncio import Task
+from functools import partial
+from typing import Dict
+from typing import Final
+from typing import Optional
+from typing import Set
+
+from aiomqtt import Client
+from aiomqtt.types import PayloadType
+
+from unipi_control.config import LogPrefix
+from unipi_control.config import UNIPI_LOGGER
+
+
+class MqttPublishStats:
+    """Count the published MQTT messages to report the publish throughput.
+
+    Attributes
+    ----------
+    published: int
+        The number of acknowledged messages.
+    max_in_flight: int
+        The maximum number of messages in flight at the same time.
+    window_full: int
+        The number of publishes that waited for a free slot in the window.
+    started: float, optional
+        The monotonic time of the first publish.
+    """
+
+    def __init__(self) -> None:
+        self.published: int = 0
+        self.max_in_flight: int = 0
+        self.window_full: int = 0
+        self.started: Optional[float] = None
+
+    @property
+    def throughput(self) -> float:
+        """Return the published messages per second since the first publish."""
+        if self.started is None or (elapsed := time.monotonic() - self.started) <= 0:
+            return 0.0
+
+        return self.published / elapsed
+
+    def reset(self) -> None:
+        """Reset all counters."""
+        self.published = 0
+        self.max_in_flight = 0
+        self.window_full = 0
+        self.started = None
+
+    def log(self) -> None:
+        """Log the publish throughput."""
+        UNIPI_LOGGER.info(
+            "%s %s message(s) published, %.1f message(s) per second, max. %s in flight, window full %s time(s).",
+            LogPrefix.MQTT,
+            self.published,
+            self.throughput,
+            self.max_in_flight,
+            self.window_full,
+        )
+
+
+PUBLISH_STATS: Final[MqttPublishStats] = MqttPublishStats()
+
+
+class MqttPublisher:
+    """Publish MQTT messages concurrently without waiting for the broker acknowledgement of each message.
+
+    Up to ``window`` messages are in flight at the same time. A publish only waits if the window is full. Messages
+    with the same topic are sent in order. A failed publish is raised on the next publish or flush. Messages in
+    flight are cancelled with ``cancel()`` when the connection is closed.
+
+    Attributes
+    ----------
+    mqtt_client: Client
+        The MQTT client.
+    window: int
+        The maximum number of messages in flight.
+    """
+
+    def __init__(self, mqtt_client: Client, window: int) -> None:
+        self.mqtt_client: Client = mqtt_client
+        self.window: int = window
+
+        self._semaphore: Semaphore = Semaphore(window)
+        self._in_flight: Set[Task] = set()
+        self._last_by_topic: Dict[str, Task] = {}
+        self._error: Optional[BaseException] = None
+
+    async def publish(self, topic: str, payload: PayloadType, qos: int = 1, retain: bool = True) -> None:
+        """Start publishing a message and return as soon as the message is in flight.
+
+        Parameters
+        ----------
+        topic: str
+            The MQTT topic.
+        payload: str, int, float, optional
+            The MQTT payload.
+        qos: int
+            The MQTT quality of service level.
+        retain: bool
+            Whether the broker retains the message.
+        """
+        self._raise_error()
+
+        if self._semaphore.locked():
+            PUBLISH_STATS.window_full += 1
+
+        await self._semaphore.acquire()
+
+        if PUBLISH_STATS.started is None:
+            PUBLISH_STATS.started = time.monotonic()
+
+        task: Task = asyncio.create_task(
+            self._publish(self._last_by_topic.get(topic), topic=topic, payload=payload, qos=qos, retain=retain)
+        )
+        task.add_done_callback(partial(self._done, topic))
+
+        self._last_by_topic[topic] = task
+        self._in_flight.add(task)
+        PUBLISH_STATS.max_in_flight = max(PUBLISH_STATS.max_in_flight, len(self._in_flight))
+
+    async def flush(self) -> None:
+        """Wait until all messages in flight are acknowledged."""
+        if self._in_flight:
+            await asyncio.wait(self._in_flight)
+
+        self._raise_error()
+
+    async def cancel(self) -> None:
+        """Cancel all messages in flight and wait until they are cancelled."""
+        in_flight: Set[Task] = set(self._in_flight)
+
+        for task in in_flight:
+            task.cancel()
+
+        if in_flight:
+            await asyncio.wait(in_flight)
+
+    async def _publish(
+        self, previous: Optional[Task], topic: str, payload: PayloadType, qos: int, retain: bool
+    ) -> None:
+        # Keep the order of the messages with the same topic.
+        if previous and not previous.done():
+            await asyncio.wait({previous})
+
+        await self.mqtt_client.publish(topic=topic, payload=payload, qos=qos, retain=retain)
+
+    def _done(self, topic: str, task: Task) -> None:
+        self._semaphore.release()
+        self._in_flight.discard(task)
+
+        if self._last_by_topic.get(topic) is task:
+            del self._last_by_topic[topic]
+
+        if task.cancelled():
+            return
+
+        if error := task.exception():
+            self._error = self._error or error
+        else:
+            PUBLISH_STATS.published += 1
+
+    def _raise_error(self) -> None:
+        if error := self._error:
+            self._error = None
+            raise error
@@ -0,0 +1,148 @@
+"""Route MQTT messages from wildcard subscriptions to handlers."""
+
+import asyncio
+from asyncio import Task
+from collections import deque
+from contextlib import AsyncExitStack
+from contextlib import suppress
+from typing import Any
+from typing import AsyncIterable
+from typing import Awaitable
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import Set
+
+from aiomqtt import Client
+
+from unipi_control.config import UNIPI_LOGGER
+from unipi_control.helpers.log import LOG_MQTT_SUBSCRIBE_TOPIC
+
+MqttMessageHandler = Callable[[str, str], Awaitable[None]]
+
+
+class MqttTopicRouter:
+    """Subscribe to one wildcard topic per topic depth and dispatch the messages to handlers by topic.
+
+    The topic filter of a handler keeps the first (device name) and the last topic level and replaces all other
+    levels with ``+``, e.g. ``unipi/relay/ro_2_01/set`` is received with ``unipi/+/+/set``. The number of
+    subscriptions and tasks does not grow with the number of features and covers.
+
+    The messages of a topic are handled in order by a handler task that only runs while messages are pending. A slow
+    handler does not delay the messages of other topics.
+
+    Attributes
+    ----------
+    mqtt_client: Client
+        The MQTT client.
+    handlers: dict
+        The message handler by topic.
+    topic_filters: list
+        The wildcard topic filters to subscribe.
+    """
+
+    def __init__(self, mqtt_client: Client) -> None:
+        self.mqtt_client: Client = mqtt_client
+        self.handlers: Dict[str, MqttMessageHandler] = {}
+        self.topic_filters: List[str] = []
+
+        self._pending_payloads: Dict[str, Deque[str]] = {}
+        self._handler_tasks: Dict[str, Task] = {}
+
+    @staticmethod
+    def get_topic_filter(topic: str) -> str:
+        """Get the wildcard topic filter for a topic.
+
+        Parameters
+        ----------
+        topic: str
+            The MQTT topic.
+
+        Returns
+        -------
+        str
+            The topic with ``+`` for all levels except the first and the last level.
+        """
+        levels: List[str] = topic.split("/")
+
+        if len(levels) < 3:
+            return topic
+
+        return "/".join([levels[0], *["+"] * (len(levels) - 2), levels[-1]])
+
+    def add_handler(self, topic: str, handler: MqttMessageHandler) -> None:
+        """Add a message handler for a topic.
+
+        Parameters
+        ----------
+        topic: str
+            The MQTT topic.
+        handler: Callable
+            Awaited with the topic and the decoded payload of every message.
+        """
+        self.handlers[topic] = handler
+
+        if (topic_filter := self.get_topic_filter(topic)) not in self.topic_filters:
+            self.topic_filters.append(topic_filter)
+
+    async def init_tasks(self, stack: AsyncExitStack, tasks: Set[Task]) -> None:
+        """Subscribe the wildcard topics and initialize one dispatch task per topic filter.
+
+        All topic filters are sent in one SUBSCRIBE packet. Only one SUBACK is awaited on every (re)connect.
+
+        Parameters
+        ----------
+        stack: AsyncExitStack
+            The async exit stack for MQTT.
+        tasks: set
+            A set of all MQTT tasks.
+        """
+        if not self.topic_filters:
+            return
+
+        stack.push_async_callback(self._cancel_handler_tasks)
+
+        for topic_filter in self.topic_filters:
+            manager = self.mqtt_client.filtered_messages(topic_filter)
+            messages = await stack.enter_async_context(manager)
+
+            task: Task = asyncio.create_task(self._dispatch(messages))
+            tasks.add(task)
+
+        await self.mqtt_client.subscribe([(topic_filter, 0) for topic_filter in self.topic_filters])
+
+        for topic_filter in self.topic_filters:
+            UNIPI_LOGGER.debug(LOG_MQTT_SUBSCRIBE_TOPIC, topic_filter)
+
+    async def _dispatch(self, messages: AsyncIterable[Any]) -> None:
+        async for message in messages:
+            if message.topic not in self.handlers:
+                continue
+
+            self._pending_payloads.setdefault(message.topic, deque()).append(message.payload.decode())
+
+            if message.topic not in self._handler_tasks:
+                self._handler_tasks[message.topic] = asyncio.create_task(self._handle(message.topic))
+
+    async def _handle(self, topic: str) -> None:
+        handler: MqttMessageHandler = self.handlers[topic]
+        pending_payloads: Deque[str] = self._pending_payloads[topic]
+
+        try:
+            while pending_payloads:
+                await handler(topic, pending_payloads.popleft())
+        finally:
+            del self._handler_tasks[topic]
+
+    async def _cancel_handler_tasks(self) -> None:
+        handler_tasks: List[Task] = list(self._handler_tasks.values())
+
+        for task in handler_tasks:
+            task.cancel()
+
+        for task in handler_tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+
+        self._pending_payloads.clear()
@@ -198,7 +198,7 @@ class Neuron:
         self.config: Config = config
         self.modbus_client: ModbusClient = modbus_client
         self.hardware: HardwareMap = HardwareMap(config=config)
-        self.features = FeatureMap()
+        self.features = FeatureMap(cover_circuits=config.get_cover_circuits())
         self.boards: List[Board] = []
 
         self.modbus_cache_data: ModbusCacheData = ModbusCacheData(
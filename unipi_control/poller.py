@@ -0,0 +1,141 @@
+"""Poll the Modbus registers independent of the MQTT connection."""
+
+import asyncio
+import time
+from asyncio import Task
+from itertools import chain
+from typing import Dict
+from typing import Final
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Set
+from typing import TYPE_CHECKING
+from typing import Tuple
+from typing import Union
+
+from unipi_control.config import HardwareType
+from unipi_control.events import EventBus
+from unipi_control.events import FeatureStateChanged
+from unipi_control.events import MeterValueChanged
+from unipi_control.features.extensions import EastronMeter
+from unipi_control.features.neuron import DigitalInput
+from unipi_control.features.neuron import DigitalOutput
+from unipi_control.features.neuron import Led
+from unipi_control.features.neuron import Relay
+from unipi_control.neuron import Neuron
+
+if TYPE_CHECKING:
+    from unipi_control.modbus import RegisterChange
+
+
+class PollTarget(NamedTuple):
+    hardware_types: List[str]
+    feature_types: List[str]
+
+
+POLL_TARGETS: Final[Dict[str, PollTarget]] = {
+    "tcp": PollTarget(hardware_types=[HardwareType.NEURON], feature_types=["DI", "DO", "RO"]),
+    "serial": PollTarget(hardware_types=[HardwareType.EXTENSION], feature_types=["METER"]),
+}
+
+
+class ModbusPoller:
+    """Scan the Modbus registers and publish the feature changes to the event bus for the whole process lifetime.
+
+    The poller keeps running while the MQTT broker is not connected. Every change is evaluated once and published
+    as ``FeatureStateChanged`` or ``MeterValueChanged`` event. Features of units that do not respond are held back
+    because their cached registers are stale.
+
+    Attributes
+    ----------
+    neuron: Neuron
+        The Unipi Neuron with the features and the register cache.
+    events: EventBus
+        The event bus for the feature changes.
+    """
+
+    POLL_RUNNING: bool = True
+
+    def __init__(self, neuron: Neuron, events: EventBus) -> None:
+        self.neuron: Neuron = neuron
+        self.events: EventBus = events
+
+    def init_tasks(self, tasks: Set[Task]) -> None:
+        """Initialize one polling task per scan type.
+
+        Parameters
+        ----------
+        tasks: set
+            A set of all poller tasks.
+        """
+        polling_intervals: Dict[str, float] = {
+            "tcp": self.neuron.config.modbus_tcp.polling.fast,
+            "serial": self.neuron.config.modbus_serial.polling.fast,
+        }
+
+        for scan_type in POLL_TARGETS:
+            task: Task = asyncio.create_task(self.poll(scan_type, sleep=polling_intervals[scan_type]))
+            tasks.add(task)
+
+    def _publish_features(
+        self, features: Iterable[Union[DigitalInput, DigitalOutput, Led, Relay, EastronMeter]]
+    ) -> None:
+        now: float = time.monotonic()
+
+        for feature in features:
+            if any(self.neuron.modbus_cache_data.is_stale(unit) for unit, _ in feature.register_addresses):
+                continue
+
+            topic: str = f"{feature.topic}/get"
+
+            if isinstance(feature, EastronMeter):
+                if not feature.publish_policy.should_publish(feature.payload, now):
+                    continue
+
+                feature.publish_policy.published(feature.payload, now)
+                self.events.publish(MeterValueChanged(topic=topic, payload=feature.payload, feature=feature))
+            else:
+                self.events.publish(FeatureStateChanged(topic=topic, payload=feature.payload, feature=feature))
+
+    async def poll(self, scan_type: str, sleep: float) -> None:
+        """Scan the registers of a scan type and publish the changed features.
+
+        Parameters
+        ----------
+        scan_type: str
+            The scan type e.g. tcp or serial.
+        sleep: float
+            The maximum time between two scans in seconds. Successful writes end the wait early.
+        """
+        hardware_types, feature_types = POLL_TARGETS[scan_type]
+
+        # The first scan publishes all features. Afterward only features with dirty registers are evaluated.
+        changed_features: Iterator[Union[DigitalInput, DigitalOutput, Led, Relay, EastronMeter]] = (
+            feature for feature in self.neuron.features.by_feature_types(feature_types) if feature.changed
+        )
+        # Features with a minimum or maximum publish interval are checked on every scan. A held back change or a
+        # heartbeat is published even if the registers did not change.
+        timed_features: List[EastronMeter] = [
+            feature
+            for feature in self.neuron.features.by_feature_types(feature_types)
+            if isinstance(feature, EastronMeter) and feature.publish_policy.is_timed
+        ]
+
+        while self.POLL_RUNNING:
+            dirty_registers: Dict[Tuple[int, int], RegisterChange] = await self.neuron.modbus_cache_data.scan(
+                scan_type, hardware_types
+            )
+
+            self._publish_features(changed_features)
+
+            changed_features = chain(
+                self.neuron.features.changed_by_dirty_registers(dirty_registers, feature_types), timed_features
+            )
+
+            # Successful writes update the cached registers. Publish them immediately instead of after the next scan.
+            if written_registers := await self.neuron.modbus_cache_data.wait_for_writes(scan_type, timeout=sleep):
+                self._publish_features(
+                    self.neuron.features.changed_by_dirty_registers(written_registers, feature_types)
+                )
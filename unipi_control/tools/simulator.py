@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""Simulate Unipi Neuron and extension hardware from the hardware YAML definitions."""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import struct
+import sys
+import tty
+from itertools import cycle
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Final
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from pymodbus.datastore import ModbusSequentialDataBlock
+from pymodbus.datastore import ModbusServerContext
+from pymodbus.datastore import ModbusSlaveContext
+from pymodbus.server import ModbusSerialServer
+from pymodbus.server import ModbusTcpServer
+
+from unipi_control import __version__  # type: ignore[attr-defined]
+from unipi_control.config import DEFAULT_CONFIG_DIR
+from unipi_control.config import UNIPI_LOGGER
+from unipi_control.helpers.argparse import init_argparse
+from unipi_control.helpers.exception import UnexpectedError
+from unipi_control.helpers.log import SIMPLE_LOG_FORMAT
+from unipi_control.helpers.text import slugify
+from unipi_control.helpers.yaml import yaml_loader_safe
+
+UNIPI_LOGGER.setLevel(logging.INFO)
+
+stdout_handler: logging.Handler = logging.StreamHandler()
+stdout_handler.setFormatter(logging.Formatter(SIMPLE_LOG_FORMAT))
+UNIPI_LOGGER.addHandler(stdout_handler)
+
+MODBUS_ADDRESS_SPACE: Final[int] = 0x10000
+BIT_FEATURE_TYPES: Final[Tuple[str, ...]] = ("DI", "DO", "LED", "RO")
+
+
+class SimulatorCoils(ModbusSequentialDataBlock):
+    """Coils that switch the status bit of the feature in the value register.
+
+    Attributes
+    ----------
+    on_write: Callable, optional
+        Called with the coil address and value for every written coil.
+    """
+
+    def __init__(self, registers: ModbusSequentialDataBlock, coil_bits: Dict[int, Tuple[int, int]]) -> None:
+        super().__init__(0, [False] * MODBUS_ADDRESS_SPACE)  # type: ignore[no-untyped-call]
+
+        self.registers: ModbusSequentialDataBlock = registers
+        self.coil_bits: Dict[int, Tuple[int, int]] = coil_bits
+        self.on_write: Optional[Callable[[int, bool], None]] = None
+
+    def setValues(self, address: int, values: Sequence[bool]) -> None:  # noqa: N802
+        """Write the coils and update the value registers."""
+        super().setValues(address, values)  # type: ignore[no-untyped-call]
+
+        for index, value in enumerate(values):
+            if coil_bit := self.coil_bits.get(address + index):
+                register, bit = coil_bit
+                register_value: int = self.registers.getValues(register, 1)[0]  # type: ignore[no-untyped-call]
+                register_value = register_value | 1 << bit if value else register_value & ~(1 << bit)
+                self.registers.setValues(register, [register_value])  # type: ignore[no-untyped-call]
+
+            if self.on_write:
+                self.on_write(address + index, value)
+
+
+class SimulatorDevice:
+    """Register map of a simulated device generated from a hardware definition.
+
+    Attributes
+    ----------
+    unit: int
+        The modbus unit of the device.
+    registers: ModbusSequentialDataBlock
+        The input and holding registers.
+    coils: SimulatorCoils
+        The coils of the DO, LED and RO features.
+    bits: dict
+        The ``(register, bit)`` of the DI, DO, LED and RO features by feature id.
+    meters: dict
+        The first register of the meter features by feature id.
+    context: ModbusSlaveContext
+        The modbus slave context for the server.
+    """
+
+    def __init__(self, definition: Dict[str, Any], unit: int = 0) -> None:
+        self.unit: int = unit
+        self.registers: ModbusSequentialDataBlock = ModbusSequentialDataBlock(
+            0, [0] * MODBUS_ADDRESS_SPACE
+        )  # type: ignore[no-untyped-call]
+        self.bits: Dict[str, Tuple[int, int]] = {}
+        self.meters: Dict[str, int] = {}
+
+        coil_bits: Dict[int, Tuple[int, int]] = {}
+
+        for modbus_feature in definition["modbus_features"]:
+            feature_type: str = modbus_feature["feature_type"]
+
+            if feature_type in BIT_FEATURE_TYPES:
+                for index in range(modbus_feature["count"]):
+                    feature_id: str = f"{feature_type.lower()}_{modbus_feature['major_group']}_{index + 1:02d}"
+                    self.bits[feature_id] = (modbus_feature["val_reg"], index % 16)
+
+                    if (val_coil := modbus_feature.get("val_coil")) is not None:
+                        coil_bits[val_coil + index] = self.bits[feature_id]
+            elif feature_type == "METER":
+                self.meters[f"{slugify(modbus_feature['friendly_name'])}_{unit}"] = modbus_feature["val_reg"]
+
+        self.coils: SimulatorCoils = SimulatorCoils(self.registers, coil_bits)
+        self.context: ModbusSlaveContext = ModbusSlaveContext(  # type: ignore[no-untyped-call]
+            co=self.coils,
+            hr=self.registers,
+            ir=self.registers,
+            zero_mode=True,
+        )
+
+    @property
+    def feature_ids(self) -> List[str]:
+        """Return all feature ids of the device."""
+        return [*self.bits, *self.meters]
+
+    def toggle(self, feature_id: str) -> None:
+        """Toggle the status bit of a feature or set a random value to a meter.
+
+        Parameters
+        ----------
+        feature_id: str
+            The machine-readable unique name e.g. di_1_01.
+        """
+        if bit := self.bits.get(feature_id):
+            register, register_bit = bit
+            register_value: int = self.registers.getValues(register, 1)[0]  # type: ignore[no-untyped-call]
+            self.registers.setValues(register, [register_value ^ 1 << register_bit])  # type: ignore[no-untyped-call]
+        elif (meter_register := self.meters.get(feature_id)) is not None:
+            self.registers.setValues(  # type: ignore[no-untyped-call]
+                meter_register, list(struct.unpack(">HH", struct.pack(">f", random.uniform(0, 250))))  # noqa: S311
+            )
+
+
+class UnipiSimulator:
+    """Serve simulated Unipi Neuron registers over Modbus TCP and extension registers over a Modbus RTU pty link."""
+
+    def __init__(self, neuron: SimulatorDevice, extensions: List[SimulatorDevice]) -> None:
+        self.neuron: SimulatorDevice = neuron
+        self.extensions: List[SimulatorDevice] = extensions
+
+        self.devices: Dict[str, SimulatorDevice] = {}
+
+        for device in (neuron, *extensions):
+            for feature_id in device.feature_ids:
+                self.devices[feature_id] = device
+
+    @staticmethod
+    def from_hardware_dir(hardware_dir: Path, model: str, extensions: List[Tuple[str, int]]) -> "UnipiSimulator":
+        """Create the simulated devices from the hardware YAML definitions.
+
+        Parameters
+        ----------
+        hardware_dir: Path
+            Path to the hardware definitions.
+        model: str
+            The Unipi Neuron model e.g. L203.
+        extensions: list
+            The ``(identifier, unit)`` of all extensions e.g. ``("Eastron_SDM120M", 1)``.
+
+        Returns
+        -------
+        UnipiSimulator
+        """
+        definition_files: List[Tuple[Path, int]] = [
+            (hardware_dir / "neuron" / f"{model}.yaml", 0),
+            *((hardware_dir / "extensions" / f"{identifier}.yaml", unit) for identifier, unit in extensions),
+        ]
+
+        for definition_file, _ in definition_files:
+            if not definition_file.is_file():
+                exception_message: str = f"Hardware definition not found: {definition_file}"
+                raise UnexpectedError(exception_message)
+
+        devices: List[SimulatorDevice] = [
+            SimulatorDevice(yaml_loader_safe(definition_file), unit=unit) for definition_file, unit in definition_files
+        ]
+
+        return UnipiSimulator(neuron=devices[0], extensions=devices[1:])
+
+    def toggle(self, feature_id: str) -> None:
+        """Toggle a feature of any simulated device.
+
+        Parameters
+        ----------
+        feature_id: str
+            The machine-readable unique name e.g. di_1_01 or voltage_1.
+        """
+        if device := self.devices.get(feature_id):
+            device.toggle(feature_id)
+        else:
+            UNIPI_LOGGER.warning("Feature '%s' not found!", feature_id)
+
+    async def run_toggles(self, rate: float, script: Optional[List[str]] = None) -> None:
+        """Toggle features at a fixed rate.
+
+        Parameters
+        ----------
+        rate: float
+            The number of toggles per second.
+        script: list, optional
+            The feature ids to toggle in this order. The script is repeated. Toggle random features without a script.
+        """
+        feature_ids: Iterator[str] = (
+            cycle(script) if script else iter(lambda: random.choice(list(self.devices)), None)  # noqa: S311
+        )
+
+        for feature_id in feature_ids:
+            self.toggle(feature_id)
+            await asyncio.sleep(1 / rate)
+
+    async def serve_tcp(self, host: str, port: int) -> None:
+        """Serve the Unipi Neuron registers over Modbus TCP. All slave ids share the registers like on the Neuron."""
+        server: ModbusTcpServer = ModbusTcpServer(
+            context=ModbusServerContext(slaves=self.neuron.context, single=True),  # type: ignore[no-untyped-call]
+            address=(host, port),
+        )
+
+        UNIPI_LOGGER.info("Modbus TCP server listening on %s:%s", host, port)
+
+        try:
+            await server.serve_forever()  # type: ignore[no-untyped-call]
+        finally:
+            await server.shutdown()  # type: ignore[no-untyped-call]
+
+    async def serve_rtu(self, serial_link: Path, baud_rate: int) -> None:
+        """Serve the extension registers over Modbus RTU on a pty pair.
+
+        The server opens one pty. The other pty is linked to ``serial_link`` for the Modbus RTU client.
+        """
+        server_master, server_slave = os.openpty()
+        client_master, client_slave = os.openpty()
+
+        for fd in (server_slave, client_slave):
+            tty.setraw(fd)
+
+        serial_link.unlink(missing_ok=True)
+        serial_link.symlink_to(os.ttyname(client_slave))
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        # Relay all bytes between the server and the client pty like a RS485 bus.
+        for source, target in ((server_master, client_master), (client_master, server_master)):
+            loop.add_reader(source, lambda source=source, target=target: os.write(target, os.read(source, 1024)))
+
+        server: ModbusSerialServer = ModbusSerialServer(
+            context=ModbusServerContext(  # type: ignore[no-untyped-call]
+                slaves={extension.unit: extension.context for extension in self.extensions}, single=False
+            ),
+            port=os.ttyname(server_slave),
+            baudrate=baud_rate,
+        )
+
+        UNIPI_LOGGER.info("Modbus RTU server listening on %s", serial_link)
+
+        try:
+            await server.serve_forever()  # type: ignore[no-untyped-call]
+        finally:
+            await server.shutdown()  # type: ignore[no-untyped-call]
+
+            for fd in (server_master, client_master):
+                loop.remove_reader(fd)
+
+            for fd in (server_master, server_slave, client_master, client_slave):
+                os.close(fd)
+
+            serial_link.unlink(missing_ok=True)
+
+    async def run(
+        self,
+        host: str,
+        port: int,
+        serial_link: Path,
+        baud_rate: int,
+        rate: float,
+        script: Optional[List[str]] = None,
+    ) -> None:
+        """Run the Modbus servers and toggle features until cancelled."""
+        tasks: List[asyncio.Task] = [asyncio.create_task(self.serve_tcp(host, port))]
+
+        if self.extensions:
+            tasks.append(asyncio.create_task(self.serve_rtu(serial_link, baud_rate)))
+
+        if rate > 0:
+            tasks.append(asyncio.create_task(self.run_toggles(rate, script)))
+
+        await asyncio.gather(*tasks)
+
+
+def write_eeprom(sys_bus_dir: Path, model: str) -> Path:
+    """Write a Unipi Neuron EEPROM to detect the simulated model with ``sys_bus_dir`` in the ``control.yaml``.
+
+    Parameters
+    ----------
+    sys_bus_dir: Path
+        Path to the simulated I2C devices.
+    model: str
+        The Unipi Neuron model e.g. L203.
+
+    Returns
+    -------
+    Path
+        The EEPROM file.
+    """
+    ee_bytes: bytearray = bytearray(128)
+    ee_bytes[98:100] = bytes([0, 1])
+    ee_bytes[100:104] = struct.pack("i", 0)
+    ee_bytes[106:110] = model.encode()[:4].ljust(4)
+
+    eeprom_file: Path = sys_bus_dir / "1-0057" / "eeprom"
+    eeprom_file.parent.mkdir(parents=True, exist_ok=True)
+    eeprom_file.write_bytes(ee_bytes)
+
+    return eeprom_file
+
+
+def read_script(script_file: Path) -> List[str]:
+    """Read the feature ids of a toggle script."""
+    script: Any = yaml_loader_safe(script_file)
+
+    if not isinstance(script, list) or not script:
+        exception_message: str = "SCRIPT is not a YAML list of feature ids!"
+        raise UnexpectedError(exception_message)
+
+    return [str(feature_id) for feature_id in script]
+
+
+def parse_extension(value: str) -> Tuple[str, int]:
+    """Parse an extension argument e.g. ``Eastron_SDM120M:1``."""
+    identifier, _, unit = value.partition(":")
+
+    if not unit.isdigit():
+        exception_message: str = f"Invalid extension '{value}'. Use IDENTIFIER:UNIT e.g. Eastron_SDM120M:1."
+        raise argparse.ArgumentTypeError(exception_message)
+
+    return identifier, int(unit)
+
+
+def parse_args(args: List[str]) -> argparse.Namespace:
+    """Initialize argument parser options.
+
+    Parameters
+    ----------
+    args: list
+        Arguments as list.
+
+    Returns
+    -------
+    Argparse namespace
+    """
+    parser: argparse.ArgumentParser = init_argparse(description="Simulate Unipi hardware over Modbus TCP and RTU")
+    parser.add_argument("model", help="the Unipi Neuron model e.g. L203")
+    parser.add_argument(
+        "-c",
+        "--config",
+        action="store",
+        default=DEFAULT_CONFIG_DIR,
+        help=f"path to the configuration with the hardware definitions (default: {DEFAULT_CONFIG_DIR})",
+    )
+    parser.add_argument(
+        "-e",
+        "--extension",
+        action="append",
+        default=[],
+        type=parse_extension,
+        help="simulate an extension as IDENTIFIER:UNIT e.g. Eastron_SDM120M:1 (repeatable)",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="modbus TCP host (default: 127.0.0.1)")
+    parser.add_argument("--port", default=5020, type=int, help="modbus TCP port (default: 5020)")
+    parser.add_argument(
+        "--serial-link",
+        default="/tmp/unipi-sim-rtu",
+        help="symlink to the modbus RTU pty (default: /tmp/unipi-sim-rtu)",
+    )
+    parser.add_argument("--baud-rate", default=9600, type=int, help="modbus RTU baud rate (default: 9600)")
+    parser.add_argument("--sys-bus-dir", help="write a simulated EEPROM with the model to this directory")
+    parser.add_argument("--rate", default=0, type=float, help="feature toggles per second (default: 0)")
+    parser.add_argument("--script", help="path to a YAML list of feature ids to toggle instead of random features")
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+
+    return parser.parse_args(args)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Entry point for Unipi Control Simulator."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    try:
+        args: argparse.Namespace = parse_args(argv)
+        simulator: UnipiSimulator = UnipiSimulator.from_hardware_dir(
+            hardware_dir=Path(args.config) / "hardware", model=args.model, extensions=args.extension
+        )
+
+        if args.sys_bus_dir:
+            UNIPI_LOGGER.info("EEPROM written to: %s", write_eeprom(Path(args.sys_bus_dir), args.model).as_posix())
+
+        asyncio.run(
+            simulator.run(
+                host=args.host,
+                port=args.port,
+                serial_link=Path(args.serial_link),
+                baud_rate=args.baud_rate,
+                rate=args.rate,
+                script=read_script(Path(args.script)) if args.script else None,
+            )
+        )
+    except UnexpectedError as error:
+        UNIPI_LOGGER.critical(error)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        ...
@@ -2,7 +2,9 @@
 
 import argparse
 import asyncio
+import signal
 import sys
+import time
 import uuid
 from aiomqtt import Client
 from aiomqtt import MqttError
@@ -23,12 +25,14 @@ from unipi_control.config import DEFAULT_CONFIG_DIR
 from unipi_control.config import LogPrefix
 from unipi_control.config import MqttConfig
 from unipi_control.config import UNIPI_LOGGER
+from unipi_control.events import EventBus
 from unipi_control.helpers.argparse import init_argparse
 from unipi_control.helpers.exception import ConfigError
 from unipi_control.helpers.exception import UnexpectedError
 from unipi_control.helpers.text import slugify
 from unipi_control.helpers.typing import ModbusClient
 from unipi_control.integrations.covers import CoverMap
+from unipi_control.modbus import MODBUS_STATS
 from unipi_control.mqtt.discovery.binary_sensors import HassBinarySensorsMqttPlugin
 from unipi_control.mqtt.discovery.covers import HassCoversMqttPlugin
 from unipi_control.mqtt.discovery.sensors import HassSensorsMqttPlugin
@@ -36,7 +40,10 @@ from unipi_control.mqtt.discovery.switches import HassSwitchesMqttPlugin
 from unipi_control.mqtt.features import MeterFeaturesMqttPlugin
 from unipi_control.mqtt.features import NeuronFeaturesMqttPlugin
 from unipi_control.mqtt.integrations.covers import CoversMqttPlugin
+from unipi_control.mqtt.publisher import PUBLISH_STATS
+from unipi_control.mqtt.router import MqttTopicRouter
 from unipi_control.neuron import Neuron
+from unipi_control.poller import ModbusPoller
 from unipi_control.version import __version__
 
 
@@ -52,19 +59,33 @@ class UnipiControl:
         self.config: Config = config
         self.modbus_client: ModbusClient = modbus_client
         self.neuron: Neuron = Neuron(config=config, modbus_client=modbus_client)
+        self.events: EventBus = EventBus()
+        self.poller: ModbusPoller = ModbusPoller(self.neuron, self.events)
 
     async def _init_tasks(self, stack: AsyncExitStack, mqtt_client: Client) -> None:
+        connected: float = time.monotonic()
         tasks: Set[Task] = set()
         stack.push_async_callback(self._cancel_tasks, tasks)
 
-        await NeuronFeaturesMqttPlugin(self.neuron, mqtt_client).init_tasks(stack, tasks)
-        await MeterFeaturesMqttPlugin(self.neuron, mqtt_client).init_tasks(tasks)
+        router = MqttTopicRouter(mqtt_client)
 
-        covers = CoverMap(self.config, self.neuron.features)
+        await NeuronFeaturesMqttPlugin(self.neuron, mqtt_client, self.events).init_tasks(router, tasks)
+        await MeterFeaturesMqttPlugin(self.neuron, mqtt_client, self.events).init_tasks(tasks)
+
+        covers = CoverMap(self.config, self.neuron.features, self.events)
         covers.init()
 
         covers_plugin = CoversMqttPlugin(mqtt_client, covers)
-        await covers_plugin.init_tasks(stack, tasks)
+        await covers_plugin.init_tasks(router, tasks)
+
+        await router.init_tasks(stack, tasks)
+
+        UNIPI_LOGGER.info(
+            "%s Subscribed %s topics. Ready %.3f seconds after connect.",
+            LogPrefix.MQTT,
+            len(router.topic_filters),
+            time.monotonic() - connected,
+        )
 
         if self.config.homeassistant.enabled:
             await HassCoversMqttPlugin(self.neuron, mqtt_client, covers).init_tasks(tasks)
@@ -74,6 +95,11 @@ class UnipiControl:
 
         await asyncio.gather(*tasks)
 
+    @staticmethod
+    def _log_stats() -> None:
+        MODBUS_STATS.log()
+        PUBLISH_STATS.log()
+
     @staticmethod
     async def _cancel_tasks(tasks: Set[Task]) -> None:
         try:
@@ -176,15 +202,24 @@ class UnipiControl:
 
                 await asyncio.sleep(reconnect_interval)
 
-    async def run(self) -> NoReturn:
+    async def run(self) -> None:
         """Connect to Modbus and initialize Unipi Neuron hardware."""
         await self._modbus_connect()
         await self.neuron.init()
 
-        await self.mqtt_connect(
-            mqtt_config=self.config.mqtt,
-            mqtt_client_id=f"{slugify(self.config.device_info.name)}-{uuid.uuid4()}",
-            callback=self._init_tasks,
+        asyncio.get_running_loop().add_signal_handler(signal.SIGUSR1, self._log_stats)
+
+        # The poller runs for the whole process lifetime. It keeps scanning while the MQTT broker is not connected.
+        poller_tasks: Set[Task] = set()
+        self.poller.init_tasks(poller_tasks)
+
+        await asyncio.gather(
+            *poller_tasks,
+            self.mqtt_connect(
+                mqtt_config=self.config.mqtt,
+                mqtt_client_id=f"{slugify(self.config.device_info.name)}-{uuid.uuid4()}",
+                callback=self._init_tasks,
+            ),
         )
 
 